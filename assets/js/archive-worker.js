@@ -0,0 +1,270 @@
+// 아카이브 검색/정렬/필터 Web Worker
+// 피드 청크를 내려받아 논문 배열을 보관하고, 메인 스레드에는 결과 개수와 화면에 보일 구간의 논문만 보냄
+//
+// 메시지 (메인 -> 워커): { id, type, ...payload }
+//   query   { indexUrl, query: { text, sortBy, tag, bookmarks } } -> { total, archiveTotal }
+//   rows    { start, end }                                         -> { rows }  (마지막 query 결과 기준)
+//   locate  { paperId }                                            -> { position } (없으면 -1)
+//   related { paperId, feeds }                                     -> { related }
+// 응답 (워커 -> 메인): { id, result } 또는 { id, error }
+
+const DEFAULT_SORT = 'summary-date-desc';
+const collator = new Intl.Collator('ko');
+
+const feeds = new Map();   // indexUrl -> 피드 상태
+const vocabularies = new Map();
+const citationFiles = new Map();
+const current = {
+    feed: null,
+    order: null,       // 결과 위치 -> 논문 번호 (Int32Array), null이면 피드 순서 그대로
+    total: 0,
+    latestQuery: 0,
+    lastFilter: null   // 직전 검색 조건과 결과 (이어서 입력한 검색어를 좁혀 가며 거를 때 사용)
+};
+
+async function fetchJson(url, options = {}) {
+    const response = await fetch(url, options);
+    if (!response.ok) {
+        throw new Error(`${url}: ${response.status}`);
+    }
+    return response.json();
+}
+
+function stripTags(html) {
+    return (html || '').replace(/<[^>]+>/g, ' ');
+}
+
+// 검색용 소문자 텍스트와 키워드 라벨을 한 번만 계산해 둠
+// 인용 수는 청크에 없고 (청크 URL이 매일 바뀌지 않도록) 따로 내려받은 파일에서 합침
+function preparePaper(paper, archiveUrl, labels, citations) {
+    paper.keyword_ids = paper.keyword_ids || [];
+    paper.citation_count = citations[paper.paper_id] || 0;
+    paper._archiveUrl = archiveUrl;
+    paper._keywords = paper.keyword_ids.map(id => labels[id] || '');
+    paper._searchText = [paper.title, paper.title_en, paper.authors, paper.date, stripTags(paper.summary), ...paper._keywords]
+        .join(' ')
+        .toLowerCase();
+    return paper;
+}
+
+function loadVocabulary(indexUrl, index) {
+    if (!index.vocabulary) return Promise.resolve([]);
+
+    const url = new URL(index.vocabulary, indexUrl).href;
+    if (!vocabularies.has(url)) {
+        vocabularies.set(url, fetchJson(url).then(data => data.labels));
+    }
+    return vocabularies.get(url);
+}
+
+// 인용 수 파일은 고정 URL이므로 재검증 (없거나 실패하면 인용 수 없이 표시)
+function loadCitations(indexUrl, index) {
+    if (!index.citations) return Promise.resolve({});
+
+    const url = new URL(index.citations, indexUrl).href;
+    if (!citationFiles.has(url)) {
+        citationFiles.set(url, fetchJson(url, { cache: 'no-cache' }).catch(() => ({})));
+    }
+    return citationFiles.get(url);
+}
+
+// 피드 상태: 인덱스, 청크별 논문 (필요한 청크만 내려받음), 정렬 기준별 순서 캐시
+function getFeed(indexUrl) {
+    if (!feeds.has(indexUrl)) {
+        const feed = { indexUrl, index: null, labels: [], citations: {}, chunks: [], papers: null, sorted: new Map(), ready: null };
+        // 인덱스는 고정 URL이므로 재검증, 청크는 내용 해시 URL이므로 캐시 그대로 사용
+        feed.ready = fetchJson(indexUrl, { cache: 'no-cache' }).then(async index => {
+            feed.index = index;
+            [feed.labels, feed.citations] = await Promise.all([
+                loadVocabulary(indexUrl, index),
+                loadCitations(indexUrl, index)
+            ]);
+            return feed;
+        });
+        feeds.set(indexUrl, feed);
+    }
+    return feeds.get(indexUrl).ready;
+}
+
+function loadChunk(feed, chunkNumber) {
+    if (!feed.chunks[chunkNumber]) {
+        const filename = feed.index.pages[chunkNumber];
+        const url = new URL(filename, feed.indexUrl).href;
+        const archiveUrl = `/${feed.index.category.toLowerCase()}/archive.html`;
+        feed.chunks[chunkNumber] = fetchJson(url)
+            .then(data => data.papers.map(p => preparePaper(p, archiveUrl, feed.labels, feed.citations)));
+    }
+    return feed.chunks[chunkNumber];
+}
+
+async function loadAllPapers(feed) {
+    if (!feed.papers) {
+        feed.papers = Promise.all(feed.index.pages.map((_, i) => loadChunk(feed, i))).then(chunks => chunks.flat());
+    }
+    return feed.papers;
+}
+
+// 정렬 결과는 필터와 무관하므로 기준별로 한 번만 계산하고, 필터는 정렬된 순서를 그대로 따라감
+function sortedOrder(feed, papers, sortBy) {
+    if (feed.sorted.has(sortBy)) return feed.sorted.get(sortBy);
+
+    const order = Int32Array.from(papers.keys());
+    // 비교할 값은 미리 계산해 둠
+    // 날짜 문자열은 'YYYY-MM-DD[ HH:MM KST]' 형식이므로 문자열 비교로 정렬
+    const keys = field => papers.map(p => String(p[field] ?? ''));
+    const compareText = (a, b) => (a < b ? -1 : a > b ? 1 : 0);
+    let compare = null;
+    switch (sortBy) {
+        case 'date-desc': {
+            const dates = keys('date');
+            compare = (a, b) => compareText(dates[b], dates[a]);
+            break;
+        }
+        case 'date-asc': {
+            const dates = keys('date');
+            compare = (a, b) => compareText(dates[a], dates[b]);
+            break;
+        }
+        case 'author': {
+            const authors = keys('authors');
+            compare = (a, b) => collator.compare(authors[a], authors[b]);
+            break;
+        }
+        case 'title': {
+            const titles = papers.map(p => stripTags(p.title).trim());
+            compare = (a, b) => collator.compare(titles[a], titles[b]);
+            break;
+        }
+        case DEFAULT_SORT: {
+            const dates = keys('summary_date');
+            compare = (a, b) => compareText(dates[b], dates[a]);
+            break;
+        }
+    }
+    if (compare) {
+        // 같은 값이면 피드 순서 유지
+        order.sort((a, b) => compare(a, b) || a - b);
+    }
+    feed.sorted.set(sortBy, order);
+    return order;
+}
+
+function isDefaultQuery(query) {
+    return !query.text && query.tag === null && !query.bookmarks && query.sortBy === DEFAULT_SORT;
+}
+
+async function runQuery(id, indexUrl, query) {
+    current.latestQuery = id;
+    const feed = await getFeed(indexUrl);
+
+    if (isDefaultQuery(query)) {
+        // 기본 화면은 피드 순서 그대로이므로 보이는 구간의 청크만 내려받음
+        if (id !== current.latestQuery) return { stale: true };
+        Object.assign(current, { feed, order: null, total: feed.index.total });
+        return { total: feed.index.total, archiveTotal: feed.index.total };
+    }
+
+    const papers = await loadAllPapers(feed);
+    if (id !== current.latestQuery) return { stale: true };
+
+    // 부분 문자열 매칭 (여러 단어 검색 시 AND 조건)
+    const terms = query.text.split(/\s+/).filter(term => term.length > 0);
+    const bookmarks = query.bookmarks ? new Set(query.bookmarks) : null;
+    // 입력을 이어서 친 경우(같은 조건에서 검색어만 길어짐)는 이전 결과 안에서만 다시 거름
+    const filterKey = JSON.stringify([indexUrl, query.sortBy, query.tag, query.bookmarks]);
+    const previous = current.lastFilter;
+    const order = previous && previous.key === filterKey && query.text.startsWith(previous.text)
+        ? previous.matches
+        : sortedOrder(feed, papers, query.sortBy);
+    const matches = new Int32Array(order.length);
+    let count = 0;
+    for (const i of order) {
+        const paper = papers[i];
+        if (terms.length > 0 && !terms.every(term => paper._searchText.includes(term))) continue;
+        if (query.tag !== null && !paper.keyword_ids.includes(query.tag)) continue;
+        if (bookmarks && !bookmarks.has(paper.paper_id)) continue;
+        matches[count++] = i;
+    }
+
+    Object.assign(current, { feed, order: matches.subarray(0, count), total: count });
+    current.lastFilter = { key: filterKey, text: query.text, matches: current.order };
+    return { total: count, archiveTotal: feed.index.total };
+}
+
+// 화면에 보낼 논문 (검색용 텍스트는 빼서 메시지 크기를 줄임)
+function toRow(paper) {
+    const { _searchText, ...row } = paper;
+    return row;
+}
+
+async function getRows(start, end) {
+    const { feed, order } = current;
+    if (!feed) return { rows: [] };
+    end = Math.min(end, current.total);
+    if (start >= end) return { rows: [] };
+
+    if (order === null) {
+        // 청크는 가장 오래된 논문부터 나뉘므로 맨 앞(최신) 청크만 page_size보다 작을 수 있음
+        const { total, page_size: pageSize, pages } = feed.index;
+        const head = total - (pages.length - 1) * pageSize;
+        const chunkOf = position => (position < head ? 0 : 1 + Math.floor((position - head) / pageSize));
+        const first = chunkOf(start);
+        const last = chunkOf(end - 1);
+        const chunks = [];
+        for (let i = first; i <= last; i++) chunks.push(loadChunk(feed, i));
+        const papers = (await Promise.all(chunks)).flat();
+        const offset = first === 0 ? 0 : head + (first - 1) * pageSize;
+        return { rows: papers.slice(start - offset, end - offset).map(toRow) };
+    }
+
+    const papers = await feed.papers;
+    return { rows: Array.from(order.subarray(start, end), i => toRow(papers[i])) };
+}
+
+async function locate(paperId) {
+    const { feed, order } = current;
+    if (!feed) return { position: -1 };
+    const papers = await loadAllPapers(feed);
+    const index = papers.findIndex(p => p.paper_id === paperId);
+    if (index < 0 || order === null) return { position: index };
+    return { position: order.indexOf(index) };
+}
+
+// 키워드가 2개 이상 겹치는 논문 (최대 3개)
+async function findRelated(paperId, feedUrls) {
+    const allPapers = (await Promise.all(
+        feedUrls.map(url => getFeed(url).then(loadAllPapers))
+    )).flat();
+
+    const currentPaper = allPapers.find(p => p.paper_id === paperId);
+    if (!currentPaper || currentPaper.keyword_ids.length === 0) return { related: [] };
+
+    const currentIds = new Set(currentPaper.keyword_ids);
+    const related = [];
+    for (const p of allPapers) {
+        if (p.paper_id === paperId) continue;
+        const common = p.keyword_ids.filter(id => currentIds.has(id)).length;
+        if (common >= 2) {
+            related.push({ paper_id: p.paper_id, title: p.title, title_en: p.title_en, _archiveUrl: p._archiveUrl });
+            if (related.length === 3) break;
+        }
+    }
+    return { related };
+}
+
+const handlers = {
+    query: msg => runQuery(msg.id, msg.indexUrl, msg.query),
+    rows: msg => getRows(msg.start, msg.end),
+    locate: msg => locate(msg.paperId),
+    related: msg => findRelated(msg.paperId, msg.feeds)
+};
+
+self.onmessage = async function(e) {
+    const msg = e.data;
+    try {
+        const result = await handlers[msg.type](msg);
+        self.postMessage({ id: msg.id, result });
+    } catch (error) {
+        self.postMessage({ id: msg.id, error: String(error && error.message || error) });
+    }
+};
@@ -42,153 +42,44 @@ function initScrollTop() {
 }
 
 // 북마크 기능
-function initBookmarks() {
-    const bookmarks = JSON.parse(localStorage.getItem('bookmarks') || '[]');
-    
-    // 북마크 버튼 이벤트 리스너
-    document.querySelectorAll('.bookmark-btn').forEach(btn => {
-        const paperId = btn.dataset.paperId;
-        if (paperId && bookmarks.includes(paperId)) {
-            btn.classList.add('bookmarked');
-            btn.textContent = '★ 북마크됨';
-            const paperItem = btn.closest('.paper-item');
-            if (paperItem) {
-                paperItem.classList.add('bookmarked');
-            }
+function getBookmarks() {
+    return JSON.parse(localStorage.getItem('bookmarks') || '[]');
+}
+
+// 북마크 버튼/항목 상태 표시 (나중에 렌더링된 항목에도 사용)
+function applyBookmarkState(root = document) {
+    const bookmarks = getBookmarks();
+    root.querySelectorAll('.bookmark-btn').forEach(btn => {
+        const isBookmarked = bookmarks.includes(btn.dataset.paperId);
+        btn.classList.toggle('bookmarked', isBookmarked);
+        btn.textContent = isBookmarked ? '★ 북마크됨' : '☆ 북마크';
+        const paperItem = btn.closest('.paper-item');
+        if (paperItem) {
+            paperItem.classList.toggle('bookmarked', isBookmarked);
         }
-        
-        btn.addEventListener('click', function() {
-            const paperId = this.dataset.paperId;
-            if (!paperId) return;
-            
-            let bookmarks = JSON.parse(localStorage.getItem('bookmarks') || '[]');
-            const index = bookmarks.indexOf(paperId);
-            
-            if (index > -1) {
-                bookmarks.splice(index, 1);
-                this.classList.remove('bookmarked');
-                this.textContent = '☆ 북마크';
-                const paperItem = this.closest('.paper-item');
-                if (paperItem) {
-                    paperItem.classList.remove('bookmarked');
-                }
-            } else {
-                bookmarks.push(paperId);
-                this.classList.add('bookmarked');
-                this.textContent = '★ 북마크됨';
-                const paperItem = this.closest('.paper-item');
-                if (paperItem) {
-                    paperItem.classList.add('bookmarked');
-                }
-            }
-            
-            localStorage.setItem('bookmarks', JSON.stringify(bookmarks));
-        });
     });
 }
 
-// 검색 기능 (하이라이팅 포함)
-function initSearch() {
-    const searchBox = document.getElementById('searchBox');
-    const searchBtn = document.getElementById('searchBtn');
-    if (!searchBox) return;
+function initBookmarks() {
+    applyBookmarkState();
     
-    // 검색 실행 함수
-    function performSearch() {
-        const query = searchBox.value.toLowerCase().trim();
+    // 이벤트 위임: 피드에서 나중에 렌더링되는 버튼도 처리
+    document.addEventListener('click', function(e) {
+        const btn = e.target.closest('.bookmark-btn');
+        if (!btn) return;
         
-        // 현재 DOM의 모든 항목을 다시 수집 (정렬이나 필터로 변경되었을 수 있음)
-        const allItems = Array.from(document.querySelectorAll('.paper-item'));
-        
-        allItems.forEach(item => {
-            const titleEl = item.querySelector('.paper-title');
-            const metaEl = item.querySelector('.paper-meta');
-            const summaryEl = item.querySelector('.paper-summary-content');
-            
-            // 하이라이팅 제거 후 원본 텍스트로 복원
-            if (titleEl && titleEl.dataset.originalText) {
-                titleEl.innerHTML = titleEl.dataset.originalText;
-                delete titleEl.dataset.originalText;
-            }
-            if (metaEl && metaEl.dataset.originalText) {
-                metaEl.innerHTML = metaEl.dataset.originalText;
-                delete metaEl.dataset.originalText;
-            }
-            if (summaryEl && summaryEl.dataset.originalText) {
-                summaryEl.innerHTML = summaryEl.dataset.originalText;
-                delete summaryEl.dataset.originalText;
-            }
-            
-            const title = titleEl?.textContent.toLowerCase() || '';
-            const authors = metaEl?.textContent.toLowerCase() || '';
-            const summary = summaryEl?.textContent.toLowerCase() || '';
-            
-            // 검색어가 없으면 모두 표시
-            if (!query) {
-                item.setAttribute('data-search-match', 'true');
-                removeHighlighting(item);
-                return;
-            }
-            
-            // 부분 문자열 매칭 (여러 단어 검색 시 AND 조건)
-            const searchTerms = query.split(/\s+/).filter(term => term.length > 0);
-            const fullText = title + ' ' + authors + ' ' + summary;
-            
-            // 모든 검색어가 부분 문자열로 포함되어야 매칭 (AND 조건)
-            const matchesAll = searchTerms.every(term => {
-                return fullText.includes(term.toLowerCase());
-            });
-            
-            if (matchesAll) {
-                // 검색 결과에 포함
-                item.setAttribute('data-search-match', 'true');
-                
-                // 키워드 하이라이팅 적용
-                highlightKeywords(item, query);
-            } else {
-                item.setAttribute('data-search-match', 'false');
-                removeHighlighting(item);
-            }
-        });
+        const paperId = btn.dataset.paperId;
+        if (!paperId) return;
         
-        // 페이지네이션 상태 업데이트
-        if (window.location.pathname.includes('archive')) {
-            // 아카이브 페이지: 모든 항목의 display 명시적으로 설정
-            allItems.forEach(item => {
-                const searchMatch = item.getAttribute('data-search-match');
-                // 일단 모두 숨기고, 페이지네이션에서 표시할 것만 다시 보여줌
-                item.style.display = 'none';
-            });
-            
-            paginationState.allItems = allItems;
-            paginationState.currentPage = 1;
-            renderPagination();
+        const bookmarks = getBookmarks();
+        const index = bookmarks.indexOf(paperId);
+        if (index > -1) {
+            bookmarks.splice(index, 1);
         } else {
-            // 메인 페이지에서는 단순 필터링
-            allItems.forEach(item => {
-                const searchMatch = item.getAttribute('data-search-match');
-                if (searchMatch === 'false') {
-                    item.style.display = 'none';
-                } else {
-                    item.style.display = '';
-                }
-            });
-        }
-        
-        updateResultCount();
-    }
-    
-    // 검색 버튼 클릭 이벤트
-    if (searchBtn) {
-        searchBtn.addEventListener('click', performSearch);
-    }
-    
-    // Enter 키 입력 시 검색
-    searchBox.addEventListener('keypress', function(e) {
-        if (e.key === 'Enter') {
-            e.preventDefault();
-            performSearch();
+            bookmarks.push(paperId);
         }
+        localStorage.setItem('bookmarks', JSON.stringify(bookmarks));
+        applyBookmarkState(btn.closest('.paper-item') || document);
     });
 }
 
@@ -239,42 +130,12 @@ function highlightText(text, query) {
     });
 }
 
-// 하이라이팅 제거
-function removeHighlighting(item) {
-    const titleEl = item.querySelector('.paper-title');
-    const metaEl = item.querySelector('.paper-meta');
-    const summaryEl = item.querySelector('.paper-summary-content');
-    
-    if (titleEl && titleEl.dataset.originalText) {
-        titleEl.innerHTML = titleEl.dataset.originalText;
-    }
-    if (metaEl && metaEl.dataset.originalText) {
-        metaEl.innerHTML = metaEl.dataset.originalText;
-    }
-    if (summaryEl && summaryEl.dataset.originalText) {
-        summaryEl.innerHTML = summaryEl.dataset.originalText;
-    }
-}
-
 // 정규식 특수문자 이스케이프
 function escapeRegExp(string) {
     return string.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
 }
 
-// 정렬 기능
-function initSort() {
-    const sortSelect = document.getElementById('sortSelect');
-    if (!sortSelect) return;
-    
-    sortSelect.addEventListener('change', function() {
-        // 정렬 후 페이지네이션 재렌더링
-        paginationState.currentPage = 1;
-        renderPagination();
-        updateResultCount();
-    });
-}
-
-// 결과 카운트 업데이트
+// 결과 카운트 업데이트 (오늘의 논문 페이지)
 function updateResultCount() {
     const visibleItems = Array.from(document.querySelectorAll('.paper-item')).filter(
         item => item.style.display !== 'none'
@@ -287,276 +148,455 @@ function updateResultCount() {
     }
 }
 
-// 페이지네이션 (전역 변수로 관리)
-let paginationState = {
-    itemsPerPage: 10,
-    currentPage: 1,
-    allItems: [],
-    visibleItems: [],
-    container: null
+// ===== 아카이브 (Web Worker 검색 + 가상 스크롤) =====
+// 피드 청크 로딩과 검색/정렬/필터는 archive-worker.js에서 처리하고,
+// 메인 스레드는 결과 개수와 화면에 보이는 구간의 논문만 받아 그 구간만 렌더링함
+const ARCHIVE_WORKER_URL = document.currentScript
+    ? new URL('archive-worker.js', document.currentScript.src).href
+    : '/assets/js/archive-worker.js';
+const ROW_BLOCK = 20;        // 워커에 한 번에 요청하는 논문 수
+const OVERSCAN = 4;          // 화면 위아래로 미리 렌더링할 논문 수
+const SEARCH_DELAY_MS = 150; // 입력 중 검색 지연
+
+const archiveWorker = {
+    worker: null,
+    nextId: 0,
+    pending: new Map()
 };
-window.paginationState = paginationState; // 전역 접근 가능하도록
 
-function initPagination(itemsPerPage = 10) {
-    paginationState.itemsPerPage = itemsPerPage;
-    paginationState.allItems = Array.from(document.querySelectorAll('.paper-item'));
-    updateVisibleItems();
-    renderPagination();
+// 워커에 요청을 보내고 응답을 Promise로 받음
+function callArchiveWorker(type, payload = {}) {
+    if (!archiveWorker.worker) {
+        archiveWorker.worker = new Worker(ARCHIVE_WORKER_URL);
+        archiveWorker.worker.onmessage = function(e) {
+            const { id, result, error } = e.data;
+            const pending = archiveWorker.pending.get(id);
+            if (!pending) return;
+            archiveWorker.pending.delete(id);
+            if (error) {
+                pending.reject(new Error(error));
+            } else {
+                pending.resolve(result);
+            }
+        };
+    }
+    const id = ++archiveWorker.nextId;
+    return new Promise((resolve, reject) => {
+        archiveWorker.pending.set(id, { resolve, reject });
+        archiveWorker.worker.postMessage({ id, type, ...payload });
+    });
 }
 
-function updateVisibleItems() {
-    // 검색 및 필터 적용된 항목만 가져오기
-    // allItems가 비어있거나 null이면 DOM에서 다시 수집
-    if (!paginationState.allItems || paginationState.allItems.length === 0) {
-        paginationState.allItems = Array.from(document.querySelectorAll('.paper-item'));
-    }
-    
-    // 검색어 확인
+function absoluteUrl(url) {
+    return new URL(url, location.href).href;
+}
+
+function escapeHtml(text) {
+    return String(text ?? '')
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;');
+}
+
+// 논문 카드 HTML (Liquid 템플릿과 같은 구조)
+function renderPaperItem(paper) {
+    const paperId = escapeHtml(paper.paper_id);
+    const titleEn = paper.title_en ? `<span class="title-en">(${paper.title_en})</span>` : '';
+    const badge = paper.category ? `<span class="paper-category-badge">${escapeHtml(paper.category)}</span>` : '';
+    const keywords = paper.keyword_ids.length > 0
+        ? `<div class="paper-keywords">${paper.keyword_ids.map((id, i) => `<span class="tag" data-tag-id="${id}">${escapeHtml(paper._keywords[i])}</span>`).join('')}</div>`
+        : '';
+    // 인용 수는 파이프라인에서 일괄 갱신되어 피드의 citations.json으로 내보내짐 (워커가 합침)
+    const citation = paper.citation_count > 0 ? `<span class="citation-count">인용 ${paper.citation_count}회</span>` : '';
+    
+    return `
+        <div class="paper-item" id="${paperId}" data-paper-id="${paperId}" data-summary-date="${escapeHtml(paper.summary_date)}" data-published-date="${escapeHtml(paper.date)}">
+            <div class="paper-header">
+                <div class="paper-title">
+                    ${paper.title || ''}
+                    ${titleEn}
+                </div>
+                ${badge}
+            </div>
+            <div class="paper-meta">
+                <span><strong>저자:</strong> ${escapeHtml(paper.authors)}</span>
+                <span><strong>날짜:</strong> ${escapeHtml(paper.date)}</span>
+                ${citation}
+            </div>
+            <h4 class="summary-title">Gemini AI 요약 <span class="summary-timestamp">(생성: ${escapeHtml(paper.summary_date)})</span></h4>
+            <div class="paper-summary-content">${paper.summary || ''}</div>
+            ${keywords}
+            <div class="paper-actions">
+                <a href="${escapeHtml(paper.link)}" class="paper-link" target="_blank">논문 원본 보기 →</a>
+                <button class="bookmark-btn" data-paper-id="${paperId}">☆ 북마크</button>
+                <button class="details-btn" data-paper-id="${paperId}" aria-expanded="false">자세히 보기 ▼</button>
+            </div>
+            <div class="related-papers-container" id="related-papers-for-${paperId}"></div>
+        </div>`;
+}
+
+// 아카이브 화면 상태
+// 결과 위치별 높이는 측정 전까지 추정값을 쓰고, 렌더링된 항목은 ResizeObserver로 실제 높이를 기록함
+const archiveState = {
+    list: null,
+    indexUrl: null,
+    activeTag: null,
+    query: null,
+    queryToken: 0,
+    total: 0,
+    estimate: 400,                 // 측정 전 항목 높이 (px)
+    gap: 0,                        // 항목 아래 여백 (margin-bottom)
+    heights: new Float64Array(0),
+    offsets: new Float64Array(1),  // 결과 위치 -> 목록 위쪽에서의 거리 (offsets[total]은 전체 높이)
+    rows: new Map(),               // 결과 위치 -> 논문
+    rowRequests: new Map(),        // 요청 중인 블록 시작 위치 -> Promise
+    elements: new Map(),           // 결과 위치 -> 렌더링된 요소
+    range: [0, 0],
+    topSpacer: null,
+    bottomSpacer: null,
+    observer: null,
+    frame: 0,
+    pendingAnchor: null            // 해시로 이동할 결과 위치
+};
+
+function getArchiveQuery() {
     const searchBox = document.getElementById('searchBox');
-    const hasSearchQuery = searchBox && searchBox.value.trim().length > 0;
-    
-    paginationState.visibleItems = paginationState.allItems.filter(item => {
-        // 검색 필터 확인
-        const searchMatch = item.getAttribute('data-search-match');
-        if (hasSearchQuery) {
-            // 검색어가 있으면 'true'인 것만 표시
-            if (searchMatch !== 'true') return false;
+    const sortSelect = document.getElementById('sortSelect');
+    const filterSelect = document.getElementById('filterSelect');
+    const bookmarkedOnly = filterSelect ? filterSelect.value === 'bookmarked' : false;
+    return {
+        text: searchBox ? searchBox.value.toLowerCase().trim() : '',
+        sortBy: sortSelect ? sortSelect.value : 'summary-date-desc',
+        bookmarks: bookmarkedOnly ? getBookmarks() : null,
+        tag: archiveState.activeTag
+    };
+}
+
+function recomputeOffsets() {
+    const { heights, offsets } = archiveState;
+    for (let i = 0; i < heights.length; i++) {
+        offsets[i + 1] = offsets[i] + heights[i];
+    }
+}
+
+// 목록 위쪽에서 y만큼 떨어진 지점에 있는 결과 위치 (이진 탐색)
+function findPosition(y) {
+    const { offsets, total } = archiveState;
+    let low = 0;
+    let high = total - 1;
+    while (low < high) {
+        const mid = (low + high + 1) >> 1;
+        if (offsets[mid] <= y) {
+            low = mid;
         } else {
-            // 검색어가 없으면 'false'인 것만 제외
-            if (searchMatch === 'false') return false;
-        }
-        
-        // 태그 필터 확인 (기본값은 true)
-        const tagMatch = item.getAttribute('data-tag-match');
-        if (tagMatch === 'false') return false;
-        
-        // 북마크 필터 확인
-        const filterSelect = document.getElementById('filterSelect');
-        if (filterSelect && filterSelect.value === 'bookmarked') {
-            const bookmarks = JSON.parse(localStorage.getItem('bookmarks') || '[]');
-            const paperId = item.dataset.paperId;
-            if (!bookmarks.includes(paperId)) return false;
+            high = mid - 1;
         }
-        
-        return true;
-    });
+    }
+    return Math.max(0, low);
 }
 
-function getSortedItems() {
-    // 정렬 적용
-    const sortSelect = document.getElementById('sortSelect');
-    if (!sortSelect) return paginationState.visibleItems;
-    
-    const sorted = [...paginationState.visibleItems];
-    const sortBy = sortSelect.value;
-    
-    sorted.sort((a, b) => {
-        switch(sortBy) {
-            case 'summary-date-desc':
-                const summaryDateA = new Date(a.dataset.summaryDate);
-                const summaryDateB = new Date(b.dataset.summaryDate);
-                return summaryDateB - summaryDateA;
-            case 'date-desc':
-                const publishedDateA = new Date(a.dataset.publishedDate);
-                const publishedDateB = new Date(b.dataset.publishedDate);
-                return publishedDateB - publishedDateA;
-            case 'date-asc':
-                const publishedDateA2 = new Date(a.dataset.publishedDate);
-                const publishedDateB2 = new Date(b.dataset.publishedDate);
-                return publishedDateA2 - publishedDateB2;
-            case 'author':
-                const authorA = a.querySelector('.paper-meta span:first-child')?.textContent.split(':')[1]?.trim() || '';
-                const authorB = b.querySelector('.paper-meta span:first-child')?.textContent.split(':')[1]?.trim() || '';
-                return authorA.localeCompare(authorB, 'ko');
-            case 'title':
-                const titleA = a.querySelector('.paper-title')?.textContent || '';
-                const titleB = b.querySelector('.paper-title')?.textContent || '';
-                return titleA.localeCompare(titleB, 'ko');
-            default:
-                return 0;
-        }
+function resetVirtualList(total) {
+    const state = archiveState;
+    state.observer.disconnect();
+    state.total = total;
+    state.heights = new Float64Array(total).fill(state.estimate);
+    state.offsets = new Float64Array(total + 1);
+    recomputeOffsets();
+    state.rows.clear();
+    state.rowRequests.clear();
+    state.elements.clear();
+    state.range = [0, 0];
+    state.topSpacer.style.height = '0px';
+    state.bottomSpacer.style.height = `${state.offsets[total]}px`;
+    state.list.replaceChildren(state.topSpacer, state.bottomSpacer);
+}
+
+function updateSpacers() {
+    const { offsets, range, total, topSpacer, bottomSpacer } = archiveState;
+    topSpacer.style.height = `${offsets[range[0]]}px`;
+    bottomSpacer.style.height = `${offsets[total] - offsets[range[1]]}px`;
+}
+
+function scheduleWindowUpdate() {
+    if (archiveState.frame) return;
+    archiveState.frame = requestAnimationFrame(() => {
+        archiveState.frame = 0;
+        updateWindow();
     });
-    
-    return sorted;
 }
 
-function renderPagination() {
-    updateVisibleItems();
-    const sortedItems = getSortedItems();
-    const totalItems = sortedItems.length;
-    const totalPages = Math.ceil(totalItems / paginationState.itemsPerPage);
-    
-    // 기존 페이지네이션 제거
-    const existingPagination = document.getElementById('pagination');
-    if (existingPagination) {
-        existingPagination.remove();
+// 화면에 보이는 구간의 논문이 모두 도착했으면 렌더링하고, 없는 블록은 워커에 요청
+function updateWindow() {
+    const state = archiveState;
+    if (!state.list || state.total === 0) return;
+    
+    const viewTop = -state.list.getBoundingClientRect().top;
+    const start = Math.max(0, findPosition(viewTop) - OVERSCAN);
+    const end = Math.min(state.total, findPosition(viewTop + window.innerHeight) + 1 + OVERSCAN);
+    
+    let missing = false;
+    for (let block = Math.floor(start / ROW_BLOCK) * ROW_BLOCK; block < end; block += ROW_BLOCK) {
+        if (state.rows.has(block)) continue;
+        missing = true;
+        requestRows(block);
     }
+    if (missing) return;
     
-    // 먼저 모든 항목을 숨김 (필터링되지 않은 항목도 포함)
-    if (paginationState.allItems && paginationState.allItems.length > 0) {
-        paginationState.allItems.forEach(item => {
-            item.style.display = 'none';
-        });
+    if (start !== state.range[0] || end !== state.range[1]) {
+        renderWindow(start, end);
     }
-    
-    if (totalPages <= 1) {
-        // 페이지네이션이 필요 없으면 필터링된 모든 항목 표시
-        sortedItems.forEach(item => {
-            item.style.display = '';
+}
+
+function requestRows(block) {
+    const state = archiveState;
+    if (state.rowRequests.has(block)) return;
+    
+    const token = state.queryToken;
+    const request = callArchiveWorker('rows', { start: block, end: block + ROW_BLOCK }).then(({ rows }) => {
+        if (token !== state.queryToken) return;
+        rows.forEach((paper, i) => state.rows.set(block + i, paper));
+        scheduleWindowUpdate();
+    }).catch(error => {
+        console.error('Archive rows could not be loaded', error);
+    }).finally(() => {
+        if (token === state.queryToken) state.rowRequests.delete(block);
+    });
+    state.rowRequests.set(block, request);
+}
+
+function createPaperElement(position) {
+    const state = archiveState;
+    const template = document.createElement('template');
+    template.innerHTML = renderPaperItem(state.rows.get(position)).trim();
+    const item = template.content.firstElementChild;
+    item.dataset.position = position;
+    
+    applyBookmarkState(item);
+    if (state.query.text) {
+        highlightKeywords(item, state.query.text);
+    }
+    if (state.query.tag !== null) {
+        item.querySelectorAll('.tag').forEach(tag => {
+            tag.classList.toggle('active', Number(tag.dataset.tagId) === state.query.tag);
         });
-        updateResultCount();
-        return;
     }
-    
-    // 현재 페이지 범위 계산
-    const start = (paginationState.currentPage - 1) * paginationState.itemsPerPage;
-    const end = start + paginationState.itemsPerPage;
-    
-    // 현재 페이지 항목만 표시
-    for (let i = start; i < end && i < sortedItems.length; i++) {
-        sortedItems[i].style.display = '';
-        // DOM에서 재배치 (정렬된 순서로)
-        sortedItems[i].parentElement.appendChild(sortedItems[i]);
+    return item;
+}
+
+// 이전 구간과 겹치는 요소는 그대로 두고 벗어난 요소만 지우고 새로 들어온 요소만 만듦
+function renderWindow(start, end) {
+    const state = archiveState;
+    for (const [position, item] of state.elements) {
+        if (position < start || position >= end) {
+            state.observer.unobserve(item);
+            item.remove();
+            state.elements.delete(position);
+        }
     }
     
-    // 결과 카운트 업데이트
-    updateResultCount();
-    
-    // 페이지네이션 버튼 생성
-    const paginationContainer = document.createElement('div');
-    paginationContainer.className = 'pagination';
-    paginationContainer.id = 'pagination';
-    
-    // 이전 버튼
-    const prevBtn = document.createElement('button');
-    prevBtn.textContent = '이전';
-    prevBtn.disabled = paginationState.currentPage === 1;
-    prevBtn.addEventListener('click', () => {
-        if (paginationState.currentPage > 1) {
-            paginationState.currentPage--;
-            renderPagination();
-        }
-    });
-    paginationContainer.appendChild(prevBtn);
-    
-    // 페이지 번호 버튼
-    for (let i = 1; i <= totalPages; i++) {
-        if (i === 1 || i === totalPages || (i >= paginationState.currentPage - 2 && i <= paginationState.currentPage + 2)) {
-            const pageBtn = document.createElement('button');
-            pageBtn.textContent = i;
-            pageBtn.className = i === paginationState.currentPage ? 'active' : '';
-            pageBtn.addEventListener('click', () => {
-                paginationState.currentPage = i;
-                renderPagination();
-            });
-            paginationContainer.appendChild(pageBtn);
-        } else if (i === paginationState.currentPage - 3 || i === paginationState.currentPage + 3) {
-            const ellipsis = document.createElement('span');
-            ellipsis.textContent = '...';
-            ellipsis.style.padding = '8px';
-            paginationContainer.appendChild(ellipsis);
+    let previous = state.topSpacer;
+    for (let position = start; position < end; position++) {
+        let item = state.elements.get(position);
+        if (!item) {
+            item = createPaperElement(position);
+            previous.after(item);
+            state.elements.set(position, item);
+            state.observer.observe(item);
         }
+        previous = item;
     }
     
-    // 다음 버튼
-    const nextBtn = document.createElement('button');
-    nextBtn.textContent = '다음';
-    nextBtn.disabled = paginationState.currentPage === totalPages;
-    nextBtn.addEventListener('click', () => {
-        if (paginationState.currentPage < totalPages) {
-            paginationState.currentPage++;
-            renderPagination();
+    // 화면에서 먼 블록의 논문은 버리고, 다시 필요할 때 워커에서 받음
+    for (const position of state.rows.keys()) {
+        const block = position - position % ROW_BLOCK;
+        if (block + ROW_BLOCK < start - ROW_BLOCK * 10 || block > end + ROW_BLOCK * 10) state.rows.delete(position);
+    }
+    
+    state.range = [start, end];
+    updateSpacers();
+}
+
+// 렌더링된 항목의 실제 높이를 기록하고 위치를 다시 계산
+function onItemsResized(entries) {
+    const state = archiveState;
+    let changed = false;
+    for (const entry of entries) {
+        const position = Number(entry.target.dataset.position);
+        if (!state.elements.has(position)) continue;
+        const size = entry.borderBoxSize && entry.borderBoxSize[0];
+        const height = (size ? size.blockSize : entry.target.offsetHeight) + state.gap;
+        if (Math.abs(height - state.heights[position]) > 0.5) {
+            state.heights[position] = height;
+            changed = true;
         }
-    });
-    paginationContainer.appendChild(nextBtn);
+    }
+    if (changed) {
+        recomputeOffsets();
+        updateSpacers();
+        scheduleWindowUpdate();
+    }
     
-    // 페이지네이션 컨테이너 추가
-    const container = document.querySelector('.container');
-    if (container) {
-        container.appendChild(paginationContainer);
+    const anchor = state.pendingAnchor;
+    if (anchor !== null && state.elements.has(anchor)) {
+        state.pendingAnchor = null;
+        state.elements.get(anchor).scrollIntoView({ block: 'start' });
     }
 }
 
-// 인용 정보 로드
-async function loadCitationInfo(paperId) {
+async function runArchiveQuery() {
+    const state = archiveState;
+    const token = ++state.queryToken;
+    const query = getArchiveQuery();
+    state.list.classList.add('loading');
+    
+    let result;
     try {
-        const response = await fetch(`https://api.semanticscholar.org/graph/v1/paper/arXiv:${paperId}?fields=citationCount`);
-        if (response.ok) {
-            const data = await response.json();
-            return data.citationCount || 0;
-        }
+        result = await callArchiveWorker('query', { indexUrl: state.indexUrl, query });
     } catch (error) {
-        console.log('Citation info not available');
+        console.error('Archive query failed', error);
+        if (token === state.queryToken) {
+            state.list.classList.remove('loading');
+            state.list.innerHTML = '<div class="empty-message">논문 목록을 불러올 수 없습니다.</div>';
+        }
+        return;
     }
-    return null;
+    
+    // 더 최근에 시작된 검색이 있으면 이 결과는 버림
+    if (token !== state.queryToken || result.stale) return;
+    state.list.classList.remove('loading');
+    state.query = query;
+    resetVirtualList(result.total);
+    
+    if (result.total === 0) {
+        state.list.insertAdjacentHTML('beforeend',
+            `<div class="empty-message">${result.archiveTotal === 0 ? '아직 아카이브된 논문이 없습니다.' : '조건에 맞는 논문이 없습니다.'}</div>`);
+    }
+    
+    const countElement = document.getElementById('resultCount');
+    if (countElement) {
+        countElement.textContent = `검색 결과: ${result.total} / ${result.archiveTotal}`;
+    }
+    updateWindow();
 }
 
-// 태그 필터 기능
-function initTagFilter() {
-    // 태그 클릭 이벤트 리스너
-    document.querySelectorAll('.tag').forEach(tag => {
-        tag.addEventListener('click', function(e) {
-            e.stopPropagation();
-            
-            const tagText = this.textContent.trim();
-            
-            // 토글: 이미 활성화되어 있으면 비활성화, 아니면 활성화
-            const isActive = this.classList.contains('active');
-            
-            if (isActive) {
-                // 모든 태그 비활성화
-                document.querySelectorAll('.tag').forEach(t => t.classList.remove('active'));
-                
-                // 모든 논문 표시
-                paginationState.allItems.forEach(item => {
-                    item.setAttribute('data-tag-match', 'true');
-                });
-            } else {
-                // 모든 태그에서 active 클래스 제거
-                document.querySelectorAll('.tag').forEach(t => t.classList.remove('active'));
-                
-                // 클릭된 태그에 active 추가
-                this.classList.add('active');
-                
-                // 현재 활성화된 태그 필터 확인
-                const activeTags = Array.from(document.querySelectorAll('.tag.active')).map(t => t.textContent.trim());
-                
-                // 논문 필터링
-                paginationState.allItems.forEach(item => {
-                    const tags = Array.from(item.querySelectorAll('.tag')).map(t => t.textContent.trim());
-                    const hasActiveTag = activeTags.length === 0 || activeTags.some(activeTag => tags.includes(activeTag));
-                    
-                    if (hasActiveTag) {
-                        item.setAttribute('data-tag-match', 'true');
-                    } else {
-                        item.setAttribute('data-tag-match', 'false');
-                    }
-                });
-            }
-            
-            // 페이지네이션 재렌더링
-            if (window.location.pathname.includes('archive')) {
-                paginationState.currentPage = 1;
-                renderPagination();
-            } else {
-                // 메인 페이지에서는 단순 필터링
-                paginationState.allItems.forEach(item => {
-                    const tagMatch = item.getAttribute('data-tag-match');
-                    if (tagMatch === 'false') {
-                        item.style.display = 'none';
-                    } else {
-                        item.style.display = '';
-                    }
-                });
+// URL 해시(#paper_id)로 지정된 논문 위치로 스크롤
+async function showArchivePaper(paperId) {
+    if (!paperId) return;
+    
+    const searchBox = document.getElementById('searchBox');
+    const sortSelect = document.getElementById('sortSelect');
+    const filterSelect = document.getElementById('filterSelect');
+    if (searchBox) searchBox.value = '';
+    if (sortSelect) sortSelect.value = 'summary-date-desc';
+    if (filterSelect) filterSelect.value = 'all';
+    archiveState.activeTag = null;
+    
+    await runArchiveQuery();
+    const { position } = await callArchiveWorker('locate', { paperId });
+    if (position < 0) return;
+    
+    // 추정 위치로 먼저 이동하고, 항목이 렌더링되어 높이가 측정되면 정확한 위치로 다시 이동
+    archiveState.pendingAnchor = position;
+    const listTop = archiveState.list.getBoundingClientRect().top + window.scrollY;
+    window.scrollTo(0, listTop + archiveState.offsets[position]);
+    scheduleWindowUpdate();
+}
+
+async function initFeedArchive(list) {
+    const state = archiveState;
+    state.list = list;
+    state.indexUrl = absoluteUrl(list.dataset.feed);
+    state.topSpacer = document.createElement('div');
+    state.bottomSpacer = document.createElement('div');
+    state.topSpacer.className = state.bottomSpacer.className = 'virtual-spacer';
+    state.observer = new ResizeObserver(onItemsResized);
+    
+    // 항목 사이 여백은 높이에 포함해 계산
+    const probe = document.createElement('div');
+    probe.className = 'paper-item';
+    probe.style.visibility = 'hidden';
+    list.appendChild(probe);
+    state.gap = parseFloat(getComputedStyle(probe).marginBottom) || 0;
+    probe.remove();
+    
+    let searchTimer = 0;
+    const resetAndSearch = () => {
+        clearTimeout(searchTimer);
+        window.scrollTo(0, Math.min(window.scrollY, list.getBoundingClientRect().top + window.scrollY));
+        runArchiveQuery();
+    };
+    
+    const searchBox = document.getElementById('searchBox');
+    const searchBtn = document.getElementById('searchBtn');
+    if (searchBox) {
+        searchBox.value = '';
+        // 입력 중에는 잠시 멈췄을 때 검색, Enter 키는 바로 검색
+        searchBox.addEventListener('input', function() {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(resetAndSearch, SEARCH_DELAY_MS);
+        });
+        searchBox.addEventListener('keypress', function(e) {
+            if (e.key === 'Enter') {
+                e.preventDefault();
+                resetAndSearch();
             }
-            
-            updateResultCount();
         });
+    }
+    if (searchBtn) {
+        searchBtn.addEventListener('click', resetAndSearch);
+    }
+    ['sortSelect', 'filterSelect'].forEach(id => {
+        const select = document.getElementById(id);
+        if (select) select.addEventListener('change', resetAndSearch);
     });
     
-    // 태그 필터 초기화
-    document.querySelectorAll('.paper-item').forEach(item => {
-        item.setAttribute('data-tag-match', 'true');
+    // 태그 클릭: 같은 태그를 다시 누르면 필터 해제
+    list.addEventListener('click', function(e) {
+        const tag = e.target.closest('.tag');
+        if (!tag) return;
+        e.stopPropagation();
+        const tagId = Number(tag.dataset.tagId);
+        state.activeTag = state.activeTag === tagId ? null : tagId;
+        resetAndSearch();
+    });
+    
+    window.addEventListener('scroll', scheduleWindowUpdate, { passive: true });
+    window.addEventListener('resize', scheduleWindowUpdate);
+    window.addEventListener('hashchange', () => showArchivePaper(decodeURIComponent(location.hash.slice(1))));
+    
+    if (location.hash) {
+        await showArchivePaper(decodeURIComponent(location.hash.slice(1)));
+    } else {
+        await runArchiveQuery();
+    }
+}
+
+// 태그 필터 기능 (오늘의 논문 페이지)
+function initTagFilter() {
+    // 논문별 키워드 ID 집합을 한 번만 계산
+    const items = Array.from(document.querySelectorAll('.paper-item')).map(item => ({
+        item,
+        tagIds: new Set(Array.from(item.querySelectorAll('.tag')).map(t => Number(t.dataset.tagId)))
+    }));
+    let activeTagId = null;
+    
+    // 태그 클릭 (이벤트 위임): 같은 태그를 다시 누르면 필터 해제
+    document.addEventListener('click', function(e) {
+        const tag = e.target.closest('.tag[data-tag-id]');
+        if (!tag) return;
+        
+        const tagId = Number(tag.dataset.tagId);
+        activeTagId = activeTagId === tagId ? null : tagId;
+        
+        document.querySelectorAll('.tag').forEach(t => {
+            t.classList.toggle('active', Number(t.dataset.tagId) === activeTagId);
+        });
+        items.forEach(({ item, tagIds }) => {
+            item.style.display = activeTagId === null || tagIds.has(activeTagId) ? '' : 'none';
+        });
+        
+        updateResultCount();
     });
 }
 
@@ -586,16 +626,6 @@ function initTabs() {
             this.classList.add('active');
             this.setAttribute('aria-selected', 'true');
             panel.style.display = '';
-            
-            // 검색/정렬 재초기화
-            setTimeout(() => {
-                initSearch();
-                initSort();
-                initTagFilter();
-                if (window.location.pathname.includes('archive')) {
-                    initPagination();
-                }
-            }, 100);
         });
     });
 }
@@ -620,52 +650,49 @@ function initInfoBox() {
     });
 }
 
-// 관련 논문 추천 기능
-function initRelatedPapers() {
-    document.querySelectorAll('.details-btn').forEach(button => {
-        button.addEventListener('click', function() {
-            const paperId = this.dataset.paperId;
-            const container = document.getElementById(`related-papers-for-${paperId}`);
-            const currentPaper = allPapers.find(p => p.paper_id === paperId);
-
-            if (!container || !currentPaper || !currentPaper.keywords) {
-                return;
-            }
 
-            // 버튼 토글 로직
-            const isExpanded = this.getAttribute('aria-expanded') === 'true';
-            if (isExpanded) {
-                container.innerHTML = ''; // 내용 숨기기
-                this.setAttribute('aria-expanded', 'false');
-                this.textContent = '자세히 보기 ▼';
-                return;
-            }
-            
-            this.setAttribute('aria-expanded', 'true');
-            this.textContent = '숨기기 ▲';
-            container.innerHTML = '<div class="loader">AI가 관련 논문을 찾는 중...</div>';
-
-            setTimeout(() => {
-                const related = allPapers.filter(p => {
-                    if (p.paper_id === paperId || !p.keywords) return false;
-                    const commonKeywords = p.keywords.filter(kw => currentPaper.keywords.includes(kw));
-                    return commonKeywords.length >= 2;
-                }).slice(0, 3); // 최대 3개 추천
-
-                if (related.length > 0) {
-                    let html = '<h4>AI 추천 관련 논문:</h4><ul>';
-                    related.forEach(p => {
-                        // 해당 논문의 아카이브 페이지 URL 생성
-                        const archiveUrl = p.link.includes('anode') ? '/anode/archive.html' : '/cathode/archive.html';
-                        html += `<li><a href="${archiveUrl}#${p.paper_id}">${p.title}</a> <span class="title-en-small">(${p.title_en})</span></li>`;
-                    });
-                    html += '</ul>';
-                    container.innerHTML = html;
-                } else {
-                    container.innerHTML = '<p class="no-related">관련 논문을 찾을 수 없습니다.</p>';
-                }
-            }, 200); // 약간의 딜레이를 주어 로딩 애니메이션을 보여줌
-        });
+// 관련 논문 추천 기능 (키워드 비교는 아카이브 워커에서 처리)
+function initRelatedPapers(feedUrls) {
+    const feeds = feedUrls.map(absoluteUrl);
+    document.addEventListener('click', async function(e) {
+        const button = e.target.closest('.details-btn');
+        if (!button) return;
+        
+        const paperId = button.dataset.paperId;
+        const container = document.getElementById(`related-papers-for-${paperId}`);
+        if (!container) return;
+        
+        // 버튼 토글 로직
+        const isExpanded = button.getAttribute('aria-expanded') === 'true';
+        if (isExpanded) {
+            container.innerHTML = ''; // 내용 숨기기
+            button.setAttribute('aria-expanded', 'false');
+            button.textContent = '자세히 보기 ▼';
+            return;
+        }
+        
+        button.setAttribute('aria-expanded', 'true');
+        button.textContent = '숨기기 ▲';
+        container.innerHTML = '<div class="loader">AI가 관련 논문을 찾는 중...</div>';
+        
+        let related;
+        try {
+            ({ related } = await callArchiveWorker('related', { paperId, feeds }));
+        } catch (error) {
+            container.innerHTML = '<p class="no-related">관련 논문을 불러올 수 없습니다.</p>';
+            return;
+        }
+        
+        if (related.length > 0) {
+            let html = '<h4>AI 추천 관련 논문:</h4><ul>';
+            related.forEach(p => {
+                html += `<li><a href="${p._archiveUrl}#${encodeURIComponent(p.paper_id)}">${p.title}</a> <span class="title-en-small">(${p.title_en})</span></li>`;
+            });
+            html += '</ul>';
+            container.innerHTML = html;
+        } else {
+            container.innerHTML = '<p class="no-related">관련 논문을 찾을 수 없습니다.</p>';
+        }
     });
 }
 
@@ -677,59 +704,17 @@ document.addEventListener('DOMContentLoaded', function() {
     initBookmarks();
     initTabs();
     initInfoBox();
-    initRelatedPapers(); // 관련 논문 기능 초기화
     
-    // 검색 박스 초기화 (비우기)
-    const searchBox = document.getElementById('searchBox');
-    if (searchBox) {
-        searchBox.value = '';
-    }
-    
-    // 페이지네이션은 아카이브 페이지에서만
-    if (window.location.pathname.includes('archive')) {
-        // 모든 항목을 검색 매치로 초기화
-        const allItems = document.querySelectorAll('.paper-item');
-        allItems.forEach(item => {
-            item.setAttribute('data-search-match', 'true');
-            item.setAttribute('data-tag-match', 'true');
-            // 초기에는 모두 표시
-            item.style.display = '';
-        });
-        // 페이지네이션 상태 초기화
-        paginationState.allItems = Array.from(allItems);
-        initPagination(10);
+    const paperList = document.getElementById('paperList');
+    if (paperList && paperList.dataset.feed) {
+        // 아카이브 페이지: 워커 검색 + 가상 스크롤 렌더링
+        const relatedFeeds = (paperList.dataset.relatedFeeds || paperList.dataset.feed).split(',');
+        initRelatedPapers(relatedFeeds);
+        initFeedArchive(paperList);
     } else {
-        // 메인 페이지에서도 태그 매치 초기화 및 검색 매치 설정
-        document.querySelectorAll('.paper-item').forEach(item => {
-            item.setAttribute('data-search-match', 'true');
-            item.setAttribute('data-tag-match', 'true');
-        });
-    }
-    
-    // 검색과 정렬은 페이지네이션 이후에 초기화
-    setTimeout(() => {
-        initSearch();
-        initSort();
+        // 오늘의 논문 페이지: 서버에서 렌더링된 항목을 태그로 필터링
         initTagFilter();
-        // 초기 결과 카운트 업데이트
         updateResultCount();
-    }, 100);
-    
-    // 인용 정보 로드 (지연 로드)
-    setTimeout(() => {
-        document.querySelectorAll('[data-paper-id]').forEach(el => {
-            const paperId = el.dataset.paperId;
-            if (paperId) {
-                loadCitationInfo(paperId).then(count => {
-                    if (count !== null && count > 0) {
-                        const citationEl = el.querySelector('.citation-count');
-                        if (citationEl) {
-                            citationEl.textContent = `인용 ${count}회`;
-                        }
-                    }
-                });
-            }
-        });
-    }, 1000);
+    }
 });
 
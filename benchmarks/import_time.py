@@ -0,0 +1,103 @@
+"""
+진입점 콜드 스타트(임포트 시간) 벤치마크
+
+각 진입점을 새 파이썬 프로세스에서 여러 번 실행하여 전체 실행 시간과
+`-X importtime` 기준 누적 임포트 시간이 큰 모듈을 측정합니다.
+
+사용법:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 --json bench_output.txt
+    python benchmarks/import_time.py --max-ms 300   # 초과 시 종료 코드 1
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (이름, 파이썬 인자) - 모두 네트워크 없이 종료되는 명령이어야 함
+ENTRY_POINTS = [
+    ('import update_papers', ['-c', 'import update_papers']),
+    ('import utils', ['-c', 'import utils']),
+    ('python -m update_papers --help', ['-m', 'update_papers', '--help']),
+]
+
+_IMPORTTIME_RE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)$')
+
+
+def _run_once(python_args):
+    """새 프로세스에서 한 번 실행하고 (벽시계 ms, {모듈: 누적 us})를 반환합니다."""
+    cmd = [sys.executable, '-X', 'importtime'] + python_args
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(python_args)} failed: {proc.stderr.strip()[-500:]}")
+
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            cumulative[match.group(3).strip()] = int(match.group(2))
+    return elapsed_ms, cumulative
+
+
+def benchmark(repeat=5, top_n=8):
+    """모든 진입점을 측정하고 결과 딕셔너리 리스트를 반환합니다."""
+    results = []
+    for name, python_args in ENTRY_POINTS:
+        timings = []
+        last_cumulative = {}
+        for _ in range(repeat):
+            elapsed_ms, last_cumulative = _run_once(python_args)
+            timings.append(elapsed_ms)
+
+        top_modules = sorted(last_cumulative.items(), key=lambda item: item[1], reverse=True)
+        # 하위 모듈이 상위 모듈 누적 시간에 포함되므로 최상위 이름 위주로 보여줌
+        top_modules = [(mod, us) for mod, us in top_modules if '.' not in mod][:top_n]
+
+        results.append({
+            'entry_point': name,
+            'median_ms': round(statistics.median(timings), 1),
+            'min_ms': round(min(timings), 1),
+            'max_ms': round(max(timings), 1),
+            'modules_loaded': len(last_cumulative),
+            'top_imports_ms': [(mod, round(us / 1000, 1)) for mod, us in top_modules],
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='진입점 콜드 스타트 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='진입점별 반복 횟수')
+    parser.add_argument('--json', metavar='PATH', help='결과를 JSON으로 저장할 경로')
+    parser.add_argument('--max-ms', type=float, help='중앙값이 이 값을 넘으면 실패 처리')
+    args = parser.parse_args(argv)
+
+    results = benchmark(repeat=args.repeat)
+    for result in results:
+        print(f"{result['entry_point']:<36} median {result['median_ms']:>7.1f} ms "
+              f"(min {result['min_ms']:.1f}, max {result['max_ms']:.1f}, "
+              f"{result['modules_loaded']} modules)")
+        for mod, ms in result['top_imports_ms']:
+            print(f"    {mod:<30} {ms:>7.1f} ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.max_ms is not None:
+        slow = [r for r in results if r['median_ms'] > args.max_ms]
+        for result in slow:
+            print(f"FAIL: {result['entry_point']} median {result['median_ms']} ms > {args.max_ms} ms")
+        return 1 if slow else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
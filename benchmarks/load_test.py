@@ -0,0 +1,201 @@
+"""
+전체 파이프라인 부하 테스트 (로컬 대역 서버 사용)
+
+arXiv/OpenRouter/Semantic Scholar 대역 서버를 띄우고 환경 변수로 엔드포인트를 돌린 뒤,
+임시 작업 디렉토리에서 `update_papers run`을 실행합니다.
+카테고리 수와 후보 풀 크기를 키워 처리량과 단계별 지연 시간을 측정하며,
+네트워크 없이 같은 시드로 재현할 수 있습니다.
+
+사용법:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --categories 12 --pool 600 --papers 5 --workers 6
+    python benchmarks/load_test.py --openrouter-latency-ms 800 --openrouter-429 0.1 --openrouter-timeouts 0.02
+    python benchmarks/load_test.py --json bench_output.txt
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_servers import ArxivStub, OpenRouterStub, SemanticScholarStub  # noqa: E402
+
+
+def build_config(args):
+    """부하 테스트용 config.yml 내용 (카테고리 수/후보 풀 크기만큼 확장)"""
+    categories = []
+    for i in range(args.categories):
+        name = f"LOAD{i + 1:02d}"
+        categories.append({
+            'name': name,
+            'search_queries': [
+                f'cat:cond-mat.mtrl-sci AND cathode AND load{i + 1}',
+                f'cat:cond-mat.mtrl-sci AND "layered oxide" AND load{i + 1}',
+            ],
+            'latest_sort_query_index': 0,
+            'max_results_to_fetch': args.pool,
+            'num_papers_to_summarize': args.papers,
+            'exclude_keywords': ['sodium', 'Na-ion'],
+            'paths': {
+                'today': f'_data/{name.lower()}/today.yml',
+                'archive': f'_data/{name.lower()}/archive.yml',
+            },
+            'filter_config': {
+                'enabled': True,
+                'min_score': 0,
+                'min_author_hindex': args.min_hindex,
+                'renowned_authors': ['Jeff Dahn'],
+                'prestigious_institutions': ['MIT', 'KAIST', 'ETH Zurich'],
+            },
+        })
+
+    return {
+        'gemini_model': 'google/gemini-2.5-flash',
+        'concurrency': {
+            'max_workers': args.workers,
+            'arxiv_min_interval': args.arxiv_interval,
+            'arxiv_pdf_min_interval': args.arxiv_interval,
+            'semantic_scholar_min_interval': 0.0,
+            'openrouter_max_concurrent': args.openrouter_concurrency,
+        },
+        'openrouter': {
+            'fallback_models': ['google/gemini-2.0-flash-001'],
+            'min_timeout': 2,
+            'max_timeout': args.openrouter_timeout,
+        },
+        'fulltext': {'enabled': args.fulltext},
+        'categories': categories,
+    }
+
+
+def _faults(args, prefix):
+    return {
+        'latency_ms': getattr(args, f'{prefix}_latency_ms'),
+        'jitter_ms': getattr(args, f'{prefix}_latency_ms') / 2,
+        'rate_429': getattr(args, f'{prefix}_429'),
+        'timeout_rate': getattr(args, f'{prefix}_timeouts'),
+        'malformed_rate': getattr(args, f'{prefix}_malformed'),
+        'hang_seconds': args.hang_seconds,
+    }
+
+
+def run_load_test(args):
+    """대역 서버를 띄우고 파이프라인을 한 번 실행한 뒤 측정 결과를 반환합니다."""
+    import yaml
+
+    servers = {
+        'arxiv': ArxivStub(pool_size=args.pool, faults=_faults(args, 'arxiv'), seed=args.seed),
+        'openrouter': OpenRouterStub(faults=_faults(args, 'openrouter'), seed=args.seed + 1),
+        'semantic_scholar': SemanticScholarStub(faults=_faults(args, 'semantic_scholar'), seed=args.seed + 2),
+    }
+    for server in servers.values():
+        server.start()
+
+    # 엔드포인트와 API 키는 모듈 임포트 시점에 읽으므로 임포트 전에 설정
+    os.environ['ARXIV_API_URL'] = servers['arxiv'].base_url + '/api/query'
+    os.environ['ARXIV_PDF_URL'] = servers['arxiv'].base_url + '/pdf/{paper_id}'
+    os.environ['OPENROUTER_API_URL'] = servers['openrouter'].base_url + '/api/v1/chat/completions'
+    os.environ['SEMANTIC_SCHOLAR_API_URL'] = servers['semantic_scholar'].base_url + '/graph/v1'
+    os.environ['OPENROUTER_API_KEY'] = 'load-test'
+    os.environ.pop('SEMANTIC_SCHOLAR_API_KEY', None)
+
+    workdir = tempfile.mkdtemp(prefix='paper-load-test-')
+    original_cwd = os.getcwd()
+    try:
+        os.chdir(workdir)
+        config_path = os.path.join(workdir, 'config.yml')
+        with open(config_path, 'w', encoding='utf-8') as f:
+            yaml.safe_dump(build_config(args), f, allow_unicode=True, sort_keys=False)
+
+        sys.path.insert(0, REPO_ROOT)
+        from utils.logging_setup import setup_logging
+        setup_logging(level=logging.DEBUG if args.verbose else logging.WARNING, log_file=None)
+
+        import update_papers
+        from utils.metrics import stage_metrics
+        from utils.summarizer import latency_report
+
+        start = time.perf_counter()
+        deadline = ['--deadline-minutes', str(args.deadline_minutes)] if args.deadline_minutes else []
+        status = update_papers.main(['--config', config_path, *deadline, 'run'])
+        elapsed = time.perf_counter() - start
+
+        processed = 0
+        for category in build_config(args)['categories']:
+            with open(category['paths']['today'], encoding='utf-8') as f:
+                processed += len(yaml.safe_load(f) or [])
+
+        return {
+            'status': status,
+            'categories': args.categories,
+            'pool': args.pool,
+            'papers_processed': processed,
+            'elapsed_s': round(elapsed, 3),
+            'papers_per_s': round(processed / elapsed, 3) if elapsed else None,
+            'stages': stage_metrics.report(),
+            'llm_tasks': latency_report(),
+            'services': {name: server.stats.snapshot() for name, server in servers.items()},
+        }
+    finally:
+        os.chdir(original_cwd)
+        for server in servers.values():
+            server.stop()
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+        else:
+            print(f"Work directory kept: {workdir}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='로컬 대역 서버를 사용한 전체 파이프라인 부하 테스트')
+    parser.add_argument('--categories', type=int, default=4, help='생성할 카테고리 수')
+    parser.add_argument('--pool', type=int, default=150, help='쿼리당 arXiv 후보 수')
+    parser.add_argument('--papers', type=int, default=3, help='카테고리당 요약할 논문 수')
+    parser.add_argument('--workers', type=int, default=4, help='동시에 처리할 카테고리 수')
+    parser.add_argument('--min-hindex', type=int, default=10, help='h-index 조회 임계값 (0이면 조회 안 함)')
+    parser.add_argument('--arxiv-interval', type=float, default=0.0, help='arXiv 요청 간 최소 간격 (초)')
+    parser.add_argument('--openrouter-concurrency', type=int, default=4, help='OpenRouter 동시 요청 수')
+    parser.add_argument('--openrouter-timeout', type=float, default=10.0, help='OpenRouter 타임아웃 상한 (초)')
+    parser.add_argument('--fulltext', action='store_true', help='본문(PDF) 발췌 단계 포함 (pypdf 필요)')
+    parser.add_argument('--deadline-minutes', type=float, default=None, help='실행 시간 예산 (분, 마감 스케줄러 확인용)')
+    parser.add_argument('--hang-seconds', type=float, default=15.0, help='타임아웃 주입 시 서버 대기 시간')
+    for service in ('arxiv', 'openrouter', 'semantic_scholar'):
+        flag = service.replace('_', '-')
+        parser.add_argument(f'--{flag}-latency-ms', type=float, default=0.0, help=f'{service} 응답 지연 (ms)')
+        parser.add_argument(f'--{flag}-429', type=float, default=0.0, help=f'{service} 429 응답 비율')
+        parser.add_argument(f'--{flag}-timeouts', type=float, default=0.0, help=f'{service} 타임아웃 비율')
+        parser.add_argument(f'--{flag}-malformed', type=float, default=0.0, help=f'{service} 깨진 응답 비율')
+    parser.add_argument('--seed', type=int, default=0, help='장애 주입 난수 시드')
+    parser.add_argument('--json', metavar='PATH', help='결과를 JSON으로 저장할 경로')
+    parser.add_argument('--keep', action='store_true', help='임시 작업 디렉토리를 삭제하지 않음')
+    parser.add_argument('-v', '--verbose', action='store_true', help='파이프라인 로그 출력')
+    args = parser.parse_args(argv)
+
+    result = run_load_test(args)
+
+    print(f"{result['papers_processed']} papers from {result['categories']} categories "
+          f"(pool {result['pool']}) in {result['elapsed_s']:.2f}s "
+          f"= {result['papers_per_s']} papers/s (exit {result['status']})")
+    print("Stages:")
+    for stage, stats in result['stages'].items():
+        print(f"    {stage:<20} {stats['count']:>5} calls  total {stats['total']:>8.3f}s  "
+              f"p50 {stats['p50']:.3f}s  p95 {stats['p95']:.3f}s  max {stats['max']:.3f}s")
+    print("Services:")
+    for name, counts in result['services'].items():
+        print(f"    {name:<20} " + ", ".join(f"{key} {value}" for key, value in sorted(counts.items())))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    return 0 if result['papers_processed'] > 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
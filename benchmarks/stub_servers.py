@@ -0,0 +1,338 @@
+"""
+부하 테스트용 로컬 대역(stand-in) 서버
+
+arXiv, OpenRouter, Semantic Scholar API를 흉내 내는 HTTP 서버입니다.
+- arXiv: 녹화된 Atom 피드(fixtures/arxiv_feed.xml)의 항목을 ID만 바꿔 원하는 후보 수만큼 재생,
+  PDF 요청에는 섹션 제목이 있는 작은 PDF를 생성하여 반환
+- OpenRouter: 녹화된 작업별 응답(fixtures/openrouter_responses.json)을 JSON 또는 SSE 스트림으로 반환
+- Semantic Scholar: 저자 검색/상세(h-index)와 paper batch(인용 수) 응답 생성
+
+서비스마다 지연 시간, 429 응답, 타임아웃(응답 지연), 깨진 응답을 주입할 수 있으며
+같은 시드로 실행하면 같은 순서로 장애가 발생합니다.
+"""
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import threading
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+ARXIV_NS = 'http://arxiv.org/schemas/atom'
+OPENSEARCH_NS = 'http://a9.com/-/spec/opensearch/1.1/'
+
+DEFAULT_FAULTS = {
+    'latency_ms': 0,         # 응답 전 고정 지연
+    'jitter_ms': 0,          # 0~jitter_ms 사이의 추가 무작위 지연
+    'rate_429': 0.0,         # 429 응답 비율
+    'timeout_rate': 0.0,     # hang_seconds 동안 응답하지 않는 비율
+    'hang_seconds': 15.0,    # 타임아웃 주입 시 대기 시간
+    'malformed_rate': 0.0,   # 깨진 본문을 반환하는 비율
+}
+
+
+class FaultInjector:
+    """시드 고정 난수로 요청별 장애 종류를 결정합니다."""
+
+    def __init__(self, faults=None, seed=0):
+        self.faults = dict(DEFAULT_FAULTS, **(faults or {}))
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self):
+        """('ok' | '429' | 'timeout' | 'malformed', 지연 초)를 반환합니다."""
+        f = self.faults
+        with self._lock:
+            roll = self._random.random()
+            delay = (f['latency_ms'] + self._random.random() * f['jitter_ms']) / 1000
+        if roll < f['rate_429']:
+            return '429', delay
+        roll -= f['rate_429']
+        if roll < f['timeout_rate']:
+            return 'timeout', f['hang_seconds']
+        roll -= f['timeout_rate']
+        if roll < f['malformed_rate']:
+            return 'malformed', delay
+        return 'ok', delay
+
+
+class ServiceStats:
+    """서비스별 요청/장애 카운터"""
+
+    def __init__(self):
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def add(self, key):
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.counts)
+
+
+class StubServer:
+    """
+    백그라운드 스레드에서 실행되는 대역 서버의 공통 부분
+
+    하위 클래스는 `handle(method, path, query, body)`에서
+    (상태 코드, content-type, 본문 bytes 또는 bytes 조각 iterable)을 반환합니다.
+    """
+
+    name = 'stub'
+
+    def __init__(self, faults=None, seed=0):
+        self.injector = FaultInjector(faults, seed)
+        self.stats = ServiceStats()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _serve(self, method):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                parsed = urlparse(self.path)
+                stub.stats.add('requests')
+
+                outcome, delay = stub.injector.draw()
+                time.sleep(delay)
+                if outcome == 'timeout':
+                    # hang_seconds가 지난 뒤에야 정상 응답 (클라이언트는 보통 그 전에 연결을 끊음)
+                    stub.stats.add('timeouts')
+                if outcome == '429':
+                    stub.stats.add('429')
+                    return self._send(429, 'application/json', b'{"error": "rate limited"}')
+
+                try:
+                    status, content_type, payload = stub.handle(
+                        method, parsed.path, parse_qs(parsed.query), body, malformed=(outcome == 'malformed')
+                    )
+                except Exception as e:
+                    stub.stats.add('500')
+                    return self._send(500, 'text/plain', str(e).encode('utf-8'))
+                if outcome == 'malformed':
+                    stub.stats.add('malformed')
+                stub.stats.add(str(status))
+                self._send(status, content_type, payload)
+
+            def _send(self, status, content_type, payload):
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', content_type)
+                    if isinstance(payload, (bytes, bytearray)):
+                        self.send_header('Content-Length', str(len(payload)))
+                        self.end_headers()
+                        self.wfile.write(payload)
+                    else:
+                        # 스트리밍 응답은 chunked 전송
+                        self.send_header('Transfer-Encoding', 'chunked')
+                        self.end_headers()
+                        for chunk in payload:
+                            self.wfile.write(f"{len(chunk):X}\r\n".encode('ascii') + chunk + b"\r\n")
+                            self.wfile.flush()
+                        self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    stub.stats.add('client_disconnects')
+
+            def do_GET(self):
+                self._serve('GET')
+
+            def do_POST(self):
+                self._serve('POST')
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name=f"stub-{self.name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def handle(self, method, path, query, body, malformed=False):
+        raise NotImplementedError
+
+
+def build_pdf(lines):
+    """텍스트 줄로 최소한의 단일 페이지 PDF를 만듭니다 (본문 발췌 단계 테스트용)."""
+    def escape(text):
+        return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    content = 'BT /F1 9 Tf 40 800 Td 11 TL ' + ' '.join(f'({escape(line)}) Tj T*' for line in lines) + ' ET'
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents 4 0 R '
+        '/Resources << /Font << /F1 5 0 R >> >> >>',
+        f'<< /Length {len(content)} >>\nstream\n{content}\nendstream',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    out = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    out += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+    out += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode('latin-1')
+    return out
+
+
+PDF_LINES = [
+    '1. Introduction',
+    'Layered oxide cathodes suffer from capacity fade at high voltage.',
+    '2. Experimental',
+    'LiNi0.8Mn0.1Co0.1O2 was synthesized by co-precipitation and calcined at 750 C for 12 h.',
+    'Coin cells were cycled between 2.8 and 4.4 V at C/3 and 25 C.',
+    '3. Results and Discussion',
+    'The coated cathode retained 92% of its capacity after 300 cycles versus 71% for the bare sample.',
+    '4. Conclusions',
+    'Surface coating suppresses oxygen loss and extends cycle life at high cutoff voltage.',
+    'References',
+    '[1] A. Author, J. Electrochem. Soc. 2020.',
+]
+
+
+class ArxivStub(StubServer):
+    """녹화된 Atom 항목을 재생하여 쿼리마다 `pool_size`개의 후보를 제공합니다 (`/pdf/<id>`는 PDF)."""
+
+    name = 'arxiv'
+
+    def __init__(self, pool_size=150, feed_path=None, **kwargs):
+        super().__init__(**kwargs)
+        self.pool_size = pool_size
+        ET.register_namespace('', ATOM_NS)
+        ET.register_namespace('arxiv', ARXIV_NS)
+        ET.register_namespace('opensearch', OPENSEARCH_NS)
+        tree = ET.parse(feed_path or os.path.join(FIXTURE_DIR, 'arxiv_feed.xml'))
+        self.entries = [ET.tostring(e, encoding='unicode') for e in tree.getroot().findall(f'{{{ATOM_NS}}}entry')]
+
+    def _entry(self, query, index):
+        template = self.entries[index % len(self.entries)]
+        # 쿼리(카테고리)와 순번으로 고유한 arXiv ID를 만들어 이미 본 논문과 겹치지 않게 함
+        digest = int(hashlib.sha1(f"{query}:{index}".encode('utf-8')).hexdigest()[:8], 16)
+        new_id = f"26{digest % 12 + 1:02d}.{digest % 100000:05d}"
+        return re.sub(r'\d{4}\.\d{5}', new_id, template)
+
+    def handle(self, method, path, query, body, malformed=False):
+        if path.startswith('/pdf/'):
+            pdf = build_pdf(PDF_LINES)
+            return 200, 'application/pdf', pdf[:len(pdf) // 2] if malformed else pdf
+
+        search_query = (query.get('search_query') or [''])[0]
+        start = int((query.get('start') or ['0'])[0])
+        max_results = int((query.get('max_results') or ['10'])[0])
+        end = min(start + max_results, self.pool_size)
+
+        entries = ''.join(self._entry(search_query, i) for i in range(start, end))
+        feed = (
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="{ATOM_NS}">'
+            f'<id>http://arxiv.org/api/stub</id><updated>2026-04-28T00:00:00Z</updated>'
+            f'<opensearch:totalResults xmlns:opensearch="{OPENSEARCH_NS}">{self.pool_size}</opensearch:totalResults>'
+            f'<opensearch:startIndex xmlns:opensearch="{OPENSEARCH_NS}">{start}</opensearch:startIndex>'
+            f'<opensearch:itemsPerPage xmlns:opensearch="{OPENSEARCH_NS}">{max(0, end - start)}</opensearch:itemsPerPage>'
+            f'{entries}</feed>'
+        ).encode('utf-8')
+        if malformed:
+            feed = feed[:len(feed) // 2]
+        return 200, 'application/atom+xml; charset=utf-8', feed
+
+
+class OpenRouterStub(StubServer):
+    """프롬프트로 작업 종류를 판별하여 녹화된 응답을 반환합니다."""
+
+    name = 'openrouter'
+
+    def __init__(self, responses_path=None, chunk_chars=24, chunk_delay_ms=0, **kwargs):
+        super().__init__(**kwargs)
+        with open(responses_path or os.path.join(FIXTURE_DIR, 'openrouter_responses.json'), encoding='utf-8') as f:
+            self.responses = json.load(f)
+        self.chunk_chars = chunk_chars
+        self.chunk_delay_ms = chunk_delay_ms
+
+    @staticmethod
+    def _task(prompt):
+        if '[HTML 요약]' in prompt:
+            return 'summary'
+        if '[카테고리]' in prompt:
+            return 'classification'
+        if '[키워드]' in prompt:
+            return 'keywords'
+        return 'translation'
+
+    def _stream(self, content, model):
+        yield b": OPENROUTER PROCESSING\n\n"
+        for i in range(0, len(content), self.chunk_chars):
+            if self.chunk_delay_ms:
+                time.sleep(self.chunk_delay_ms / 1000)
+            chunk = {'model': model, 'choices': [{'delta': {'content': content[i:i + self.chunk_chars]}}]}
+            yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode('utf-8')
+        yield b"data: [DONE]\n\n"
+
+    def handle(self, method, path, query, body, malformed=False):
+        request = json.loads(body or b'{}')
+        prompt = (request.get('messages') or [{}])[-1].get('content', '')
+        task = self._task(prompt)
+        self.stats.add(f"task.{task}")
+        content = self.responses[task]
+        model = request.get('model', 'stub')
+
+        if request.get('stream'):
+            if malformed:
+                return 200, 'text/event-stream', iter([b'data: {"choices": [{"delta": \n\n', b'data: [DONE]\n\n'])
+            return 200, 'text/event-stream', self._stream(content, model)
+
+        if malformed:
+            return 200, 'application/json', b'{"choices": [{"message": '
+        payload = {'model': model, 'choices': [{'message': {'role': 'assistant', 'content': content}}]}
+        return 200, 'application/json', json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+class SemanticScholarStub(StubServer):
+    """저자 h-index와 논문 인용 수를 이름/ID 해시로 결정적으로 생성합니다."""
+
+    name = 'semantic_scholar'
+
+    @staticmethod
+    def _number(text, modulo):
+        return int(hashlib.sha1(text.encode('utf-8')).hexdigest()[:8], 16) % modulo
+
+    def handle(self, method, path, query, body, malformed=False):
+        if malformed:
+            return 200, 'application/json', b'{"data": [{"authorId": '
+
+        if path.endswith('/author/search'):
+            name = (query.get('query') or [''])[0]
+            data = {'total': 1, 'data': [{'authorId': str(self._number(name, 10 ** 9)), 'name': name}]}
+        elif '/author/' in path:
+            author_id = path.rsplit('/', 1)[-1]
+            data = {'authorId': author_id, 'name': 'Stub Author', 'hIndex': self._number(author_id, 80)}
+        elif path.endswith('/paper/batch'):
+            ids = json.loads(body or b'{}').get('ids', [])
+            data = [{'paperId': s2_id, 'citationCount': self._number(s2_id, 300)} for s2_id in ids]
+        else:
+            return 404, 'application/json', b'{"error": "not found"}'
+        return 200, 'application/json', json.dumps(data).encode('utf-8')
@@ -0,0 +1,5 @@
+"""테스트에서 저장소 루트의 `utils` 패키지를 import할 수 있도록 경로를 추가합니다."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
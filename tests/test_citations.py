@@ -0,0 +1,61 @@
+"""인용 수 갱신과 피드 청크의 관계 테스트"""
+import json
+import os
+from datetime import date
+
+from utils import citations
+from utils.feed_exporter import export_category_feed, export_citations
+from utils.yaml_helper import save_yaml
+
+TODAY = date(2025, 9, 1)
+
+
+def _archive(count):
+    return [
+        {'paper_id': f"2508.{i:05d}v1", 'title': f"Paper {i}", 'date': '2025-08-20',
+         'summary_date': f"2025-08-{i % 28 + 1:02d} 09:00 KST", 'keyword_ids': []}
+        for i in range(count)
+    ]
+
+
+def _chunk_files(feed_dir):
+    return sorted(name for name in os.listdir(os.path.join(feed_dir, 'test')) if name.startswith('page-'))
+
+
+def test_citation_refresh_leaves_chunk_filenames_unchanged(tmp_path, monkeypatch):
+    archive_path = str(tmp_path / 'archive.yml')
+    citations_path = str(tmp_path / 'citations.json')
+    feed_dir = str(tmp_path / 'feeds')
+    save_yaml(_archive(25), archive_path)
+    category = {'name': 'Test', 'paths': {'archive': archive_path}}
+
+    export_category_feed(category, feed_dir=feed_dir)
+    before = _chunk_files(feed_dir)
+
+    monkeypatch.setattr(citations, 'fetch_citation_counts',
+                        lambda s2_ids: {s2_id: 7 for s2_id in s2_ids})
+    assert citations.refresh_archive_citations(archive_path, today=TODAY, citations_path=citations_path) == 25
+
+    export_category_feed(category, feed_dir=feed_dir)
+    export_citations(feed_dir=feed_dir, citations_path=citations_path)
+
+    assert _chunk_files(feed_dir) == before
+    with open(os.path.join(feed_dir, 'citations.json'), encoding='utf-8') as f:
+        assert json.load(f)['2508.00003v1'] == 7
+    with open(archive_path, encoding='utf-8') as f:
+        assert 'citation' not in f.read()
+
+
+def test_refresh_is_skipped_until_due(tmp_path, monkeypatch):
+    archive_path = str(tmp_path / 'archive.yml')
+    citations_path = str(tmp_path / 'citations.json')
+    save_yaml(_archive(3), archive_path)
+    requested = []
+    monkeypatch.setattr(citations, 'fetch_citation_counts',
+                        lambda s2_ids: requested.extend(s2_ids) or {s2_id: None for s2_id in s2_ids})
+
+    citations.refresh_archive_citations(archive_path, today=TODAY, citations_path=citations_path)
+    citations.refresh_archive_citations(archive_path, today=TODAY, citations_path=citations_path)
+
+    # 찾지 못한 논문도 갱신 날짜가 기록되어 같은 날 다시 조회하지 않음
+    assert len(requested) == 3
@@ -0,0 +1,33 @@
+"""DOI 조회기의 요청 URL 테스트"""
+from utils import doi_resolver
+from utils.endpoints import CROSSREF_API_URL
+
+
+class _Response:
+    status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {'message': {'title': ['Old SICI paper'], 'issued': {'date-parts': [[1999, 3]]}}}
+
+
+class _Session:
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _Response()
+
+
+def test_crossref_escapes_reserved_characters_in_doi(monkeypatch):
+    session = _Session()
+    monkeypatch.setattr(doi_resolver, 'get_session', lambda: session)
+
+    record = doi_resolver.CrossrefResolver().resolve("10.1002/(SICI)1097-4636(199903)#45;2?x=1%")
+
+    assert session.urls == [f"{CROSSREF_API_URL}/works/10.1002/%28SICI%291097-4636%28199903%29%2345%3B2%3Fx%3D1%25"]
+    assert record['title'] == 'Old SICI paper'
+    assert record['date'] == '1999-03'
@@ -0,0 +1,57 @@
+"""arXiv 응답 캐시 어댑터 테스트"""
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+
+from utils import http_cache
+from utils.http_cache import CachingAdapter, ResponseCache
+
+QUERY_URL = 'http://export.arxiv.org/api/query?search_query=cat:cond-mat&start=0&max_results=100'
+EMPTY_FEED = b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>arXiv Query</title></feed>'
+FEED = (b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        b'<entry><id>http://arxiv.org/abs/2508.00236v1</id><title>Paper</title></entry></feed>')
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    """네트워크 대신 `bodies`의 응답을 차례로 돌려주는 캐시 세션"""
+    monkeypatch.chdir(tmp_path)
+    bodies = []
+    sent = []
+
+    def fake_send(adapter, request, **kwargs):
+        sent.append(request.url)
+        response = Response()
+        response.status_code = 200
+        response._content = bodies.pop(0)
+        response.url = request.url
+        response.request = request
+        return response
+
+    monkeypatch.setattr(HTTPAdapter, 'send', fake_send)
+    # 실행 시각이 arXiv 발표 창과 겹쳐도 결과가 같도록 TTL만 적용
+    monkeypatch.setattr(http_cache, 'fresh_until', lambda stored_at, ttl_seconds: stored_at + ttl_seconds)
+    cache = ResponseCache(path=str(tmp_path / 'http_cache.sqlite3'))
+    session = requests.Session()
+    session.mount('http://export.arxiv.org/', CachingAdapter(cache))
+    session.bodies, session.sent = bodies, sent
+    yield session
+    cache.close()
+
+
+def test_empty_page_is_not_served_from_cache_on_retry(session):
+    session.bodies.extend([EMPTY_FEED, FEED])
+
+    assert session.get(QUERY_URL).content == EMPTY_FEED
+    # arxiv 클라이언트의 빈 페이지 재시도는 같은 세션으로 같은 URL을 다시 요청함
+    assert session.get(QUERY_URL).content == FEED
+    assert len(session.sent) == 2
+
+
+def test_page_with_entries_is_served_from_cache(session):
+    session.bodies.append(FEED)
+
+    assert session.get(QUERY_URL).content == FEED
+    assert session.get(QUERY_URL).content == FEED
+    assert len(session.sent) == 1
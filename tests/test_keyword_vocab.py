@@ -0,0 +1,48 @@
+"""키워드 표준 어휘의 유사 표기 병합 테스트"""
+from utils.keyword_vocab import KeywordVocabulary
+
+
+def test_spelling_variants_share_an_id():
+    vocabulary = KeywordVocabulary()
+    assert vocabulary.get_or_add("Ni-rich cathodes") == vocabulary.get_or_add("Ni-rich cathode")
+    assert vocabulary.get_or_add("cation disorder") == vocabulary.get_or_add("cation disordered")
+
+
+def test_different_compounds_are_not_merged():
+    vocabulary = KeywordVocabulary()
+    chloride = vocabulary.get_or_add("Li6PS5Cl solid electrolyte")
+    assert vocabulary.get_or_add("Li6PS5Br solid electrolyte") != chloride
+    assert vocabulary.get_or_add("Li6PS5Cl solid electrolytes") == chloride
+    assert vocabulary.get_or_add("LiFePO4 cathode") != vocabulary.get_or_add("LiMnPO4 cathode")
+
+
+def test_mixed_case_formulas_require_exact_match():
+    vocabulary = KeywordVocabulary([{'id': 0, 'label': "LiAlO coating layer", 'aliases': ["LiAlO coating layer"]}])
+    assert vocabulary.lookup("LiAlO coating layers") == 0
+    assert vocabulary.lookup("LiAlOH coating layer") is None
+
+
+def test_defined_acronyms_share_an_id():
+    vocabulary = KeywordVocabulary([
+        {'id': 0, 'label': "Density functional theory", 'aliases': ["Density functional theory", "DFT"]},
+        {'id': 1, 'label': "Solid electrolyte interphase", 'aliases': ["Solid electrolyte interphase", "SEI"]},
+    ])
+    assert vocabulary.lookup("Density functional theory (DFT)") == 0
+    assert vocabulary.lookup("DFT (density functional theory)") == 0
+    assert vocabulary.lookup("Solid electrolyte interphase (SEI)") == 1
+    assert vocabulary.get_or_add("SEI") == 1
+    # 머리글자가 아닌 괄호는 그대로 구분
+    assert vocabulary.lookup("Lithium sulfide (Li2S)") is None
+
+
+def test_element_symbols_share_an_id_with_names():
+    vocabulary = KeywordVocabulary()
+    assert vocabulary.get_or_add("Si anode") == vocabulary.get_or_add("Silicon anodes")
+    assert vocabulary.get_or_add("Na-ion batteries") == vocabulary.get_or_add("Sodium-ion battery")
+
+
+def test_latex_labels_are_cleaned():
+    vocabulary = KeywordVocabulary()
+    keyword_id = vocabulary.get_or_add(r"$\text{Li}_2\text{MnO}_3 \text{}$")
+    assert vocabulary.label(keyword_id) == "Li2MnO3"
+    assert vocabulary.get_or_add("Nb$_{14}$W$_3$O$_{44}$") == vocabulary.get_or_add("Nb14W3O44")
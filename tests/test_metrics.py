@@ -0,0 +1,23 @@
+"""단계별 처리 시간 표본의 상한과 예상 소요 시간 테스트"""
+from utils.metrics import StageMetrics
+
+
+def test_samples_are_bounded_but_totals_cover_the_run():
+    metrics = StageMetrics(max_samples=10)
+    for _ in range(25):
+        metrics.record('enrich', 2.0)
+
+    assert len(metrics._samples['enrich']) == 10
+    stats = metrics.report()['enrich']
+    assert stats['count'] == 25
+    assert stats['total'] == 50.0
+
+
+def test_estimate_follows_recent_samples():
+    metrics = StageMetrics()
+    assert metrics.estimate('enrich') == 0.0
+    metrics.record('enrich', 1.0)
+    assert metrics.estimate('enrich') == 1.0
+    for _ in range(50):
+        metrics.record('enrich', 5.0)
+    assert 4.9 < metrics.estimate('enrich') <= 5.0
@@ -0,0 +1,44 @@
+"""논문 분석 결과의 요약 출처(`summary_source`) 테스트"""
+import os
+
+import pytest
+
+import update_papers
+from utils import summarizer
+from utils.paper_record import PaperRecord
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ABSTRACT = ("We report a lithium metal anode with a fluorinated interphase. "
+            "The interphase suppresses dendrite growth during plating. "
+            "Cells retain 90% capacity after 500 cycles at 1 C.")
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)  # 키워드 어휘 파일 경로
+    monkeypatch.setattr(update_papers, 'OPENROUTER_API_KEY', 'test-key')
+    return update_papers.PaperAnalyzer({'name': 'Anode'}, 'test/model')
+
+
+def _paper():
+    return PaperRecord('2508.00236v1', 'Fluorinated interphase for lithium anodes', ABSTRACT,
+                       authors=['A. Author'], published='2025-08-01')
+
+
+def test_summary_source_is_local_when_llm_call_fails(analyzer, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("All OpenRouter models failed")
+
+    monkeypatch.setattr(summarizer, '_call_openrouter_api', fail)
+    paper_data = analyzer.analyze(_paper())
+
+    assert paper_data['summary_source'] == summarizer.SUMMARY_SOURCE_LOCAL
+    assert paper_data['summary']
+
+
+def test_summary_source_is_llm_when_llm_answers(analyzer, monkeypatch):
+    monkeypatch.setattr(summarizer, '_call_openrouter_api', lambda *args, **kwargs: "<ul><li>요약</li></ul>")
+    paper_data = analyzer.analyze(_paper())
+
+    assert paper_data['summary_source'] == summarizer.SUMMARY_SOURCE_LLM
+    assert paper_data['summary'] == "<ul><li>요약</li></ul>"
@@ -0,0 +1,24 @@
+"""watch 모드 발표 창 반복 테스트"""
+import threading
+from datetime import datetime, timedelta
+
+from utils.watch import AnnouncementSchedule, run_watch
+
+
+def test_immediate_poll_outside_window_does_not_start_a_cycle(monkeypatch):
+    schedule = AnnouncementSchedule()
+    announce = datetime.now(schedule.tz) + timedelta(hours=2)
+    monkeypatch.setattr(schedule, 'next_window',
+                        lambda now=None: (announce, announce - schedule.lead, announce + schedule.window))
+    stop_event = threading.Event()
+    calls = []
+
+    def poll():
+        calls.append('poll')
+        stop_event.set()  # 폴링 후 다음 창을 기다리는 대신 종료
+        return False
+
+    run_watch(schedule, lambda cycle: calls.append('start'), poll,
+              end_cycle=lambda cycle: calls.append('end'), stop_event=stop_event, immediate=True)
+
+    assert calls == ['poll']
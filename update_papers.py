@@ -1,43 +1,41 @@
 """
 논문 업데이트 메인 스크립트
 arXiv에서 논문을 검색하고 Gemini로 요약하여 저장합니다.
+
+사용법:
+    python update_papers.py                 # 전체 일일 실행 (archive + enrich + citations + export)
+    python -m update_papers fetch           # 후보 논문 검색만 수행 (저장 없음)
+    python -m update_papers enrich          # 검색 + AI 분석 후 today 파일 저장
+    python -m update_papers archive         # today 논문을 archive로 이동
+    python -m update_papers citations       # 아카이브 인용 수 일괄 갱신
+    python -m update_papers keywords        # 키워드를 표준 어휘 ID로 변환
+    python -m update_papers export          # 정적 JSON 피드 내보내기
+    python -m update_papers stats           # 로컬 데이터 통계 출력
+    python -m update_papers watch           # 상주 모드: arXiv 발표 시각에 맞춰 점진적으로 갱신
+    python -m update_papers classifier      # 로컬 카테고리/키워드 모델과 LLM 라벨의 일치도 보고
+    python -m update_papers ingest DUMP     # arXiv 메타데이터 덤프를 백테스트용 말뭉치에 적재
+    python -m update_papers backtest        # 현재 필터 설정을 말뭉치의 과거 기간에 적용
+    python -m update_papers recommended     # 추천 논문 목록의 DOI 메타데이터 조회 + AI 분석 (바뀐 항목만)
+
+하위 시스템(arxiv, requests, utils.*)은 각 명령에서 필요할 때만 임포트되며,
+모듈 임포트 시점에는 로깅 설정 등 부수 효과가 없습니다.
 """
 import os
 import sys
 import logging
 import re
+import argparse
 from datetime import datetime, timezone, timedelta
 
 # 한국 시간대 설정
 KST = timezone(timedelta(hours=9))
 
-# 로깅 설정 (KST 시간대 사용)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('update_papers.log', encoding='utf-8')
-    ],
-    datefmt='%Y-%m-%d %H:%M:%S KST'
-)
 logger = logging.getLogger(__name__)
 
 # 설정 파일 경로
 CONFIG_FILE = 'config.yml'
 OPENROUTER_API_KEY = os.environ.get('OPENROUTER_API_KEY')
 
-# 유틸리티 임포트
-from utils.yaml_helper import load_yaml, save_yaml
-from utils.config_validator import validate_config
-from utils.paper_fetcher import find_new_papers
-from utils.summarizer import (
-    summarize_with_gemini, 
-    translate_title,
-    extract_keywords_with_gemini,
-    classify_category_with_gemini
-)
-
 def clean_latex_title(title):
     """Converts LaTeX-style sub/super-scripts in titles to HTML tags."""
     title = re.sub(r'\$_{\s*([^}]+)\s*}\$', r'<sub>\1</sub>', title)
@@ -48,6 +46,9 @@ def clean_latex_title(title):
 
 def archive_today_paper(today_path, archive_path):
     """오늘의 논문을 아카이브로 이동합니다."""
+    from utils.yaml_helper import load_yaml, save_yaml
+    from utils.seen_index import base_arxiv_id
+
     logger.info(f"Archiving papers from {today_path} to {archive_path}...")
     today_papers = load_yaml(today_path)
     
@@ -56,11 +57,12 @@ def archive_today_paper(today_path, archive_path):
         return
 
     archive_papers = load_yaml(archive_path) or []
-    existing_ids = {paper.get('paper_id') for paper in archive_papers if paper.get('paper_id')}
+    # 같은 논문의 다른 버전이 중복 보관되지 않도록 버전 없는 ID로 비교
+    existing_ids = {base_arxiv_id(paper.get('paper_id')) for paper in archive_papers if paper.get('paper_id')}
     
     archived_count = 0
     for paper in today_papers:
-        if paper.get('paper_id') and paper.get('paper_id') not in existing_ids:
+        if paper.get('paper_id') and base_arxiv_id(paper.get('paper_id')) not in existing_ids:
             archive_papers.insert(0, paper)
             archived_count += 1
     
@@ -70,8 +72,156 @@ def archive_today_paper(today_path, archive_path):
     else:
         logger.info("No new papers to archive.")
 
-def process_papers(category, model_name):
-    """특정 카테고리의 논문을 처리합니다."""
+class PaperAnalyzer:
+    """
+    카테고리 하나의 논문 분석: 요약, 키워드, 분류 (필수)와 제목 번역 (선택)
+
+    arXiv 후보(prepare_papers)와 추천 논문(cmd_recommended)이 같은 분석을 거치도록 함께 사용합니다.
+    분석 대상은 PaperRecord입니다.
+    """
+
+    def __init__(self, category, model_name):
+        import threading
+        from utils.summarizer import resolve_model, TASK_SUMMARY, TASK_TRANSLATION, TASK_KEYWORDS, TASK_CLASSIFICATION
+        from utils.keyword_vocab import load_vocabulary
+        from utils.local_classifier import load_local_models, is_enabled as local_models_enabled
+
+        # 품질 점수가 이 값 미만인 논문은 LLM 호출 없이 로컬 요약만 수행
+        self.llm_min_score = category.get('llm_min_score')
+
+        # 작업별 모델 (짧은 출력 작업은 가벼운 모델로 라우팅)
+        category_models = category.get('models')
+        self.summary_model = resolve_model(TASK_SUMMARY, model_name, category_models)
+        self.translation_model = resolve_model(TASK_TRANSLATION, model_name, category_models)
+        self.keywords_model = resolve_model(TASK_KEYWORDS, model_name, category_models)
+        self.classification_model = resolve_model(TASK_CLASSIFICATION, model_name, category_models)
+
+        # 자유 형식 키워드를 표준 어휘의 정수 ID로 저장
+        self.vocabulary = load_vocabulary()
+        # 확신도가 높으면 카테고리/키워드를 LLM 대신 로컬 모델로 결정
+        self.local_models = load_local_models() if local_models_enabled() else None
+        self.local_hits = {'category': 0, 'keywords': 0}
+        self._lock = threading.Lock()
+
+    def should_use_llm(self, paper):
+        quality_score = paper.quality_score
+        return bool(OPENROUTER_API_KEY) and (
+            self.llm_min_score is None or quality_score is None or quality_score >= self.llm_min_score
+        )
+
+    def analyze(self, paper):
+        """
+        필수 작업: 요약, 키워드, 분류
+
+        Returns:
+            today.yml 형식의 논문 딕셔너리 (LLM을 쓴 경우 제목 번역을 기다리는 `title_pending` 표시 포함)
+        """
+        from utils.summarizer import (summarize_with_source, extract_keywords_with_gemini,
+                                      classify_category_with_gemini, SUMMARY_SOURCE_LOCAL)
+        from utils.local_summarizer import summarize_locally
+        from utils.metrics import stage_timer
+        from utils.fulltext import build_excerpt
+        from utils.local_classifier import SOURCE_LOCAL
+
+        cleaned_title_en = clean_latex_title(paper.title)
+        abstract = paper.summary
+
+        use_llm = self.should_use_llm(paper)
+        # 본문 발췌 (fulltext.enabled일 때만, arXiv 논문만, PDF 다운로드 간격/동시 수는 전역 리미터가 제한)
+        excerpt = build_excerpt(paper.paper_id) if use_llm and paper.version else None
+        local_text = f"{cleaned_title_en}\n{abstract}"
+        local_models = self.local_models
+
+        with stage_timer('local_models'):
+            local_keyword_ids = local_models.extract_keywords(local_text) if local_models else None
+            local_category = local_models.predict_category(local_text) if local_models else None
+
+        with stage_timer('enrich'):
+            if use_llm:
+                # AI를 이용한 분석 (요약, 키워드, 카테고리 / 번역은 선택 작업으로 따로 실행)
+                summary, summary_source = summarize_with_source(abstract, self.summary_model, OPENROUTER_API_KEY,
+                                                                excerpt=excerpt)
+                keywords = [] if local_keyword_ids else \
+                    extract_keywords_with_gemini(abstract, self.keywords_model, OPENROUTER_API_KEY)
+                category_cls = local_category or \
+                    classify_category_with_gemini(abstract, self.classification_model, OPENROUTER_API_KEY)
+            else:
+                # 로컬 추출 요약 (API 키 없음 또는 낮은 우선순위 논문)
+                summary, summary_source = summarize_locally(abstract), SUMMARY_SOURCE_LOCAL
+                keywords = []
+                category_cls = local_category or "분류 안됨"
+
+        keyword_ids = local_keyword_ids or self.vocabulary.encode(keywords)
+        if local_models and use_llm:
+            # LLM이 붙인 라벨만 학습 (로컬 답은 학습하지 않음)
+            local_models.learn(
+                paper.paper_id, local_text,
+                category=None if local_category else category_cls,
+                keyword_ids=None if local_keyword_ids else keyword_ids,
+            )
+
+        paper_data = {
+            'title': cleaned_title_en,
+            'title_en': cleaned_title_en,
+            'authors': ", ".join(paper.authors),
+            'date': paper.published,
+            'paper_id': paper.paper_id,
+            'link': paper.link,
+            'summary': summary,
+            'summary_date': datetime.now(KST).strftime('%Y-%m-%d %H:%M KST'),
+            'keyword_ids': keyword_ids,
+            'category': category_cls,
+            'summary_source': summary_source
+        }
+        if local_category:
+            paper_data['category_source'] = SOURCE_LOCAL
+        if local_keyword_ids:
+            paper_data['keywords_source'] = SOURCE_LOCAL
+        if use_llm:
+            paper_data['title_pending'] = True
+
+        with self._lock:
+            self.local_hits['category'] += bool(local_category)
+            self.local_hits['keywords'] += bool(local_keyword_ids)
+        return paper_data
+
+    def translate(self, paper_data):
+        """선택 작업: 영어 제목을 번역해 반환합니다 (딕셔너리 반영은 호출자가 잠금 안에서)."""
+        from utils.summarizer import translate_title
+        from utils.metrics import stage_timer
+
+        with stage_timer('translate'):
+            return translate_title(paper_data['title_en'], self.translation_model, OPENROUTER_API_KEY)
+
+    def log_local_hits(self, category_name, total):
+        if self.local_models and total:
+            logger.info(f"[{category_name}] Local models answered category for {self.local_hits['category']}/{total}"
+                        f" and keywords for {self.local_hits['keywords']}/{total} papers.")
+
+def prepare_papers(category, model_name, scheduler, archive_first=True, append=False):
+    """
+    특정 카테고리의 새 논문을 검색하고, 찾는 대로 논문별 분석 작업을 스케줄러에 등록합니다.
+
+    선택된 논문의 요약/키워드/분류는 필수 작업으로, 제목 번역은 선택 작업으로 등록하며
+    같은 등급 안에서는 품질 점수가 높은 논문이 먼저 처리됩니다.
+    이전 실행에서 마감 때문에 번역하지 못한 제목(`title_pending`)도 선택 작업으로 다시 등록합니다.
+
+    Args:
+        category: 카테고리 설정 딕셔너리
+        model_name: 작업별 모델 설정이 없을 때 사용할 기본 LLM 모델 이름
+        scheduler: 작업을 등록할 DeadlineScheduler
+        archive_first: True이면 검색 전에 오늘의 논문을 아카이브로 이동
+        append: True이면 기존 today 목록에 부족한 만큼만 추가하고 논문마다 저장 (watch 모드)
+
+    Returns:
+        스케줄러 실행이 끝난 뒤 호출하여 결과를 저장하고 처리된 논문 수를 돌려받는 함수
+    """
+    import threading
+    from utils.yaml_helper import load_yaml, save_yaml
+    from utils.paper_fetcher import iter_new_papers
+    from utils.metrics import stage_timer
+    from utils.scheduler import PRIORITY_ESSENTIAL, PRIORITY_OPTIONAL
+
     category_name = category.get('name', 'Unknown')
     paths = category.get('paths', {})
     today_path = paths.get('today')
@@ -80,7 +230,7 @@ def process_papers(category, model_name):
 
     if not today_path or not archive_path:
         logger.error(f"[{category_name}] 'paths' configuration is missing or incomplete. Skipping.")
-        return 0
+        return lambda: 0
 
     logger.info(f"\n=== [{category_name}] 업데이트 시작 ===")
     
@@ -92,92 +242,762 @@ def process_papers(category, model_name):
         logger.info(f"    - 저명 연구자: {len(filter_config.get('renowned_authors', []))}명")
 
     # 아카이브
-    archive_today_paper(today_path, archive_path)
+    if archive_first:
+        archive_today_paper(today_path, archive_path)
     
-    # 새 논문 검색
-    new_papers = find_new_papers(
-        archive_path=archive_path,
-        num_target=category.get('num_papers_to_summarize', 3),
-        filter_config=filter_config,
-        settings=category  # 카테고리 전체를 settings로 전달
-    )
+    num_target = category.get('num_papers_to_summarize', 3)
+    existing_today = (load_yaml(today_path) or []) if append else []
+    archive_papers = load_yaml(archive_path) or []
+    new_papers = []
 
-    today_list = []
-    if not new_papers:
-        logger.info(f"No new {category_name.lower()} papers to update. Clearing today's list.")
+    analyzer = PaperAnalyzer(category, model_name)
+
+    # 분석 결과는 검색 순서대로 저장 (작업은 품질 점수 순으로 끝나므로 인덱스로 정렬)
+    results = {}
+    archive_changed = []
+    lock = threading.Lock()
+
+    def save_today():
+        """append 모드에서 분석이 끝난 논문부터 바로 반영"""
+        with lock:
+            today_list = [results[i] for i in sorted(results)]
+            save_yaml(existing_today + today_list, today_path)
+
+    def translate(paper_data, in_archive=False):
+        """선택 작업: 제목 번역 (마감으로 보류되면 영어 제목과 `title_pending` 표시가 남음)"""
+        title_kr = analyzer.translate(paper_data)
+        with lock:
+            paper_data['title'] = title_kr
+            paper_data.pop('title_pending', None)
+            if in_archive:
+                archive_changed.append(paper_data['paper_id'])
+        if append and not in_archive:
+            save_today()
+
+    def enrich(index, new_paper):
+        """필수 작업: 요약, 키워드, 분류"""
+        paper_data = analyzer.analyze(new_paper)
+        if paper_data.get('title_pending'):
+            scheduler.submit(PRIORITY_OPTIONAL, new_paper.quality_score,
+                             f"translate {paper_data['paper_id']}", lambda: translate(paper_data), stage='translate')
+
+        with lock:
+            results[index] = paper_data
+        logger.info(f"  Processed: {paper_data['title'][:60]}...")
+        if append:
+            save_today()
+
+    if append and len(existing_today) >= num_target:
+        logger.info(f"[{category_name}] Today's list already has {len(existing_today)} papers.")
     else:
-        for new_paper in new_papers:
-            try:
-                cleaned_title_en = clean_latex_title(new_paper.title.strip())
-                abstract = new_paper.summary.strip()
-
-                # AI를 이용한 분석 (요약, 번역, 키워드, 카테고리)
-                summary = summarize_with_gemini(abstract, model_name, OPENROUTER_API_KEY)
-                title_kr = translate_title(cleaned_title_en, model_name, OPENROUTER_API_KEY)
-                keywords = extract_keywords_with_gemini(abstract, model_name, OPENROUTER_API_KEY)
-                category_cls = classify_category_with_gemini(abstract, model_name, OPENROUTER_API_KEY)
-                
-                paper_data = {
-                    'title': title_kr,
-                    'title_en': cleaned_title_en,
-                    'authors': ", ".join([author.name for author in new_paper.authors]),
-                    'date': new_paper.published.strftime('%Y-%m-%d'),
-                    'paper_id': new_paper.get_short_id(),
-                    'link': new_paper.entry_id,
-                    'summary': summary,
-                    'summary_date': datetime.now(KST).strftime('%Y-%m-%d %H:%M KST'),
-                    'keywords': keywords,
-                    'category': category_cls
-                }
-                
-                today_list.append(paper_data)
-                logger.info(f"  Processed: {paper_data['title'][:60]}...")
-            except Exception as e:
-                logger.error(f"Error processing paper {new_paper.get_short_id()}: {e}", exc_info=True)
-                continue
-
-    save_yaml(today_list, today_path)
-    logger.info(f"Successfully updated '{today_path}' with {len(today_list)} papers.")
-    
-    return len(today_list)
+        # 새 논문 검색: 후보가 필터와 점수 단계를 통과하는 대로 분석 작업을 등록
+        # (스케줄러가 이미 실행 중이면 다음 검색 페이지를 받는 동안 분석이 시작됨)
+        with stage_timer('fetch'):
+            for index, new_paper in enumerate(iter_new_papers(
+                archive_path=archive_path,
+                num_target=num_target - len(existing_today),
+                filter_config=filter_config,
+                settings=category,  # 카테고리 전체를 settings로 전달
+                exclude_ids=[paper.get('paper_id') for paper in existing_today]
+            )):
+                new_papers.append(new_paper)
+                scheduler.submit(PRIORITY_ESSENTIAL, new_paper.quality_score,
+                                 f"enrich {new_paper.paper_id}",
+                                 lambda index=index, new_paper=new_paper: enrich(index, new_paper), stage='enrich')
 
-def main():
-    """메인 실행 함수"""
-    if not OPENROUTER_API_KEY:
-        logger.warning("OPENROUTER_API_KEY not set. Using local fallback summarizer.")
+    if OPENROUTER_API_KEY:
+        # 이전 실행에서 보류된 제목 번역 (새 논문보다 뒤에 실행)
+        for paper in existing_today:
+            if paper.get('title_pending'):
+                scheduler.submit(PRIORITY_OPTIONAL, -1, f"translate {paper.get('paper_id')}",
+                                 lambda paper=paper: translate(paper), stage='translate')
+        for paper in archive_papers:
+            if paper.get('title_pending'):
+                scheduler.submit(PRIORITY_OPTIONAL, -1, f"translate {paper.get('paper_id')}",
+                                 lambda paper=paper: translate(paper, in_archive=True), stage='translate')
+
+    def finish():
+        """끝난 작업의 결과를 저장하고 처리된 논문 수를 반환합니다."""
+        today_list = [results[i] for i in sorted(results)]
+        skipped = len(new_papers) - len(today_list)
+
+        if archive_changed:
+            save_yaml(archive_papers, archive_path)
+            logger.info(f"Translated {len(archive_changed)} pending titles in '{archive_path}'.")
+        if skipped:
+            logger.warning(f"[{category_name}] {skipped} selected papers were not analyzed; "
+                           f"they remain candidates for the next run.")
+        analyzer.log_local_hits(category_name, len(today_list))
+
+        if append:
+            # 분석/번역이 끝날 때마다 이미 저장했으므로 여기서는 결과만 보고
+            if not new_papers and len(existing_today) < num_target:
+                logger.info(f"No new {category_name.lower()} papers yet.")
+            logger.info(f"Added {len(today_list)} papers to '{today_path}' ({len(existing_today) + len(today_list)} total).")
+            return len(today_list)
+
+        if not new_papers:
+            logger.info(f"No new {category_name.lower()} papers to update. Clearing today's list.")
+        save_yaml(today_list, today_path)
+        logger.info(f"Successfully updated '{today_path}' with {len(today_list)} papers.")
+        return len(today_list)
+
+    return finish
+
+def prepare_recommended(category, model_name, scheduler, refresh=False, force=False):
+    """
+    추천 논문 목록의 DOI 메타데이터를 조회하고, 바뀐 항목만 분석 작업으로 스케줄러에 등록합니다.
+
+    원본 항목이나 조회한 메타데이터가 지난 분석 때와 같으면 (`source_hash`) 저장된 결과를 그대로 둡니다.
+
+    Args:
+        category: 카테고리 설정 딕셔너리 (`paths.recommended`, `paths.recommended_papers`)
+        model_name: 작업별 모델 설정이 없을 때 사용할 기본 LLM 모델 이름
+        scheduler: 작업을 등록할 DeadlineScheduler
+        refresh: True면 DOI 캐시를 무시하고 메타데이터를 다시 조회
+        force: True면 바뀌지 않은 항목도 다시 분석
+
+    Returns:
+        스케줄러 실행이 끝난 뒤 호출하여 결과를 저장하고 분석한 항목 수를 돌려받는 함수
+    """
+    import threading
+    from utils.yaml_helper import load_yaml, save_yaml
+    from utils.doi_resolver import resolve_dois, normalize_doi
+    from utils.recommended import entry_doi, source_hash, build_record, recommended_fields
+    from utils.metrics import stage_timer
+    from utils.scheduler import PRIORITY_ESSENTIAL, PRIORITY_OPTIONAL
+
+    category_name = category.get('name', 'Unknown')
+    paths = category.get('paths', {})
+    source_path = paths.get('recommended')
+    output_path = paths.get('recommended_papers')
+    if not source_path or not output_path:
+        logger.info(f"[{category_name}] No recommended list configured. Skipping.")
+        return lambda: 0
+
+    entries = []
+    for entry in load_yaml(source_path) or []:
+        if isinstance(entry, dict) and entry_doi(entry):
+            entries.append(entry)
+        else:
+            logger.warning(f"[{category_name}] Recommended entry without a DOI skipped: {entry}")
+    previous = load_yaml(output_path) or []
+    # DOI는 대소문자를 구분하지 않으므로 비교는 소문자 키로 (저장된 값은 원래 표기)
+    previous_by_doi = {normalize_doi(paper.get('doi')): paper for paper in previous if normalize_doi(paper.get('doi'))}
+
+    with stage_timer('doi_resolve', len(entries)):
+        metadata = resolve_dois([entry_doi(entry) for entry in entries], refresh=refresh)
+
+    analyzer = PaperAnalyzer(category, model_name)
+    results = {}
+    translated = []
+    lock = threading.Lock()
+
+    def translate(paper_data):
+        """선택 작업: 제목 번역"""
+        title_kr = analyzer.translate(paper_data)
+        with lock:
+            paper_data['title'] = title_kr
+            paper_data.pop('title_pending', None)
+            translated.append(paper_data['doi'])
+
+    def enrich(key, record, extra):
+        """필수 작업: 요약, 키워드, 분류"""
+        paper_data = analyzer.analyze(record)
+        paper_data.update(extra)
+        if paper_data.get('title_pending'):
+            scheduler.submit(PRIORITY_OPTIONAL, 0, f"translate {paper_data['doi']}",
+                             lambda: translate(paper_data), stage='translate')
+        with lock:
+            results[key] = paper_data
+        logger.info(f"  Processed: {paper_data['title'][:60]}...")
+
+    for entry in entries:
+        doi = entry_doi(entry)
+        key = normalize_doi(doi)
+        old = previous_by_doi.get(key)
+        if key not in metadata and old:
+            # 메타데이터 조회가 실패하면 지난 결과를 유지
+            continue
+        fingerprint = source_hash(entry, metadata.get(key))
+        if old and old.get('source_hash') == fingerprint and not force:
+            if old.get('title_pending') and OPENROUTER_API_KEY:
+                scheduler.submit(PRIORITY_OPTIONAL, -1, f"translate {doi}",
+                                 lambda old=old: translate(old), stage='translate')
+            continue
+        record = build_record(entry, metadata.get(key))
+        extra = recommended_fields(entry, metadata.get(key), fingerprint)
+        scheduler.submit(PRIORITY_ESSENTIAL, 0, f"enrich {doi}",
+                         lambda key=key, record=record, extra=extra: enrich(key, record, extra), stage='enrich')
 
-    config = load_yaml(CONFIG_FILE)
+    def finish():
+        """끝난 작업의 결과를 원본 목록 순서대로 저장하고 분석한 항목 수를 반환합니다."""
+        papers = []
+        for entry in entries:
+            key = normalize_doi(entry_doi(entry))
+            paper = results.get(key) or previous_by_doi.get(key)
+            if paper:
+                papers.append(paper)
+        current_dois = {normalize_doi(paper['doi']) for paper in papers}
+        removed = sum(1 for paper in previous if normalize_doi(paper.get('doi')) not in current_dois)
+        pending = len(entries) - len(papers)
+
+        analyzer.log_local_hits(category_name, len(results))
+        if pending:
+            logger.warning(f"[{category_name}] {pending} recommended papers were not analyzed; "
+                           f"they will be retried on the next run.")
+        if results or translated or removed or [p['doi'] for p in papers] != [p.get('doi') for p in previous]:
+            save_yaml(papers, output_path)
+            logger.info(f"Updated '{output_path}': {len(results)} analyzed, {len(translated)} titles translated, "
+                        f"{removed} removed, {len(papers)} total.")
+        else:
+            logger.info(f"'{output_path}' is up to date ({len(papers)} papers).")
+        return len(results)
+
+    return finish
+
+def process_papers(category, model_name, archive_first=True, append=False):
+    """
+    특정 카테고리의 논문을 처리합니다 (카테고리 하나만 단독으로 처리할 때 사용).
+
+    Returns:
+        처리된 논문 수
+    """
+    from utils.scheduler import DeadlineScheduler
+
+    scheduler = DeadlineScheduler()
+    scheduler.start()
+    finish = prepare_papers(category, model_name, scheduler, archive_first=archive_first, append=append)
+    scheduler.join()
+    return finish()
+
+def _prepare_category(category, model_name, scheduler, archive_first=True, append=False):
+    """스레드 풀에서 카테고리 하나의 검색을 수행합니다. 실패는 해당 카테고리에만 격리됩니다."""
+    import threading
+    from utils.logging_setup import log_context
+
+    category_name = category.get('name', 'Unknown')
+    # 로그에서 카테고리별 흐름을 구분할 수 있도록 스레드 이름을 카테고리명으로 설정
+    threading.current_thread().name = category_name
+    try:
+        with log_context(category=category_name):
+            return prepare_papers(category, model_name, scheduler, archive_first=archive_first, append=append)
+    except Exception as e:
+        logger.error(f"[{category_name}] Category processing failed: {e}", exc_info=True)
+        return None
+
+def _finish_category(category, finish):
+    """카테고리 결과를 저장합니다. 실패하면 None을 반환합니다."""
+    from utils.logging_setup import log_context
+
+    category_name = category.get('name', 'Unknown')
+    if finish is None:
+        return None
+    try:
+        with log_context(category=category_name):
+            return finish()
+    except Exception as e:
+        logger.error(f"[{category_name}] Saving results failed: {e}", exc_info=True)
+        return None
+
+def load_config(config_file=CONFIG_FILE):
+    """설정 파일을 로드하고 검증합니다. 실패 시 None을 반환합니다."""
+    from utils.yaml_helper import load_yaml
+    from utils.config_validator import validate_config
+
+    config = load_yaml(config_file)
     if not config:
-        logger.error(f"Error: {CONFIG_FILE} not found or could not be loaded.")
-        return 1
+        logger.error(f"Error: {config_file} not found or could not be loaded.")
+        return None
 
     is_valid, errors = validate_config(config)
     if not is_valid:
         logger.error("Config validation failed.")
-        return 1
+        return None
+
+    return config
+
+def select_categories(config, names=None):
+    """이름으로 카테고리를 선택합니다. names가 비어 있으면 전체를 반환합니다."""
+    categories = config.get('categories', [])
+    if not names:
+        return categories
+    wanted = {name.upper() for name in names}
+    selected = [c for c in categories if c.get('name', '').upper() in wanted]
+    missing = wanted - {c.get('name', '').upper() for c in selected}
+    for name in sorted(missing):
+        logger.warning(f"Unknown category '{name}' ignored.")
+    return selected
+
+def configure_runtime(config):
+    """속도 제한, OpenRouter, 작업별 모델, 탈락 후보 기록, 본문 발췌, 로컬 모델, arXiv 응답 캐시, 실행 마감, DOI 조회 설정을 적용합니다."""
+    from utils.rate_limit import configure_rate_limits
+    from utils.openrouter_client import configure_openrouter
+    from utils.summarizer import configure_models
+    from utils.seen_index import configure_seen_index
+    from utils.fulltext import configure_fulltext
+    from utils.local_classifier import configure_local_models
+    from utils.http_cache import configure_http_cache
+    from utils.scheduler import configure_scheduler
+    from utils.doi_resolver import configure_doi_resolver
+
+    if not OPENROUTER_API_KEY:
+        logger.warning("OPENROUTER_API_KEY not set. Using local fallback summarizer.")
+
+    configure_rate_limits(config.get('concurrency', {}) or {})
+    configure_openrouter(config.get('openrouter'))
+    configure_models(config.get('models'))
+    configure_seen_index(config.get('seen_index'))
+    configure_fulltext(config.get('fulltext'))
+    configure_local_models(config.get('local_models'))
+    configure_http_cache(config.get('http_cache'), config.get('watch'))
+    configure_scheduler(config.get('schedule'))
+    configure_doi_resolver(config.get('doi_resolver'))
+
+def process_categories(config, categories, archive_first=True, append=False):
+    """
+    카테고리들을 동시에 검색하고, 모든 카테고리의 논문 분석을 하나의 마감 스케줄러에서 처리합니다.
+
+    Returns:
+        {카테고리 이름: 처리된 논문 수 (실패 시 None)}
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.keyword_vocab import save_vocabulary
+    from utils.local_classifier import load_local_models, save_local_models, is_enabled as local_models_enabled
+    from utils.scheduler import DeadlineScheduler
+
+    gemini_model = config.get('gemini_model', 'gemini-1.5-flash')
+    concurrency = config.get('concurrency', {}) or {}
+    max_workers = max(1, min(len(categories), concurrency.get('max_workers', 4)))
+    logger.info(f"Processing {len(categories)} categories with {max_workers} workers.")
+
+    if local_models_enabled():
+        # 지난 실행 이후 아카이브로 옮겨진 논문의 LLM 라벨까지 학습
+        archives = [c.get('paths', {}).get('archive') for c in config.get('categories', [])]
+        load_local_models().bootstrap([path for path in archives if path])
+
+    # 1. 분석 작업 스레드를 먼저 띄우고, 카테고리별 검색을 동시에 실행하며 찾은 논문을 바로 등록
+    #    (외부 API 제한은 전역 리미터가 공유, 대기 중인 작업은 우선순위/품질 점수 순으로 실행)
+    scheduler = DeadlineScheduler()
+    scheduler.start(max_workers=max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='category') as executor:
+        finishes = list(executor.map(
+            lambda category: _prepare_category(category, gemini_model, scheduler, archive_first, append),
+            categories
+        ))
+
+    # 2. 남은 분석 작업 실행 (마감까지 끝낼 수 없는 작업은 보류)
+    scheduler.join()
+
+    # 3. 끝난 작업의 결과 저장
+    total_counts = {
+        category.get('name', 'Unknown'): _finish_category(category, finish)
+        for category, finish in zip(categories, finishes)
+    }
+
+    # 모든 카테고리가 공유하는 키워드 어휘와 로컬 모델 저장
+    save_vocabulary()
+    save_local_models()
+    return total_counts
+
+def run_update(config, categories, archive_first=True, deadline_minutes=None):
+    """
+    카테고리들을 동시에 처리하고 결과를 요약합니다.
+
+    Args:
+        deadline_minutes: 실행 시간 예산 (분). None이면 `schedule.deadline_minutes` 설정을 사용
+    """
+    from utils.summarizer import save_latency_report
+    from utils.metrics import stage_metrics
+    from utils.http_cache import log_cache_stats
+    from utils.scheduler import start_run_deadline
+
+    configure_runtime(config)
+    start_run_deadline(deadline_minutes)
+    total_counts = process_categories(config, categories, archive_first=archive_first)
+
+    logger.info("\n=== 모든 카테고리 업데이트 완료 ===")
+    failed = [name for name, count in total_counts.items() if count is None]
+    for name, count in total_counts.items():
+        if count is None:
+            logger.info(f"  - {name}: 실패")
+        else:
+            logger.info(f"  - {name}: {count}개 논문 처리")
+
+    # 단계별 처리 시간과 작업별 응답 시간 (모델 라우팅 조정용)
+    stage_metrics.log_report()
+    log_cache_stats()
+    save_latency_report()
+
+    # 모든 카테고리가 실패한 경우에만 실패 코드 반환
+    return 1 if len(failed) == len(total_counts) else 0
+
+def cmd_run(config, categories, args):
+    """전체 일일 실행: 아카이브 -> 검색/분석 -> 인용 수 갱신 -> 피드 내보내기"""
+    from utils.scheduler import get_deadline, PRIORITY_NICE
+
+    status = run_update(config, categories, archive_first=True, deadline_minutes=args.deadline_minutes)
+    if (config.get('citations', {}) or {}).get('enabled', True):
+        # 인용 수 갱신은 부가 작업: 마감이 가까우면 다음 실행으로 미룸
+        if get_deadline().allows(PRIORITY_NICE):
+            cmd_citations(config, categories, args)
+        else:
+            logger.warning("Deadline reached: citation refresh deferred to the next run.")
+    cmd_export(config, categories, args)
+    return status
+
+def cmd_enrich(config, categories, args):
+    """검색 + AI 분석 후 today 파일을 갱신합니다 (아카이브 이동 없음)."""
+    return run_update(config, categories, archive_first=False, deadline_minutes=args.deadline_minutes)
+
+def cmd_fetch(config, categories, args):
+    """
+    후보 논문을 검색하여 출력합니다.
+
+    today/archive 데이터 파일은 변경하지 않지만, 검색 중에 쌓인 캐시는 저장합니다:
+    seen 인덱스의 탈락 기록(`.cache/seen_index.sqlite3`, 필터 설정별로 구분되므로 같은 설정의 다음 실행도 같은 결론),
+    h-index 캐시(`.cache/hindex_cache.json`), HTTP 응답 캐시(`.cache/http_cache.sqlite3`).
+    """
+    from utils.paper_fetcher import find_new_papers
+    from utils.seen_index import configure_seen_index
+    from utils.http_cache import configure_http_cache
+    from utils.scheduler import configure_scheduler
+
+    configure_seen_index(config.get('seen_index'))
+    # 필터 설정을 바꿔 가며 반복 실행할 때 같은 검색 페이지는 캐시에서 읽음
+    configure_http_cache(config.get('http_cache'), config.get('watch'))
+    configure_scheduler(config.get('schedule'))
+    for category in categories:
+        category_name = category.get('name', 'Unknown')
+        papers = find_new_papers(
+            archive_path=category.get('paths', {}).get('archive'),
+            num_target=category.get('num_papers_to_summarize', 3),
+            filter_config=category.get('filter_config', {}),
+            settings=category
+        )
+        print(f"[{category_name}] {len(papers)} candidates")
+        for paper in papers:
+            print(f"  - {paper.paper_id}  {paper.title[:90]}")
+    return 0
+
+def cmd_archive(config, categories, args):
+    """today 논문을 archive로 이동합니다."""
+    for category in categories:
+        paths = category.get('paths', {})
+        archive_today_paper(paths.get('today'), paths.get('archive'))
+    return 0
+
+def cmd_citations(config, categories, args):
+    """아카이브 논문의 인용 수를 Semantic Scholar batch API로 갱신합니다."""
+    from utils.citations import refresh_archive_citations
+
+    tiers = (config.get('citations', {}) or {}).get('refresh_tiers')
+    for category in categories:
+        try:
+            refresh_archive_citations(category.get('paths', {}).get('archive'), tiers=tiers)
+        except Exception as e:
+            logger.error(f"[{category.get('name', 'Unknown')}] Citation refresh failed: {e}", exc_info=True)
+    return 0
+
+def cmd_keywords(config, categories, args):
+    """
+    자유 형식 `keywords`가 남아 있는 데이터 파일을 정수 `keyword_ids`로 변환합니다.
+
+    `--rebuild`이면 현재 정규화 규칙으로 어휘를 다시 만들어 중복 ID를 합치고
+    데이터 파일과 로컬 모델의 키워드 ID를 새 번호로 바꿉니다.
+    """
+    from utils.keyword_vocab import migrate_data_files, rebuild_vocabulary
+
+    paths = []
+    for category in categories:
+        category_paths = category.get('paths', {})
+        paths.extend(p for p in (category_paths.get('today'), category_paths.get('archive')) if p)
+    migrated = migrate_data_files(paths)
+    print(f"{migrated} papers migrated to keyword IDs")
+
+    if getattr(args, 'rebuild', False):
+        from utils.local_classifier import load_local_models, save_local_models
+
+        mapping = rebuild_vocabulary(paths)
+        load_local_models().remap_keywords(mapping)
+        save_local_models()
+        merged = len(mapping) - len(set(mapping.values()))
+        print(f"Vocabulary rebuilt: {merged} duplicate keyword IDs merged")
+    return 0
+
+def cmd_export(config, categories, args):
+    """카테고리별 정적 JSON 피드와 공유 키워드 사전, 인용 수 파일을 내보냅니다."""
+    from utils.feed_exporter import export_category_feed, export_keyword_dictionary, export_citations
+
+    page_size = (config.get('export', {}) or {}).get('page_size', 10)
+    vocabulary = export_keyword_dictionary()
+    citations = export_citations()
+    results = [export_category_feed(category, page_size=page_size, vocabulary=vocabulary)
+               for category in categories]
+    return 0 if vocabulary and citations and all(results) else 1
+
+def cmd_stats(config, categories, args):
+    """로컬 데이터 파일 통계를 출력합니다."""
+    from utils.archive_stats import collect_category_stats
+
+    for category in categories:
+        stats = collect_category_stats(category)
+        print(f"[{stats['name']}] archive {stats['archive']} / today {stats['today']}"
+              f" ({stats['first_date']} ~ {stats['last_date']})")
+        for name, count in stats['categories'].items():
+            print(f"    {name}: {count}")
+        if stats['top_keywords']:
+            print("    top keywords: " + ", ".join(f"{kw}({n})" for kw, n in stats['top_keywords']))
+    return 0
+
+def cmd_classifier(config, categories, args):
+    """아카이브의 LLM 라벨과 로컬 모델의 일치도를 교차 검증으로 보고합니다."""
+    from utils.yaml_helper import load_yaml
+    from utils.local_classifier import configure_local_models, evaluate_agreement
+    from utils.http_cache import configure_http_cache
+    from utils.scheduler import configure_scheduler
+
+    configure_local_models(config.get('local_models'))
+    configure_http_cache(config.get('http_cache'), config.get('watch'))
+    configure_scheduler(config.get('schedule'))
+    papers = [paper for category in categories
+              for paper in (load_yaml(category.get('paths', {}).get('archive')) or [])]
+    report = evaluate_agreement(papers, folds=args.folds)
+
+    cat = report['category']
+    print(f"[category] {cat['papers']} papers, accuracy {cat['accuracy']}")
+    if cat['margin'] is None:
+        print("    no margin reaches the target agreement; the LLM is always used")
+    else:
+        print(f"    margin >= {cat['margin']}: coverage {cat['coverage']}, agreement {cat['accuracy_when_confident']}")
+    for name, accuracy in cat['per_class'].items():
+        print(f"    {name}: {accuracy}")
+    kw = report['keywords']
+    print(f"[keywords] {kw['papers']} papers, coverage {kw['coverage']}, "
+          f"precision {kw['precision_when_confident']}, recall {kw['recall_when_confident']}")
+    return 0
+
+def cmd_ingest(config, categories, args):
+    """arXiv 메타데이터 덤프를 백테스트용 말뭉치에 적재합니다."""
+    from utils.corpus import ingest_dump, query_categories
+
+    # 기본적으로 모든 카테고리의 검색어가 참조하는 arXiv 카테고리만 남김
+    keep = None if args.all_categories else query_categories(config.get('categories', []))
+    if keep is not None:
+        logger.info(f"Keeping records in: {', '.join(sorted(keep))}")
+    stats = ingest_dump(args.dump, db_path=args.db, categories=keep, since=args.since)
+    print(f"{stats['stored']} of {stats['read']} records stored "
+          f"({stats['skipped']} skipped, {stats['malformed']} malformed) in {stats['seconds']}s")
+    return 0 if stats['stored'] or not stats['read'] else 1
+
+def cmd_backtest(config, categories, args):
+    """현재 필터 설정을 말뭉치의 과거 기간에 적용한 결과를 출력합니다."""
+    from utils.corpus import open_corpus, load_archive_labels, backtest_category, default_backtest_range
+
+    conn = open_corpus(args.db)
+    try:
+        start, end = default_backtest_range(conn, args.days)
+        if start is None:
+            logger.error("The corpus is empty. Run `python -m update_papers ingest DUMP` first.")
+            return 1
+        start, end = args.start or start, args.end or end
+        # 정답/오답 라벨은 선택하지 않은 카테고리의 아카이브까지 모두 사용
+        labels = load_archive_labels(config.get('categories', []))
+        for category in categories:
+            report = backtest_category(category, start, end, labels, conn)
+            stages, daily, archive = report['stages'], report['daily'], report['archive']
+            print(f"[{report['name']}] {report['start']} ~ {report['end']} ({report['seconds']}s)")
+            print(f"    scanned {stages['scanned']}, tier match {stages['matched']} "
+                  f"({', '.join(f'T{tier} {n}' for tier, n in report['tiers'].items()) or '-'})")
+            print(f"    excluded {stages['excluded']}, not included {stages['not_included']}, "
+                  f"low score {stages['low_score']}, h-index unknown {stages['low_score_hindex_unknown']}, "
+                  f"passed {stages['passed']}")
+            print(f"    per day over {daily['days']} days: mean {daily['mean']}, p50 {daily['p50']}, "
+                  f"p90 {daily['p90']}, max {daily['max']}; "
+                  f"{daily['short_days']} days below {daily['target']}, {daily['zero_days']} days with none")
+            print(f"    archive: {archive['in_range']} in range, precision {archive['precision']} "
+                  f"({archive['true_positive']} TP / {archive['false_positive']} FP), recall {archive['recall']}")
+            for paper_id, outcome in archive['missed'][:args.show_missed]:
+                print(f"      missed {paper_id}: {outcome}")
+    finally:
+        conn.close()
+    return 0
+
+def cmd_recommended(config, categories, args):
+    """추천 논문 목록의 DOI 메타데이터를 조회하고, 바뀐 항목만 분석해 저장합니다."""
+    from utils.keyword_vocab import save_vocabulary
+    from utils.local_classifier import save_local_models
+    from utils.metrics import stage_metrics
+    from utils.scheduler import DeadlineScheduler, start_run_deadline
+
+    configure_runtime(config)
+    start_run_deadline(args.deadline_minutes)
+    gemini_model = config.get('gemini_model', 'gemini-1.5-flash')
+    max_workers = max(1, (config.get('concurrency', {}) or {}).get('max_workers', 4))
+
+    scheduler = DeadlineScheduler()
+    scheduler.start(max_workers=max_workers)
+    finishes = [prepare_recommended(category, gemini_model, scheduler, refresh=args.refresh, force=args.force)
+                for category in categories]
+    scheduler.join()
+    counts = [_finish_category(category, finish) for category, finish in zip(categories, finishes)]
+
+    save_vocabulary()
+    save_local_models()
+    stage_metrics.log_report()
+    return 1 if any(count is None for count in counts) else 0
+
+def cmd_watch(config, categories, args):
+    """arXiv 발표 시각에 맞춰 상주하며 새 논문을 분석되는 대로 today 파일에 반영합니다."""
+    import threading
+    from utils.yaml_helper import load_yaml, save_yaml
+    from utils.watch import AnnouncementSchedule, run_watch, install_stop_handlers, load_state, save_state
+    from utils.summarizer import save_latency_report
+    from utils.metrics import stage_metrics
+    from utils.http_cache import log_cache_stats
+
+    configure_runtime(config)
+
+    def poll_categories(targets):
+        """부족한 카테고리만 채우고, 새 논문이 있으면 피드를 다시 내보냅니다."""
+        counts = process_categories(config, targets, archive_first=False, append=True)
+        if any(counts.values()):
+            # 키워드 사전이 바뀌면 모든 카테고리 인덱스가 새 사전을 가리켜야 하므로 전체 내보내기
+            cmd_export(config, categories, args)
+        return counts
+
+    if args.once:
+        counts = poll_categories(categories)
+        return 1 if all(count is None for count in counts.values()) else 0
+
+    # 창 밖의 `--now` 폴링은 발표 주기를 시작하지 않으므로 모든 카테고리의 부족분을 채움
+    pending = list(categories)
+
+    def start_cycle(cycle):
+        if load_state().get('cycle') == cycle:
+            logger.info(f"Resuming watch cycle {cycle}; keeping today's papers.")
+        else:
+            # 새 발표분: 이전 today 논문을 아카이브로 옮기고 목록을 비움
+            for category in categories:
+                paths = category.get('paths', {})
+                archive_today_paper(paths.get('today'), paths.get('archive'))
+                save_yaml([], paths.get('today'))
+            save_state({'cycle': cycle})
+            if (config.get('citations', {}) or {}).get('enabled', True):
+                cmd_citations(config, categories, args)
+            cmd_export(config, categories, args)
+        pending[:] = categories
+
+    def poll():
+        poll_categories(pending)
+        pending[:] = [
+            category for category in pending
+            if len(load_yaml(category['paths']['today']) or []) < category.get('num_papers_to_summarize', 3)
+        ]
+        return not pending
+
+    def end_cycle(cycle):
+        stage_metrics.log_report()
+        stage_metrics.reset()
+        log_cache_stats()
+        save_latency_report()
+
+    stop_event = threading.Event()
+    install_stop_handlers(stop_event)
+    schedule = AnnouncementSchedule(config.get('watch'))
+    run_watch(schedule, start_cycle, poll, end_cycle=end_cycle, stop_event=stop_event, immediate=args.now)
+    return 0
+
+COMMANDS = {
+    'run': cmd_run,
+    'fetch': cmd_fetch,
+    'enrich': cmd_enrich,
+    'archive': cmd_archive,
+    'citations': cmd_citations,
+    'keywords': cmd_keywords,
+    'export': cmd_export,
+    'stats': cmd_stats,
+    'watch': cmd_watch,
+    'classifier': cmd_classifier,
+    'ingest': cmd_ingest,
+    'backtest': cmd_backtest,
+    'recommended': cmd_recommended,
+}
+
+def build_parser():
+    """명령행 파서를 생성합니다."""
+    parser = argparse.ArgumentParser(prog='update_papers', description='arXiv 2차전지 논문 수집/분석 파이프라인')
+    parser.add_argument('--config', default=CONFIG_FILE, help='설정 파일 경로 (기본: config.yml)')
+    parser.add_argument('-c', '--category', action='append', dest='categories', metavar='NAME',
+                        help='처리할 카테고리 이름 (여러 번 지정 가능, 기본: 전체)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='DEBUG 로그 출력')
+    parser.add_argument('--log-json', action='store_true', help='콘솔 로그도 JSON으로 출력 (파일 로그는 항상 JSON)')
+    parser.add_argument('--debug-sample-every', type=int, default=None, metavar='N',
+                        help='같은 DEBUG 메시지는 N개마다 하나만 기록 (1이면 전부, 기본 20)')
+    parser.add_argument('--deadline-minutes', type=float, default=None, metavar='M',
+                        help='run/enrich/recommended 실행 시간 예산 (분, 기본: config.yml의 schedule.deadline_minutes)')
+
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    subparsers.add_parser('run', help='전체 일일 실행 (기본값)')
+    subparsers.add_parser('fetch', help='후보 논문 검색만 수행 (데이터 파일은 그대로, 캐시는 갱신)')
+    subparsers.add_parser('enrich', help='검색 + AI 분석 후 today 파일 저장')
+    subparsers.add_parser('archive', help='today 논문을 archive로 이동')
+    subparsers.add_parser('citations', help='아카이브 논문 인용 수 일괄 갱신')
+    keywords_parser = subparsers.add_parser('keywords', help='키워드를 표준 어휘 ID로 변환')
+    keywords_parser.add_argument('--rebuild', action='store_true',
+                                 help='현재 정규화 규칙으로 어휘를 다시 만들어 중복 ID 병합')
+    subparsers.add_parser('export', help='정적 JSON 피드 내보내기')
+    subparsers.add_parser('stats', help='로컬 데이터 통계 출력')
+    watch_parser = subparsers.add_parser('watch', help='arXiv 발표 시각에 맞춰 상주하며 점진적으로 갱신')
+    watch_parser.add_argument('--now', action='store_true', help='다음 발표 창을 기다리기 전에 한 번 폴링 (아카이브 이동 없이 부족분만 채움)')
+    watch_parser.add_argument('--once', action='store_true', help='today 목록의 부족분을 한 번만 채우고 종료')
+    classifier_parser = subparsers.add_parser('classifier', help='로컬 모델과 LLM 라벨의 일치도 보고')
+    classifier_parser.add_argument('--folds', type=int, default=5, help='교차 검증 분할 수 (기본 5)')
+    ingest_parser = subparsers.add_parser('ingest', help='arXiv 메타데이터 덤프(JSON lines)를 백테스트용 말뭉치에 적재')
+    ingest_parser.add_argument('dump', help='덤프 파일 경로 (.json 또는 .json.gz)')
+    ingest_parser.add_argument('--db', default=None, help='말뭉치 DB 경로 (기본: .cache/corpus.sqlite3)')
+    ingest_parser.add_argument('--since', default=None, metavar='YYYY-MM-DD', help='이 날짜 이후 제출된 논문만 적재')
+    ingest_parser.add_argument('--all-categories', action='store_true',
+                               help='검색어가 참조하지 않는 arXiv 카테고리도 적재')
+    backtest_parser = subparsers.add_parser('backtest', help='현재 필터 설정을 말뭉치의 과거 기간에 적용')
+    backtest_parser.add_argument('--db', default=None, help='말뭉치 DB 경로 (기본: .cache/corpus.sqlite3)')
+    backtest_parser.add_argument('--start', default=None, metavar='YYYY-MM-DD', help='시작 제출일 (기본: 끝에서 --days일 전)')
+    backtest_parser.add_argument('--end', default=None, metavar='YYYY-MM-DD', help='끝 제출일 (기본: 말뭉치의 마지막 날)')
+    backtest_parser.add_argument('--days', type=int, default=90, help='기본 기간 길이 (일, 기본 90)')
+    backtest_parser.add_argument('--show-missed', type=int, default=10, metavar='N',
+                                 help='통과하지 못한 아카이브 논문을 N개까지 출력 (기본 10)')
+    recommended_parser = subparsers.add_parser('recommended', help='추천 논문 목록의 DOI 메타데이터 조회 + AI 분석')
+    recommended_parser.add_argument('--refresh', action='store_true', help='DOI 메타데이터 캐시를 무시하고 다시 조회')
+    recommended_parser.add_argument('--force', action='store_true', help='바뀌지 않은 항목도 다시 분석')
+    return parser
+
+def main(argv=None):
+    """메인 실행 함수"""
+    args = build_parser().parse_args(argv)
+
+    from utils.logging_setup import setup_logging, DEBUG_SAMPLE_EVERY
+    setup_logging(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        json_console=args.log_json,
+        debug_sample_every=args.debug_sample_every or DEBUG_SAMPLE_EVERY
+    )
 
     try:
-        gemini_model = config.get('gemini_model', 'gemini-1.5-flash')
-        categories = config.get('categories', [])
-        
+        config = load_config(args.config)
+        if not config:
+            return 1
+
+        categories = select_categories(config, args.categories)
         if not categories:
             logger.error("No 'categories' found in config.yml. Nothing to process.")
             return 1
-            
-        total_counts = {}
-        for category in categories:
-            count = process_papers(category, gemini_model)
-            total_counts[category.get('name', 'Unknown')] = count
 
-        logger.info("\n=== 모든 카테고리 업데이트 완료 ===")
-        for name, count in total_counts.items():
-            logger.info(f"  - {name}: {count}개 논문 처리")
-        
-        return 0
-        
+        command = COMMANDS[args.command or 'run']
+        return command(config, categories, args)
+
     except Exception as e:
         logger.error(f"Fatal error in main: {e}", exc_info=True)
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
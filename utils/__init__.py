@@ -1,32 +1,39 @@
 """
 논문 업데이트 유틸리티 모듈
+
+하위 모듈(arxiv, requests 등 무거운 의존성 포함)은 실제로 사용될 때 로드됩니다.
+`from utils import find_new_papers`처럼 접근하면 해당 모듈만 임포트합니다.
 """
-from utils.yaml_helper import load_yaml, save_yaml
-from utils.config_validator import validate_config
-from utils.paper_fetcher import find_new_papers
-from utils.summarizer import (
-    summarize_with_gemini,
-    translate_title,
-    extract_keywords_with_gemini,
-    classify_category_with_gemini
-)
-from utils.quality_filter import (
-    calculate_paper_quality_score,
-    should_exclude_paper,
-    check_include_keywords
-)
+import importlib
+
+# 공개 이름 -> 정의된 하위 모듈
+_LAZY_EXPORTS = {
+    'load_yaml': 'utils.yaml_helper',
+    'save_yaml': 'utils.yaml_helper',
+    'validate_config': 'utils.config_validator',
+    'find_new_papers': 'utils.paper_fetcher',
+    'iter_new_papers': 'utils.paper_fetcher',
+    'summarize_with_gemini': 'utils.summarizer',
+    'translate_title': 'utils.summarizer',
+    'extract_keywords_with_gemini': 'utils.summarizer',
+    'classify_category_with_gemini': 'utils.summarizer',
+    'summarize_locally': 'utils.local_summarizer',
+    'calculate_paper_quality_score': 'utils.quality_filter',
+    'should_exclude_paper': 'utils.quality_filter',
+    'check_include_keywords': 'utils.quality_filter',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'utils' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    'load_yaml',
-    'save_yaml',
-    'validate_config',
-    'find_new_papers',
-    'summarize_with_gemini',
-    'translate_title',
-    'extract_keywords_with_gemini',
-    'classify_category_with_gemini',
-    'calculate_paper_quality_score',
-    'should_exclude_paper',
-    'check_include_keywords',
-]
 
+def __dir__():
+    return sorted(list(globals()) + __all__)
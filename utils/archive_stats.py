@@ -0,0 +1,39 @@
+"""
+아카이브 통계 유틸리티
+
+네트워크 없이 로컬 데이터 파일만으로 카테고리별 현황을 집계합니다.
+"""
+from collections import Counter
+from utils.yaml_helper import load_yaml
+from utils.keyword_vocab import load_vocabulary
+
+
+def collect_category_stats(category, top_n=10):
+    """
+    카테고리 하나의 아카이브/오늘의 논문 통계를 계산합니다.
+
+    Args:
+        category: config.yml의 카테고리 설정 딕셔너리
+        top_n: 상위 키워드 개수
+
+    Returns:
+        통계 딕셔너리
+    """
+    paths = category.get('paths', {})
+    archive_papers = load_yaml(paths.get('archive', '')) or []
+    today_papers = load_yaml(paths.get('today', '')) or []
+
+    category_counts = Counter(p.get('category', '분류 안됨') for p in archive_papers)
+    keyword_counts = Counter(kid for p in archive_papers for kid in (p.get('keyword_ids') or []))
+    vocabulary = load_vocabulary()
+    dates = sorted(str(p.get('date')) for p in archive_papers if p.get('date'))
+
+    return {
+        'name': category.get('name', 'Unknown'),
+        'archive': len(archive_papers),
+        'today': len(today_papers),
+        'first_date': dates[0] if dates else None,
+        'last_date': dates[-1] if dates else None,
+        'categories': dict(category_counts.most_common()),
+        'top_keywords': [(vocabulary.label(kid), n) for kid, n in keyword_counts.most_common(top_n)],
+    }
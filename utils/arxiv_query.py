@@ -0,0 +1,213 @@
+"""
+arXiv 검색어 로컬 평가기
+
+`config.yml`의 계층 검색어(`search_queries`)를 arXiv API에 보내지 않고 말뭉치 레코드에 직접 적용합니다.
+백테스트(utils.corpus)에서 검색 단계를 재현하는 데 사용합니다.
+
+지원 문법 (arXiv API 검색어의 부분집합):
+- 필드 접두사: `ti:`, `abs:`, `au:`, `co:`, `jr:`, `cat:`, `all:` (접두사가 없으면 `all`)
+- 연산자: `AND`, `OR`, `ANDNOT`, 괄호. 연산자 없이 이어진 항은 AND로 봄
+- 큰따옴표 구: 토큰이 연속으로 나와야 일치
+- `cat:`은 카테고리 이름과 정확히 비교하며, 점이 없으면 상위 아카이브(`cond-mat`)도 일치, `*`로 끝나면 접두사 일치
+
+arXiv의 실제 검색은 형태소 분석과 관련도 순위를 쓰므로, 여기서는 대소문자 무시 + 간단한 복수형 정규화로 근사합니다.
+"""
+import re
+from functools import lru_cache
+
+FIELDS = ('ti', 'abs', 'au', 'co', 'jr', 'cat', 'all')
+
+_TOKEN_RE = re.compile(r'\(|\)|"[^"]*"|[^\s()"]+')
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+class QuerySyntaxError(ValueError):
+    """검색어를 해석할 수 없을 때 발생"""
+
+
+@lru_cache(maxsize=1 << 16)
+def _stem(word):
+    """복수형만 단수로 맞추는 간단한 정규화 (cathodes -> cathode, batteries -> battery)"""
+    if len(word) > 4 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if len(word) > 4 and word.endswith('es') and word[-3] in 'sxz':
+        return word[:-2]
+    if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        return word[:-1]
+    return word
+
+
+def tokenize(text):
+    """검색/본문 텍스트를 정규화한 단어 목록으로 바꿉니다."""
+    return [_stem(word) for word in _WORD_RE.findall((text or '').lower())]
+
+
+class Document:
+    """필드별 토큰을 처음 필요할 때 한 번만 계산하는 평가 대상"""
+
+    __slots__ = ('fields', 'categories', '_tokens')
+
+    def __init__(self, title='', abstract='', authors='', comments='', journal_ref='', categories=()):
+        self.fields = {'ti': title, 'abs': abstract, 'au': authors, 'co': comments, 'jr': journal_ref}
+        self.categories = {c.lower() for c in categories}
+        self._tokens = {}
+
+    def tokens(self, field):
+        """(토큰 목록, 토큰 집합). `all`은 필드 사이에 구분자를 넣어 필드를 넘는 구 일치를 막음"""
+        cached = self._tokens.get(field)
+        if cached is None:
+            if field == 'all':
+                words = []
+                for name in ('ti', 'abs', 'au', 'co', 'jr'):
+                    words.extend(self.tokens(name)[0])
+                    words.append(None)
+            else:
+                words = tokenize(self.fields.get(field))
+            cached = self._tokens[field] = (words, set(words))
+        return cached
+
+
+class Term:
+    """필드 하나에 대한 단어 또는 구"""
+
+    __slots__ = ('field', 'text', 'words')
+
+    def __init__(self, field, text):
+        self.field = field
+        self.text = text
+        self.words = tokenize(text) if field != 'cat' else []
+
+    def matches(self, doc):
+        if self.field == 'cat':
+            name = self.text.lower()
+            if name.endswith('*'):
+                return any(c.startswith(name[:-1]) for c in doc.categories)
+            if '.' not in name:
+                return any(c == name or c.startswith(name + '.') for c in doc.categories)
+            return name in doc.categories
+
+        if not self.words:
+            return False
+        words, word_set = doc.tokens(self.field)
+        if not all(w in word_set for w in self.words):
+            return False
+        if len(self.words) == 1:
+            return True
+        n = len(self.words)
+        first = self.words[0]
+        return any(words[i] == first and words[i:i + n] == self.words for i in range(len(words) - n + 1))
+
+    def categories(self):
+        # 말뭉치 카테고리 색인에는 상위 아카이브 이름도 들어 있으므로 그대로 조회 가능
+        if self.field == 'cat' and not self.text.endswith('*'):
+            return {self.text.lower()}
+        return None
+
+    def __repr__(self):
+        return f'{self.field}:{self.text!r}'
+
+
+class Operator:
+    """AND / OR / ANDNOT 노드"""
+
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def matches(self, doc):
+        if self.op == 'AND':
+            return self.left.matches(doc) and self.right.matches(doc)
+        if self.op == 'OR':
+            return self.left.matches(doc) or self.right.matches(doc)
+        return self.left.matches(doc) and not self.right.matches(doc)
+
+    def categories(self):
+        """
+        일치하려면 반드시 속해야 하는 카테고리 집합 (하나라도 속하면 됨). 제약이 없으면 None.
+
+        말뭉치에서 후보를 카테고리 색인으로 먼저 좁히는 데 사용합니다.
+        """
+        left = self.left.categories()
+        if self.op == 'OR':
+            right = self.right.categories()
+            return left | right if left is not None and right is not None else None
+        if self.op == 'AND':
+            right = self.right.categories()
+            constrained = [c for c in (left, right) if c is not None]
+            return min(constrained, key=len) if constrained else None
+        return left
+
+    def __repr__(self):
+        return f'({self.left!r} {self.op} {self.right!r})'
+
+
+class _Parser:
+    """재귀 하강 파서: expr := term ((AND | OR | ANDNOT)? term)*  (왼쪽부터 결합)"""
+
+    def __init__(self, query):
+        self.query = query
+        self.tokens = _TOKEN_RE.findall(query or '')
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def next(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise QuerySyntaxError(f"Empty query: {self.query!r}")
+        node = self.expression()
+        if self.peek() is not None:
+            raise QuerySyntaxError(f"Unexpected '{self.peek()}' in query: {self.query!r}")
+        return node
+
+    def expression(self):
+        node = self.term()
+        while self.peek() not in (None, ')'):
+            op = 'AND'
+            if self.peek() in ('AND', 'OR', 'ANDNOT'):
+                op = self.next()
+            node = Operator(op, node, self.term())
+        return node
+
+    def term(self):
+        token = self.next()
+        if token is None:
+            raise QuerySyntaxError(f"Unexpected end of query: {self.query!r}")
+        if token == '(':
+            node = self.expression()
+            if self.next() != ')':
+                raise QuerySyntaxError(f"Unbalanced parentheses in query: {self.query!r}")
+            return node
+        if token in (')', 'AND', 'OR', 'ANDNOT'):
+            raise QuerySyntaxError(f"Unexpected '{token}' in query: {self.query!r}")
+
+        field = 'all'
+        prefix, sep, rest = token.partition(':')
+        if sep and prefix.lower() in FIELDS:
+            field = prefix.lower()
+            token = rest
+            if not token:
+                # `ti:"solid electrolyte"` 처럼 접두사 뒤에 구가 따로 토큰화된 경우
+                token = self.next() or ''
+        return Term(field, token.strip('"'))
+
+
+def parse_query(query):
+    """
+    arXiv 검색어를 평가 가능한 트리로 해석합니다.
+
+    Returns:
+        `matches(Document)`와 `categories()`를 가진 노드
+
+    Raises:
+        QuerySyntaxError: 괄호가 맞지 않거나 연산자 위치가 잘못된 경우
+    """
+    return _Parser(query).parse()
@@ -5,6 +5,7 @@ import json
 import os
 import time
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -12,11 +13,21 @@ CACHE_DIR = '.cache'
 CACHE_FILE = os.path.join(CACHE_DIR, 'hindex_cache.json')
 CACHE_TTL = 7 * 24 * 60 * 60  # 7일 (초 단위)
 
+# 여러 카테고리 스레드가 같은 캐시 파일을 읽고 쓰므로 파일 접근을 직렬화
+_cache_lock = threading.Lock()
+
 
 def ensure_cache_dir():
     """캐시 디렉토리가 없으면 생성"""
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+
+def _read_raw_cache():
+    """타임스탬프가 포함된 원본 캐시 데이터를 읽습니다 (잠금은 호출자가 보유)."""
+    if not os.path.exists(CACHE_FILE):
+        return {}
+    with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
 def load_cache():
@@ -28,12 +39,9 @@ def load_cache():
     """
     ensure_cache_dir()
     
-    if not os.path.exists(CACHE_FILE):
-        return {}
-    
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with _cache_lock:
+            data = _read_raw_cache()
             
         # 만료된 항목 제거
         current_time = time.time()
@@ -64,23 +72,33 @@ def save_cache(cache):
     """
     캐시를 파일에 저장합니다.
     
+    다른 스레드가 그 사이 저장한 항목을 잃지 않도록 디스크의 캐시와 병합한 뒤
+    임시 파일을 거쳐 원자적으로 교체합니다.
+    
     Args:
         cache: 캐시 딕셔너리
     """
     ensure_cache_dir()
     
     try:
-        # 타임스탬프와 함께 저장
-        data_with_timestamp = {}
-        current_time = time.time()
-        for key, value in cache.items():
-            data_with_timestamp[key] = {
-                'value': value,
-                'timestamp': current_time
-            }
-        
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data_with_timestamp, f, ensure_ascii=False, indent=2)
+        with _cache_lock:
+            try:
+                data_with_timestamp = _read_raw_cache()
+            except (OSError, ValueError):
+                data_with_timestamp = {}
+            
+            # 타임스탬프와 함께 저장
+            current_time = time.time()
+            for key, value in cache.items():
+                data_with_timestamp[key] = {
+                    'value': value,
+                    'timestamp': current_time
+                }
+            
+            tmp_file = CACHE_FILE + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data_with_timestamp, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, CACHE_FILE)
     except Exception as e:
         logger.warning(f"Error saving cache: {e}")
 
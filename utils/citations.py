@@ -0,0 +1,218 @@
+"""
+인용 수 일괄 갱신 유틸리티
+
+Semantic Scholar의 batch paper 엔드포인트로 아카이브 논문의 인용 수를 한 번에 조회하여
+별도의 작은 파일(`_data/citations.json`, 논문 ID -> 인용 수/갱신 날짜)에 저장합니다.
+방문자 브라우저마다 논문별로 API를 호출하던 방식을 대체합니다.
+
+인용 수는 아카이브 항목에 쓰지 않습니다. 아카이브 항목은 내용 해시 피드 청크에 그대로 들어가므로,
+매일 바뀌는 인용 수가 섞이면 오래된 청크의 URL까지 바뀌기 때문입니다.
+피드에는 `export_citations()`가 인용 수만 담은 고정 URL 파일을 따로 내보내고, 워커가 불러올 때 합칩니다.
+
+갱신 주기는 논문 나이에 따라 다릅니다 (최근 논문일수록 자주 갱신).
+"""
+import os
+import re
+import json
+import time
+import logging
+from datetime import datetime, date, timezone, timedelta
+
+import requests
+
+from utils.yaml_helper import load_yaml
+from utils.rate_limit import SEMANTIC_SCHOLAR_LIMITER
+from utils.endpoints import SEMANTIC_SCHOLAR_API_URL
+from utils.metrics import stage_timer
+from utils.http import get_session
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+BATCH_URL = f"{SEMANTIC_SCHOLAR_API_URL}/paper/batch"
+BATCH_SIZE = 500  # batch 엔드포인트의 요청당 최대 ID 수
+
+# (논문 나이 상한(일), 갱신 주기(일)) - 상한이 None이면 나머지 전체
+DEFAULT_REFRESH_TIERS = [
+    {'max_age_days': 30, 'refresh_days': 1},
+    {'max_age_days': 180, 'refresh_days': 7},
+    {'max_age_days': None, 'refresh_days': 30},
+]
+
+CITATIONS_FILE = os.path.join('_data', 'citations.json')
+
+_ARXIV_ID_RE = re.compile(r'^(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})(v\d+)?$')
+_DOI_LINK_PREFIX = 'https://doi.org/'
+
+
+def to_semantic_scholar_id(paper):
+    """
+    아카이브 항목을 Semantic Scholar 논문 ID로 변환합니다.
+
+    Args:
+        paper: 아카이브 논문 딕셔너리
+
+    Returns:
+        'arXiv:2508.00236' 또는 'DOI:10.xxx/yyy' 형식 문자열, 변환할 수 없으면 None
+    """
+    paper_id = str(paper.get('paper_id') or '')
+    match = _ARXIV_ID_RE.match(paper_id)
+    if match:
+        return f"arXiv:{match.group(1)}"
+
+    link = str(paper.get('link') or '')
+    if link.startswith(_DOI_LINK_PREFIX):
+        return f"DOI:{link[len(_DOI_LINK_PREFIX):]}"
+    return None
+
+
+def _parse_date(value):
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+def load_citations(path=CITATIONS_FILE):
+    """
+    인용 수 저장 파일을 읽습니다.
+
+    Returns:
+        {paper_id: {'count': 인용 수 또는 None, 'updated': 'YYYY-MM-DD'}} (파일이 없으면 빈 딕셔너리)
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Error loading citations from {path}: {e}")
+        return {}
+
+
+def save_citations(citations, path=CITATIONS_FILE):
+    """인용 수 저장 파일을 원자적으로 교체합니다 (키 정렬, 한 줄에 논문 하나)."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(citations, f, ensure_ascii=False, indent=0, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def is_refresh_due(paper, today, tiers=None, updated=None):
+    """
+    논문 나이별 갱신 주기에 따라 인용 수 갱신이 필요한지 확인합니다.
+
+    Args:
+        updated: 마지막 갱신 날짜 (인용 수 저장 파일의 `updated`, 없으면 갱신 필요)
+    """
+    updated = _parse_date(updated)
+    if updated is None:
+        return True
+
+    published = _parse_date(paper.get('date')) or today
+    age_days = (today - published).days
+    for tier in tiers or DEFAULT_REFRESH_TIERS:
+        max_age = tier.get('max_age_days')
+        if max_age is None or age_days <= max_age:
+            return (today - updated).days >= tier.get('refresh_days', 1)
+    return False
+
+
+def fetch_citation_counts(s2_ids):
+    """
+    Semantic Scholar batch 엔드포인트로 인용 수를 조회합니다.
+
+    Args:
+        s2_ids: Semantic Scholar 논문 ID 리스트
+
+    Returns:
+        {s2_id: citation_count} 딕셔너리
+        (조회에 성공했지만 찾지 못한 논문은 None, 요청이 실패한 배치는 제외)
+    """
+    headers = {}
+    api_key = os.environ.get('SEMANTIC_SCHOLAR_API_KEY')
+    if api_key:
+        headers['x-api-key'] = api_key
+
+    counts = {}
+    for start in range(0, len(s2_ids), BATCH_SIZE):
+        batch = s2_ids[start:start + BATCH_SIZE]
+        try:
+            with SEMANTIC_SCHOLAR_LIMITER, stage_timer('citation_batch', len(batch)):
+                response = get_session().post(BATCH_URL, params={'fields': 'citationCount'},
+                                         json={'ids': batch}, headers=headers, timeout=30)
+                if response.status_code == 429:
+                    logger.warning("Rate limit exceeded for citation batch. Retrying in 5 seconds...")
+                    time.sleep(5.0)
+                    response = get_session().post(BATCH_URL, params={'fields': 'citationCount'},
+                                             json={'ids': batch}, headers=headers, timeout=30)
+            if response.status_code != 200:
+                logger.warning(f"Semantic Scholar batch API error: {response.status_code}")
+                continue
+
+            # 응답은 요청한 ID 순서와 같고, 찾지 못한 논문은 null
+            for s2_id, item in zip(batch, response.json()):
+                counts[s2_id] = item.get('citationCount') if item else None
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Error fetching citation batch: {e}")
+        except ValueError as e:
+            logger.warning(f"Error parsing citation batch response: {e}")
+
+    return counts
+
+
+def refresh_archive_citations(archive_path, tiers=None, today=None, citations_path=CITATIONS_FILE):
+    """
+    아카이브 논문 중 갱신 주기가 된 논문의 인용 수를 일괄 갱신합니다.
+
+    아카이브 파일은 읽기만 하고, 결과는 인용 수 저장 파일(`citations_path`)에 씁니다.
+
+    Args:
+        archive_path: 아카이브 YAML 파일 경로
+        tiers: 논문 나이별 갱신 주기 설정 (None이면 기본값)
+        today: 기준 날짜 (테스트용, 기본은 오늘 KST)
+        citations_path: 인용 수 저장 파일 경로
+
+    Returns:
+        인용 수가 갱신된 논문 수
+    """
+    today = today or datetime.now(KST).date()
+    archive_papers = load_yaml(archive_path) or []
+    citations = load_citations(citations_path)
+
+    due = {}
+    for paper in archive_papers:
+        s2_id = to_semantic_scholar_id(paper)
+        paper_id = paper.get('paper_id')
+        if s2_id and paper_id and is_refresh_due(paper, today, tiers, (citations.get(paper_id) or {}).get('updated')):
+            due.setdefault(s2_id, []).append(paper_id)
+
+    if not due:
+        logger.info(f"No citation refresh due for {archive_path}.")
+        return 0
+
+    logger.info(f"Refreshing citations for {len(due)} papers in {archive_path}...")
+    counts = fetch_citation_counts(list(due))
+
+    updated = 0
+    today_str = today.strftime('%Y-%m-%d')
+    for s2_id, paper_ids in due.items():
+        if s2_id not in counts:
+            continue
+        # 찾지 못한 논문도 갱신 날짜를 기록하여 매일 재조회하지 않도록 함 (이전 인용 수는 유지)
+        for paper_id in paper_ids:
+            entry = citations.setdefault(paper_id, {'count': None})
+            if counts[s2_id] is not None:
+                entry['count'] = counts[s2_id]
+                updated += 1
+            entry['updated'] = today_str
+
+    if counts:
+        save_citations(citations, citations_path)
+    logger.info(f"Updated citation counts for {updated} papers in {archive_path}.")
+    return updated
@@ -5,6 +5,24 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# config.yml `models`에 지정할 수 있는 작업 이름 (utils.summarizer.TASKS와 같음)
+MODEL_TASKS = ('summary', 'translation', 'keywords', 'classification')
+
+def _validate_models(models, prefix):
+    """Helper function to validate a per-task models mapping."""
+    errors = []
+    if not isinstance(models, dict):
+        errors.append(f"{prefix} must be a dictionary.")
+        return errors
+
+    for task, model in models.items():
+        if task not in MODEL_TASKS:
+            errors.append(f"Unknown task '{task}' in {prefix} (expected one of {', '.join(MODEL_TASKS)}).")
+        elif not isinstance(model, str) or not model:
+            errors.append(f"{prefix}.{task} must be a non-empty model name.")
+
+    return errors
+
 def _validate_category(category, index):
     """Helper function to validate a single category."""
     errors = []
@@ -26,6 +44,11 @@ def _validate_category(category, index):
     if 'search_queries' in category and not isinstance(category['search_queries'], list):
         errors.append(f"{prefix}.search_queries must be a list.")
 
+    if 'llm_min_score' in category and not isinstance(category['llm_min_score'], (int, float)):
+        errors.append(f"{prefix}.llm_min_score must be a number.")
+    if 'models' in category:
+        errors.extend(_validate_models(category['models'], f"{prefix}.models"))
+
     # paths 내부 검증
     if 'paths' in category:
         paths = category['paths']
@@ -36,6 +59,9 @@ def _validate_category(category, index):
                 errors.append(f"Missing or empty 'today' path in {prefix}.paths")
             if 'archive' not in paths or not paths['archive']:
                 errors.append(f"Missing or empty 'archive' path in {prefix}.paths")
+            # 추천 논문 목록은 선택 사항이지만, 원본과 결과 경로를 함께 지정해야 함
+            if bool(paths.get('recommended')) != bool(paths.get('recommended_papers')):
+                errors.append(f"{prefix}.paths.recommended and recommended_papers must be set together.")
 
     # filter_config 내부 검증 (선택적)
     if 'filter_config' in category:
@@ -50,6 +76,192 @@ def _validate_category(category, index):
 
     return errors
 
+def _validate_concurrency(concurrency):
+    """Helper function to validate the optional concurrency section."""
+    errors = []
+    if not isinstance(concurrency, dict):
+        errors.append("concurrency must be a dictionary.")
+        return errors
+
+    for key in ('max_workers', 'openrouter_max_concurrent', 'arxiv_pdf_max_concurrent', 'crossref_max_concurrent'):
+        if key in concurrency and (not isinstance(concurrency[key], int) or concurrency[key] < 1):
+            errors.append(f"concurrency.{key} must be a positive integer.")
+    for key in ('arxiv_min_interval', 'semantic_scholar_min_interval', 'arxiv_pdf_min_interval',
+                'crossref_min_interval'):
+        if key in concurrency and (not isinstance(concurrency[key], (int, float)) or concurrency[key] < 0):
+            errors.append(f"concurrency.{key} must be a non-negative number.")
+
+    return errors
+
+def _validate_openrouter(openrouter):
+    """Helper function to validate the optional openrouter section."""
+    errors = []
+    if not isinstance(openrouter, dict):
+        errors.append("openrouter must be a dictionary.")
+        return errors
+
+    fallback_models = openrouter.get('fallback_models', [])
+    if not isinstance(fallback_models, list) or not all(isinstance(m, str) for m in fallback_models):
+        errors.append("openrouter.fallback_models must be a list of model names.")
+    for key in ('min_timeout', 'max_timeout'):
+        if key in openrouter and (not isinstance(openrouter[key], (int, float)) or openrouter[key] <= 0):
+            errors.append(f"openrouter.{key} must be a positive number.")
+
+    return errors
+
+def _validate_citations(citations):
+    """Helper function to validate the optional citations section."""
+    errors = []
+    if not isinstance(citations, dict):
+        errors.append("citations must be a dictionary.")
+        return errors
+
+    tiers = citations.get('refresh_tiers', [])
+    if not isinstance(tiers, list):
+        errors.append("citations.refresh_tiers must be a list.")
+        return errors
+    for i, tier in enumerate(tiers):
+        if not isinstance(tier, dict):
+            errors.append(f"citations.refresh_tiers[{i}] must be a dictionary.")
+            continue
+        refresh_days = tier.get('refresh_days')
+        if not isinstance(refresh_days, int) or refresh_days <= 0:
+            errors.append(f"citations.refresh_tiers[{i}].refresh_days must be a positive integer.")
+        max_age = tier.get('max_age_days')
+        if max_age is not None and (not isinstance(max_age, int) or max_age < 0):
+            errors.append(f"citations.refresh_tiers[{i}].max_age_days must be a non-negative integer.")
+
+    return errors
+
+def _validate_seen_index(seen_index):
+    """Helper function to validate the optional seen_index section."""
+    errors = []
+    if not isinstance(seen_index, dict):
+        errors.append("seen_index must be a dictionary.")
+        return errors
+
+    if 'enabled' in seen_index and not isinstance(seen_index['enabled'], bool):
+        errors.append("seen_index.enabled must be a boolean.")
+    ttl_days = seen_index.get('ttl_days')
+    if ttl_days is not None and (not isinstance(ttl_days, int) or ttl_days <= 0):
+        errors.append("seen_index.ttl_days must be a positive integer.")
+
+    return errors
+
+def _validate_fulltext(fulltext):
+    """Helper function to validate the optional fulltext section."""
+    errors = []
+    if not isinstance(fulltext, dict):
+        errors.append("fulltext must be a dictionary.")
+        return errors
+
+    if 'enabled' in fulltext and not isinstance(fulltext['enabled'], bool):
+        errors.append("fulltext.enabled must be a boolean.")
+    for key in ('max_pdf_mb', 'max_pages', 'max_chars', 'excerpt_chars'):
+        if key in fulltext and (not isinstance(fulltext[key], (int, float)) or fulltext[key] <= 0):
+            errors.append(f"fulltext.{key} must be a positive number.")
+
+    return errors
+
+def _validate_schedule(schedule):
+    """Helper function to validate the optional schedule section."""
+    errors = []
+    if not isinstance(schedule, dict):
+        errors.append("schedule must be a dictionary.")
+        return errors
+
+    deadline = schedule.get('deadline_minutes')
+    if deadline is not None and (not isinstance(deadline, (int, float)) or deadline <= 0):
+        errors.append("schedule.deadline_minutes must be a positive number or null.")
+    reserve = schedule.get('reserve_minutes', 0)
+    if not isinstance(reserve, (int, float)) or reserve < 0:
+        errors.append("schedule.reserve_minutes must be a non-negative number.")
+    elif deadline is not None and isinstance(deadline, (int, float)) and reserve >= deadline:
+        errors.append("schedule.reserve_minutes must be smaller than schedule.deadline_minutes.")
+
+    return errors
+
+def _validate_http_cache(http_cache):
+    """Helper function to validate the optional http_cache section."""
+    errors = []
+    if not isinstance(http_cache, dict):
+        errors.append("http_cache must be a dictionary.")
+        return errors
+
+    if 'enabled' in http_cache and not isinstance(http_cache['enabled'], bool):
+        errors.append("http_cache.enabled must be a boolean.")
+    if 'ttl_minutes' in http_cache and (not isinstance(http_cache['ttl_minutes'], (int, float))
+                                        or http_cache['ttl_minutes'] < 0):
+        errors.append("http_cache.ttl_minutes must be a non-negative number.")
+    if 'max_mb' in http_cache and (not isinstance(http_cache['max_mb'], (int, float)) or http_cache['max_mb'] <= 0):
+        errors.append("http_cache.max_mb must be a positive number.")
+
+    return errors
+
+def _validate_local_models(local_models):
+    """Helper function to validate the optional local_models section."""
+    errors = []
+    if not isinstance(local_models, dict):
+        errors.append("local_models must be a dictionary.")
+        return errors
+
+    if 'enabled' in local_models and not isinstance(local_models['enabled'], bool):
+        errors.append("local_models.enabled must be a boolean.")
+    for key in ('target_agreement', 'keyword_min_probability'):
+        value = local_models.get(key, 0.5)
+        if not isinstance(value, (int, float)) or not 0 < value <= 1:
+            errors.append(f"local_models.{key} must be a number in (0, 1].")
+    for key in ('keyword_min_matches', 'min_training_papers'):
+        if key in local_models and (not isinstance(local_models[key], int) or local_models[key] < 1):
+            errors.append(f"local_models.{key} must be a positive integer.")
+
+    return errors
+
+def _validate_watch(watch):
+    """Helper function to validate the optional watch section."""
+    errors = []
+    if not isinstance(watch, dict):
+        errors.append("watch must be a dictionary.")
+        return errors
+
+    announce_time = str(watch.get('announce_time', '20:00'))
+    parts = announce_time.split(':')
+    if len(parts) != 2 or not all(p.isdigit() for p in parts) or int(parts[0]) > 23 or int(parts[1]) > 59:
+        errors.append("watch.announce_time must be in HH:MM format.")
+    days = watch.get('announce_days', ['sun'])
+    valid_days = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+    if not isinstance(days, list) or not days or not all(str(d).lower()[:3] in valid_days for d in days):
+        errors.append("watch.announce_days must be a non-empty list of weekday names.")
+    for key in ('lead_minutes', 'window_minutes'):
+        if key in watch and (not isinstance(watch[key], (int, float)) or watch[key] < 0):
+            errors.append(f"watch.{key} must be a non-negative number.")
+    if 'poll_minutes' in watch and (not isinstance(watch['poll_minutes'], (int, float)) or watch['poll_minutes'] <= 0):
+        errors.append("watch.poll_minutes must be a positive number.")
+    if 'timezone' in watch:
+        try:
+            from zoneinfo import ZoneInfo
+            ZoneInfo(str(watch['timezone']))
+        except Exception:
+            errors.append(f"watch.timezone '{watch['timezone']}' is not a known time zone.")
+
+    return errors
+
+def _validate_doi_resolver(doi_resolver):
+    """Helper function to validate the optional doi_resolver section."""
+    errors = []
+    if not isinstance(doi_resolver, dict):
+        errors.append("doi_resolver must be a dictionary.")
+        return errors
+
+    resolvers = doi_resolver.get('resolvers', ['crossref'])
+    if not isinstance(resolvers, list) or not resolvers or not all(isinstance(r, str) and r for r in resolvers):
+        errors.append("doi_resolver.resolvers must be a non-empty list of resolver names.")
+    for key in ('cache_days', 'miss_days'):
+        if key in doi_resolver and (not isinstance(doi_resolver[key], (int, float)) or doi_resolver[key] < 0):
+            errors.append(f"doi_resolver.{key} must be a non-negative number.")
+
+    return errors
+
 def validate_config(config):
     """
     설정 파일의 유효성을 검증합니다.
@@ -65,6 +277,39 @@ def validate_config(config):
     if 'gemini_model' not in config or not config['gemini_model']:
         errors.append("Missing required top-level key: 'gemini_model'")
 
+    if 'models' in config:
+        errors.extend(_validate_models(config['models'], 'models'))
+
+    if 'concurrency' in config:
+        errors.extend(_validate_concurrency(config['concurrency']))
+
+    if 'openrouter' in config:
+        errors.extend(_validate_openrouter(config['openrouter']))
+
+    if 'citations' in config:
+        errors.extend(_validate_citations(config['citations']))
+
+    if 'seen_index' in config:
+        errors.extend(_validate_seen_index(config['seen_index']))
+
+    if 'fulltext' in config:
+        errors.extend(_validate_fulltext(config['fulltext']))
+
+    if 'schedule' in config:
+        errors.extend(_validate_schedule(config['schedule']))
+
+    if 'http_cache' in config:
+        errors.extend(_validate_http_cache(config['http_cache']))
+
+    if 'local_models' in config:
+        errors.extend(_validate_local_models(config['local_models']))
+
+    if 'watch' in config:
+        errors.extend(_validate_watch(config['watch']))
+
+    if 'doi_resolver' in config:
+        errors.extend(_validate_doi_resolver(config['doi_resolver']))
+
     if 'categories' not in config:
         errors.append("Missing required top-level key: 'categories'")
     elif not isinstance(config['categories'], list) or not config['categories']:
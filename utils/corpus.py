@@ -0,0 +1,410 @@
+"""
+arXiv 메타데이터 말뭉치와 필터 백테스트
+
+`exclude_keywords`, `include_keywords_any`, `min_score`, 계층 검색어를 바꾼 효과를
+다음 일일 실행을 기다리지 않고 과거 기간에 대해 바로 확인하기 위한 도구입니다.
+
+- 적재(`ingest`): arXiv 메타데이터 덤프(한 줄에 JSON 레코드 하나, .gz 가능)를 한 줄씩 읽어
+  `.cache/corpus.sqlite3`에 배치 단위로 넣습니다. 메모리에는 배치 하나만 올라갑니다.
+  기본적으로 config.yml 검색어가 참조하는 카테고리의 레코드만 남깁니다.
+- 백테스트(`backtest`): 기간 안의 레코드에 계층 검색어(utils.arxiv_query), 제외/포함 키워드,
+  품질 점수를 일일 실행과 같은 함수로 적용합니다. h-index는 캐시에 있는 값만 사용합니다 (네트워크 없음).
+- 보고: 단계별 통과 수, 날짜별 예상 선택 수, 아카이브 대비 정밀도/재현율.
+  해당 카테고리 아카이브의 논문을 정답, 다른 카테고리 아카이브의 논문을 오답으로 봅니다.
+
+arXiv 검색의 관련도 순위와 `max_results_to_fetch` 상한은 재현하지 않으므로,
+예상 선택 수는 하루에 필터를 통과하는 후보 수(선택 가능한 최대치)입니다.
+"""
+import os
+import gzip
+import json
+import time
+import sqlite3
+import logging
+from collections import Counter
+from datetime import date, timedelta
+from email.utils import parsedate_to_datetime
+
+from utils.cache import CACHE_DIR, ensure_cache_dir
+from utils.yaml_helper import load_yaml
+from utils.arxiv_query import parse_query, Document
+from utils.paper_record import PaperRecord
+from utils.seen_index import (
+    base_arxiv_id,
+    DECISION_EXCLUDED,
+    DECISION_NOT_INCLUDED,
+    DECISION_LOW_SCORE
+)
+
+logger = logging.getLogger(__name__)
+
+CORPUS_FILE = os.path.join(CACHE_DIR, 'corpus.sqlite3')
+INGEST_BATCH_SIZE = 5000
+PROGRESS_EVERY = 200000
+
+# 백테스트 판정 (seen_index의 탈락 사유 외)
+OUTCOME_PASSED = 'passed'
+OUTCOME_NO_TIER = 'no_tier_match'
+OUTCOME_HINDEX_UNKNOWN = 'low_score_hindex_unknown'
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS papers ("
+    " id TEXT PRIMARY KEY, version INTEGER, title TEXT, abstract TEXT, authors TEXT,"
+    " categories TEXT, comments TEXT, journal_ref TEXT, doi TEXT, published TEXT, updated TEXT)",
+    "CREATE INDEX IF NOT EXISTS papers_published ON papers (published)",
+    # 카테고리별 후보 조회용 색인 (상위 아카이브 이름도 함께 기록: cond-mat.mtrl-sci -> cond-mat)
+    "CREATE TABLE IF NOT EXISTS paper_categories ("
+    " category TEXT, published TEXT, id TEXT, PRIMARY KEY (category, published, id)) WITHOUT ROWID",
+)
+
+
+class CorpusPaper(PaperRecord):
+    """말뭉치 행으로 만든 후보 논문 (필터/점수 단계는 검색 결과와 같은 PaperRecord로 받음)"""
+
+    __slots__ = ('doi', '_document')
+
+    def __init__(self, row):
+        (paper_id, version, title, summary, authors, categories,
+         comment, journal_ref, self.doi, published, _updated) = row
+        super().__init__(
+            paper_id=f"{paper_id}v{version}" if version else paper_id,
+            title=title,
+            summary=summary,
+            authors=(authors or '').split('\n'),
+            comment=comment,
+            journal_ref=journal_ref,
+            categories=(categories or '').split(),
+            published=published,
+        )
+        self._document = None
+
+    @property
+    def document(self):
+        """검색어 평가용 문서 (처음 필요할 때 생성)"""
+        if self._document is None:
+            self._document = Document(
+                title=self.title, abstract=self.summary, authors=' '.join(self.authors),
+                comments=self.comment, journal_ref=self.journal_ref, categories=self.categories
+            )
+        return self._document
+
+
+def open_corpus(path=None):
+    """말뭉치 DB를 열고 (없으면 생성) 연결을 반환합니다."""
+    path = path or CORPUS_FILE
+    if path == CORPUS_FILE:
+        ensure_cache_dir()
+    conn = sqlite3.connect(path)
+    for statement in _SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def _open_dump(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def _clean(text):
+    return ' '.join((text or '').split())
+
+
+def _published_date(record):
+    """v1 제출일 (YYYY-MM-DD). 버전 정보가 없으면 update_date"""
+    versions = record.get('versions') or []
+    if versions:
+        try:
+            return parsedate_to_datetime(versions[0]['created']).date().isoformat()
+        except (KeyError, TypeError, ValueError):
+            pass
+    return (record.get('update_date') or '')[:10] or None
+
+
+def _author_names(record):
+    parsed = record.get('authors_parsed')
+    if parsed:
+        # [성, 이름, 접미사]
+        return [_clean(' '.join(part for part in (first, last) if part))
+                for last, first, *_ in parsed]
+    return [_clean(name) for name in (record.get('authors') or '').replace(' and ', ',').split(',') if name.strip()]
+
+
+def record_to_row(record):
+    """덤프 레코드를 papers 테이블 행으로 변환합니다. ID나 날짜가 없으면 None."""
+    paper_id = base_arxiv_id(record.get('id'))
+    published = _published_date(record)
+    if not paper_id or not published:
+        return None
+    return (
+        paper_id,
+        len(record.get('versions') or []) or 1,
+        _clean(record.get('title')),
+        _clean(record.get('abstract')),
+        '\n'.join(_author_names(record)),
+        _clean(record.get('categories')),
+        _clean(record.get('comments')),
+        _clean(record.get('journal-ref')),
+        _clean(record.get('doi')),
+        published,
+        record.get('update_date'),
+    )
+
+
+def _expand_categories(categories):
+    """카테고리와 상위 아카이브 이름 (cond-mat.mtrl-sci -> cond-mat.mtrl-sci, cond-mat)"""
+    expanded = set()
+    for category in categories:
+        category = category.lower()
+        expanded.add(category)
+        expanded.add(category.split('.')[0])
+    return expanded
+
+
+def query_categories(categories_config):
+    """
+    config.yml 카테고리들의 계층 검색어가 참조하는 arXiv 카테고리 집합.
+
+    카테고리 제약이 없는 검색어가 하나라도 있으면 None (전체 레코드 필요).
+    """
+    required = set()
+    for category in categories_config:
+        for query in category.get('search_queries') or []:
+            categories = parse_query(query).categories()
+            if categories is None:
+                return None
+            required |= categories
+    return required
+
+
+def _flush(conn, rows):
+    conn.executemany("INSERT OR REPLACE INTO papers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.executemany(
+        "INSERT OR IGNORE INTO paper_categories VALUES (?, ?, ?)",
+        [(category, row[9], row[0]) for row in rows for category in _expand_categories(row[5].split())]
+    )
+    conn.commit()
+
+
+def ingest_dump(dump_path, db_path=None, categories=None, since=None, batch_size=INGEST_BATCH_SIZE):
+    """
+    arXiv 메타데이터 덤프를 말뭉치에 적재합니다 (같은 ID는 덮어씀).
+
+    Args:
+        dump_path: JSON lines 파일 경로 (.gz 가능)
+        db_path: 말뭉치 DB 경로 (기본 .cache/corpus.sqlite3)
+        categories: 남길 arXiv 카테고리 집합 (상위 아카이브 이름 가능). None이면 전체
+        since: 이 날짜(YYYY-MM-DD) 이전에 처음 제출된 논문은 건너뜀
+        batch_size: 한 번에 쓰는 행 수
+
+    Returns:
+        {'read', 'stored', 'skipped', 'malformed', 'seconds'}
+    """
+    keep = {c.lower() for c in categories} if categories is not None else None
+    stats = Counter()
+    start = time.perf_counter()
+    conn = open_corpus(db_path)
+    # 대량 적재 중에는 fsync를 생략 (중단되면 다시 적재하면 됨)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    batch = []
+    try:
+        with _open_dump(dump_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                stats['read'] += 1
+                try:
+                    row = record_to_row(json.loads(line))
+                except (ValueError, AttributeError, TypeError):
+                    stats['malformed'] += 1
+                    continue
+                if (row is None
+                        or (since and row[9] < since)
+                        or (keep is not None and not keep & _expand_categories(row[5].split()))):
+                    stats['skipped'] += 1
+                    continue
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    _flush(conn, batch)
+                    stats['stored'] += len(batch)
+                    batch = []
+                if stats['read'] % PROGRESS_EVERY == 0:
+                    logger.info(f"Ingest progress: {stats['read']} read, {stats['stored']} stored")
+        if batch:
+            _flush(conn, batch)
+            stats['stored'] += len(batch)
+    finally:
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.close()
+
+    stats['seconds'] = round(time.perf_counter() - start, 1)
+    logger.info(f"Ingested {stats['stored']} of {stats['read']} records into the corpus "
+                f"({stats['skipped']} skipped, {stats['malformed']} malformed) in {stats['seconds']}s")
+    return {key: stats[key] for key in ('read', 'stored', 'skipped', 'malformed', 'seconds')}
+
+
+def corpus_date_range(conn):
+    """말뭉치의 (첫 제출일, 마지막 제출일). 비어 있으면 (None, None)"""
+    return conn.execute("SELECT MIN(published), MAX(published) FROM papers").fetchone()
+
+
+def iter_corpus_papers(conn, start, end, categories=None):
+    """
+    기간 안(제출일 기준, 양 끝 포함)의 레코드를 제출일 순서로 내보냅니다.
+
+    Args:
+        categories: 이 중 하나에 속한 레코드만 (카테고리 색인 사용). None이면 전체
+    """
+    if categories is None:
+        cursor = conn.execute(
+            "SELECT * FROM papers WHERE published BETWEEN ? AND ? ORDER BY published", (start, end)
+        )
+    else:
+        categories = sorted(categories)
+        placeholders = ', '.join('?' * len(categories))
+        cursor = conn.execute(
+            "SELECT p.* FROM papers p JOIN ("
+            f" SELECT DISTINCT id FROM paper_categories WHERE category IN ({placeholders})"
+            " AND published BETWEEN ? AND ?) c ON p.id = c.id ORDER BY p.published",
+            (*categories, start, end)
+        )
+    for row in cursor:
+        yield CorpusPaper(row)
+
+
+def load_archive_labels(categories_config):
+    """{버전 없는 arXiv ID: 카테고리 이름} (여러 카테고리 아카이브에 있으면 처음 것)"""
+    labels = {}
+    for category in categories_config:
+        archive_path = category.get('paths', {}).get('archive')
+        for paper in load_yaml(archive_path) or []:
+            paper_id = base_arxiv_id(paper.get('paper_id'))
+            if paper_id:
+                labels.setdefault(paper_id, category.get('name'))
+    return labels
+
+
+def _percentile(values, q):
+    if not values:
+        return 0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def backtest_category(category, start, end, labels, conn):
+    """
+    카테고리 하나의 계층 검색어, 키워드 필터, 품질 점수를 기간 안의 말뭉치에 적용합니다.
+
+    Args:
+        category: config.yml의 카테고리 설정
+        start, end: 제출일 범위 (YYYY-MM-DD, 양 끝 포함)
+        labels: load_archive_labels() 결과
+        conn: open_corpus() 연결
+
+    Returns:
+        단계별 수, 날짜별 예상 선택 수, 아카이브 대비 정밀도/재현율을 담은 dict
+    """
+    from utils.paper_fetcher import filter_candidates, score_candidates
+
+    name = category.get('name', 'Unknown')
+    queries = [parse_query(query) for query in category.get('search_queries') or []]
+    required = set()
+    for query in queries:
+        categories = query.categories()
+        required = None if categories is None or required is None else required | categories
+
+    started = time.perf_counter()
+    tier_counts = Counter()
+    stages = Counter()
+    days = set()
+    selected = Counter()
+    outcomes = {}   # 라벨이 있는 논문의 판정만 기록
+
+    def reject(paper_id, decision):
+        stages[decision] += 1
+        paper_id = base_arxiv_id(paper_id)
+        if paper_id in labels:
+            outcomes[paper_id] = decision
+
+    def matched():
+        for paper in iter_corpus_papers(conn, start, end, required):
+            stages['scanned'] += 1
+            days.add(paper.published)
+            tier = next((i for i, query in enumerate(queries) if query.matches(paper.document)), None)
+            if tier is None:
+                if paper.base_id in labels:
+                    outcomes[paper.base_id] = OUTCOME_NO_TIER
+                continue
+            tier_counts[tier + 1] += 1
+            stages['matched'] += 1
+            if paper.base_id in labels:
+                # 점수 단계에서 탈락 사유가 기록되지 않으면 (h-index 미확인) 이 판정이 남음
+                outcomes[paper.base_id] = OUTCOME_HINDEX_UNKNOWN
+            yield paper
+
+    # 아카이브 제외 없이 (그 당시에는 새 논문) 일일 실행과 같은 필터/점수 단계를 적용
+    candidates = filter_candidates(matched(), set(), category, seen=None, on_reject=reject)
+    for paper in score_candidates(candidates, category.get('filter_config') or {}, reject, allow_lookup=False):
+        stages[OUTCOME_PASSED] += 1
+        selected[paper.published] += 1
+        if paper.base_id in labels:
+            outcomes[paper.base_id] = OUTCOME_PASSED
+    stages[OUTCOME_HINDEX_UNKNOWN] = (stages['matched'] - stages[DECISION_EXCLUDED] - stages[DECISION_NOT_INCLUDED]
+                                      - stages[DECISION_LOW_SCORE] - stages[OUTCOME_PASSED])
+
+    # 기간 안에 제출된 이 카테고리 아카이브 논문 (말뭉치에 있는 것만)
+    own_ids = [paper_id for paper_id, label in labels.items() if label == name]
+    own_in_range = set()
+    for i in range(0, len(own_ids), 500):
+        chunk = own_ids[i:i + 500]
+        rows = conn.execute(
+            f"SELECT id FROM papers WHERE id IN ({', '.join('?' * len(chunk))}) AND published BETWEEN ? AND ?",
+            (*chunk, start, end)
+        )
+        own_in_range.update(row[0] for row in rows)
+
+    passed_labelled = [paper_id for paper_id, outcome in outcomes.items() if outcome == OUTCOME_PASSED]
+    true_positive = sum(1 for paper_id in passed_labelled if labels[paper_id] == name)
+    false_positive = len(passed_labelled) - true_positive
+    daily = [selected[day] for day in sorted(days)]
+    target = category.get('num_papers_to_summarize', 3)
+
+    return {
+        'name': name,
+        'start': start,
+        'end': end,
+        'seconds': round(time.perf_counter() - started, 2),
+        'stages': {key: stages[key] for key in ('scanned', 'matched', DECISION_EXCLUDED, DECISION_NOT_INCLUDED,
+                                                DECISION_LOW_SCORE, OUTCOME_HINDEX_UNKNOWN, OUTCOME_PASSED)},
+        'tiers': dict(sorted(tier_counts.items())),
+        'daily': {
+            'days': len(daily),
+            'mean': round(sum(daily) / len(daily), 2) if daily else 0,
+            'p50': _percentile(daily, 0.5),
+            'p90': _percentile(daily, 0.9),
+            'max': max(daily, default=0),
+            'zero_days': sum(1 for n in daily if n == 0),
+            'short_days': sum(1 for n in daily if n < target),
+            'target': target,
+        },
+        'archive': {
+            'in_range': len(own_in_range),
+            'true_positive': true_positive,
+            'false_positive': false_positive,
+            'precision': round(true_positive / len(passed_labelled), 3) if passed_labelled else None,
+            'recall': round(true_positive / len(own_in_range), 3) if own_in_range else None,
+            'missed': sorted((paper_id, outcomes.get(paper_id, OUTCOME_NO_TIER))
+                             for paper_id in own_in_range if outcomes.get(paper_id) != OUTCOME_PASSED),
+        },
+    }
+
+
+def default_backtest_range(conn, days=90):
+    """말뭉치 마지막 제출일까지 `days`일 (start, end)"""
+    _, last = corpus_date_range(conn)
+    if last is None:
+        return None, None
+    end = date.fromisoformat(last)
+    return (end - timedelta(days=days - 1)).isoformat(), end.isoformat()
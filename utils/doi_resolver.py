@@ -0,0 +1,317 @@
+"""
+DOI 메타데이터 조회 (추천 논문용)
+
+추천 논문 목록(`recommended.yml`)의 DOI로 저자, 학술지, 발행일, 초록을 조회합니다.
+
+- 조회기는 교체할 수 있습니다 (`doi_resolver.resolvers`). 앞 조회기에서 빠진 필드(예: Crossref에 없는 초록)는
+  다음 조회기로 채웁니다. 기본 제공: `crossref`(DOI별 요청, 동시 요청), `semantic_scholar`(batch 엔드포인트).
+  다른 조회기는 `register_resolver()`로 추가합니다.
+- 조회 결과는 `.cache/doi_cache.json`에 보관하고 `cache_days` 동안 다시 조회하지 않습니다.
+  찾지 못한 DOI도 `miss_days` 동안 기억합니다. 요청이 실패한 DOI는 기록하지 않습니다.
+- Crossref 요청은 전역 CROSSREF_LIMITER(최소 간격 + 동시 요청 수)를 따릅니다.
+"""
+import os
+import re
+import html
+import json
+import time
+import logging
+import threading
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from utils.cache import CACHE_DIR, ensure_cache_dir
+from utils.http import get_session
+from utils.rate_limit import CROSSREF_LIMITER, SEMANTIC_SCHOLAR_LIMITER
+from utils.endpoints import CROSSREF_API_URL, SEMANTIC_SCHOLAR_API_URL
+from utils.metrics import stage_timer
+
+logger = logging.getLogger(__name__)
+
+DOI_CACHE_FILE = os.path.join(CACHE_DIR, 'doi_cache.json')
+
+# 정규화한 메타데이터 필드
+FIELDS = ('title', 'authors', 'venue', 'date', 'abstract')
+
+_settings = {
+    'resolvers': ['semantic_scholar', 'crossref'],  # 순서대로 조회하고 빠진 필드를 다음 조회기로 채움
+    'cache_days': 90,       # 조회 결과 보관 기간
+    'miss_days': 7,         # 찾지 못한 DOI를 다시 조회하지 않는 기간
+    'mailto': None,         # Crossref polite pool 연락처
+}
+
+_DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:)', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+_cache_lock = threading.Lock()
+_FAILED = object()
+
+
+def configure_doi_resolver(settings=None):
+    """config.yml의 `doi_resolver` 섹션을 적용합니다."""
+    settings = settings or {}
+    for key in _settings:
+        if key in settings:
+            _settings[key] = settings[key]
+    unknown = [name for name in _settings['resolvers'] if name not in RESOLVERS]
+    if unknown:
+        logger.warning(f"Unknown DOI resolvers ignored: {', '.join(unknown)}")
+
+
+def clean_doi(value):
+    """'https://doi.org/10.1038/NMAT3427' -> '10.1038/NMAT3427' (접두어만 제거하고 대소문자 유지, DOI가 아니면 None)"""
+    doi = _DOI_PREFIX_RE.sub('', str(value or '').strip())
+    return doi if doi.startswith('10.') and '/' in doi else None
+
+
+def normalize_doi(value):
+    """
+    조회/비교용 DOI 키: 'https://doi.org/10.1038/NMAT3427' -> '10.1038/nmat3427' (DOI가 아니면 None)
+
+    DOI는 대소문자를 구분하지 않으므로 캐시와 변경 감지에만 소문자 키를 쓰고, 저장하는 값은 clean_doi()의 원래 표기를 씁니다.
+    """
+    doi = clean_doi(value)
+    return doi.lower() if doi else None
+
+
+def _clean_text(text):
+    """JATS/HTML 태그와 엔터티를 걷어 낸 한 줄 텍스트"""
+    return ' '.join(html.unescape(_TAG_RE.sub(' ', text or '')).split())
+
+
+def _missing_fields(metadata):
+    return [field for field in FIELDS if not (metadata or {}).get(field)]
+
+
+def _merge(metadata, extra):
+    """metadata에 없는 필드만 extra에서 채웁니다."""
+    if not metadata:
+        return dict(extra) if extra else None
+    for field in _missing_fields(metadata):
+        if extra and extra.get(field):
+            metadata[field] = extra[field]
+    return metadata
+
+
+class DoiResolver:
+    """
+    DOI 메타데이터 조회기
+
+    `resolve(doi)` (DOI별 요청, 동시에 실행) 또는 `resolve_many(dois)` (일괄 요청)를 구현합니다.
+    메타데이터는 FIELDS 키를 가진 딕셔너리이며, 찾지 못하면 None을 반환합니다.
+    요청이 실패하면 예외를 던지고, 그 DOI는 캐시에 기록되지 않습니다.
+    """
+
+    name = None
+    max_workers = 1
+
+    def resolve(self, doi):
+        raise NotImplementedError
+
+    def resolve_many(self, dois):
+        """
+        Returns:
+            {doi: 메타데이터 또는 None} (요청이 실패한 DOI는 빠짐)
+        """
+        def resolve_one(doi):
+            try:
+                return doi, self.resolve(doi)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.warning(f"{self.name}: error resolving {doi}: {e}")
+                return doi, _FAILED
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers), thread_name_prefix=f'doi_{self.name}') as executor:
+            results = executor.map(resolve_one, dois)
+            return {doi: metadata for doi, metadata in results if metadata is not _FAILED}
+
+
+class CrossrefResolver(DoiResolver):
+    """Crossref REST API (`/works/{doi}`): 저자, 학술지, 발행일은 거의 항상 있고 초록은 일부만 있음"""
+
+    name = 'crossref'
+
+    @property
+    def max_workers(self):
+        return CROSSREF_LIMITER.max_concurrent
+
+    def resolve(self, doi):
+        params = {'mailto': _settings['mailto']} if _settings['mailto'] else None
+        # DOI suffix에는 '#', '?', ';', '%' 같은 URL 예약 문자가 올 수 있으므로 경로 조각으로 인코딩
+        url = f"{CROSSREF_API_URL}/works/{quote(doi, safe='/')}"
+        with CROSSREF_LIMITER, stage_timer('doi.crossref'):
+            response = get_session().get(url, params=params, timeout=(10, 30))
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        work = response.json().get('message') or {}
+
+        authors = []
+        for author in work.get('author') or []:
+            name = ' '.join(part for part in (author.get('given'), author.get('family')) if part) or author.get('name')
+            if name:
+                authors.append(name)
+        date_parts = next(
+            (work[key]['date-parts'][0] for key in ('published-print', 'published-online', 'published', 'issued')
+             if (work.get(key) or {}).get('date-parts') and work[key]['date-parts'][0][0]),
+            []
+        )
+        return {
+            'title': _clean_text(' '.join(work.get('title') or [])),
+            'authors': authors,
+            'venue': _clean_text(' '.join((work.get('container-title') or [])[:1])),
+            'date': '-'.join(f"{part:02d}" for part in date_parts[:3]),
+            'abstract': _clean_text(work.get('abstract')),
+        }
+
+
+class SemanticScholarResolver(DoiResolver):
+    """Semantic Scholar batch 엔드포인트: 요청 한 번에 최대 500개 DOI"""
+
+    name = 'semantic_scholar'
+    batch_size = 500
+    fields = 'title,abstract,authors,venue,journal,publicationDate,year'
+
+    def resolve_many(self, dois):
+        headers = {}
+        api_key = os.environ.get('SEMANTIC_SCHOLAR_API_KEY')
+        if api_key:
+            headers['x-api-key'] = api_key
+
+        def post(ids):
+            return get_session().post(f"{SEMANTIC_SCHOLAR_API_URL}/paper/batch", params={'fields': self.fields},
+                                      json={'ids': ids}, headers=headers, timeout=30)
+
+        results = {}
+        for start in range(0, len(dois), self.batch_size):
+            batch = dois[start:start + self.batch_size]
+            ids = [f"DOI:{doi}" for doi in batch]
+            try:
+                with SEMANTIC_SCHOLAR_LIMITER, stage_timer('doi.semantic_scholar', len(batch)):
+                    response = post(ids)
+                    if response.status_code == 429:
+                        logger.warning("Rate limit exceeded for DOI batch. Retrying in 5 seconds...")
+                        time.sleep(5.0)
+                        response = post(ids)
+                if response.status_code != 200:
+                    logger.warning(f"Semantic Scholar batch API error: {response.status_code}")
+                    continue
+                # 응답은 요청한 ID 순서와 같고, 찾지 못한 논문은 null
+                for doi, item in zip(batch, response.json()):
+                    results[doi] = self._to_metadata(item) if item else None
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Error fetching DOI batch: {e}")
+            except ValueError as e:
+                logger.warning(f"Error parsing DOI batch response: {e}")
+        return results
+
+    @staticmethod
+    def _to_metadata(item):
+        journal = item.get('journal') or {}
+        return {
+            'title': _clean_text(item.get('title')),
+            'authors': [a['name'] for a in item.get('authors') or [] if a.get('name')],
+            'venue': journal.get('name') or item.get('venue') or '',
+            'date': item.get('publicationDate') or str(item.get('year') or ''),
+            'abstract': _clean_text(item.get('abstract')),
+        }
+
+
+# 이름 -> 조회기 생성 함수
+RESOLVERS = {
+    CrossrefResolver.name: CrossrefResolver,
+    SemanticScholarResolver.name: SemanticScholarResolver,
+}
+
+
+def register_resolver(name, factory):
+    """조회기를 추가합니다. `doi_resolver.resolvers`에 이름을 넣으면 사용됩니다."""
+    RESOLVERS[name] = factory
+
+
+def _load_cache():
+    with _cache_lock:
+        if not os.path.exists(DOI_CACHE_FILE):
+            return {}
+        try:
+            with open(DOI_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Error loading DOI cache: {e}")
+            return {}
+
+
+def _save_cache(updates):
+    """바뀐 항목만 디스크의 캐시와 병합해 원자적으로 교체합니다."""
+    ensure_cache_dir()
+    with _cache_lock:
+        try:
+            with open(DOI_CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        data.update(updates)
+        tmp_file = DOI_CACHE_FILE + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_file, DOI_CACHE_FILE)
+
+
+def _is_fresh(entry, now):
+    if not entry:
+        return False
+    days = _settings['cache_days'] if entry.get('metadata') else _settings['miss_days']
+    return now - entry.get('timestamp', 0) < days * 24 * 60 * 60
+
+
+def resolve_dois(dois, refresh=False):
+    """
+    DOI 목록의 메타데이터를 조회합니다 (캐시에 없거나 오래된 DOI만 요청).
+
+    Args:
+        dois: DOI 목록 (URL 형식 가능, 대소문자 무시)
+        refresh: True면 캐시를 무시하고 모두 다시 조회
+
+    Returns:
+        {정규화한 DOI: 메타데이터 또는 None(찾지 못함)} (요청이 모두 실패한 DOI는 빠짐)
+    """
+    now = time.time()
+    cache = _load_cache()
+    results = {}
+    pending = []
+    for doi in dict.fromkeys(filter(None, map(normalize_doi, dois))):
+        entry = cache.get(doi)
+        if not refresh and _is_fresh(entry, now):
+            results[doi] = entry['metadata']
+        else:
+            pending.append(doi)
+
+    if not pending:
+        return results
+
+    logger.info(f"Resolving {len(pending)} DOIs ({len(results)} cached)...")
+    resolved = {}
+    answered = set()
+    for name in _settings['resolvers']:
+        factory = RESOLVERS.get(name)
+        # 앞 조회기에서 필드가 모두 채워진 DOI는 건너뜀
+        todo = [doi for doi in pending if _missing_fields(resolved.get(doi))]
+        if factory is None or not todo:
+            continue
+        for doi, metadata in factory().resolve_many(todo).items():
+            answered.add(doi)
+            resolved[doi] = _merge(resolved.get(doi), metadata)
+
+    updates = {doi: {'metadata': resolved.get(doi), 'timestamp': now} for doi in pending if doi in answered}
+    if updates:
+        _save_cache(updates)
+    found = sum(1 for doi in updates if updates[doi]['metadata'])
+    logger.info(f"Resolved {found} of {len(pending)} DOIs ({len(pending) - len(updates)} failed).")
+
+    results.update({doi: entry['metadata'] for doi, entry in updates.items()})
+    # 요청이 실패한 DOI는 오래된 캐시라도 있으면 사용
+    for doi in pending:
+        if doi not in updates and cache.get(doi):
+            results[doi] = cache[doi]['metadata']
+    return results
@@ -0,0 +1,19 @@
+"""
+외부 API 엔드포인트
+
+환경 변수로 주소를 바꿀 수 있습니다 (예: 부하 테스트의 로컬 대역 서버).
+- ARXIV_API_URL: arXiv 검색 API (기본 https://export.arxiv.org/api/query)
+- ARXIV_PDF_URL: arXiv PDF 주소 형식 (`{paper_id}` 자리에 버전 포함 ID)
+- OPENROUTER_API_URL: OpenRouter 채팅 완성 API
+- SEMANTIC_SCHOLAR_API_URL: Semantic Scholar Graph API 루트
+- CROSSREF_API_URL: Crossref REST API 루트 (DOI 메타데이터)
+"""
+import os
+
+ARXIV_API_URL = os.environ.get('ARXIV_API_URL', 'https://export.arxiv.org/api/query')
+ARXIV_PDF_URL = os.environ.get('ARXIV_PDF_URL', 'https://arxiv.org/pdf/{paper_id}')
+OPENROUTER_API_URL = os.environ.get('OPENROUTER_API_URL', 'https://openrouter.ai/api/v1/chat/completions')
+SEMANTIC_SCHOLAR_API_URL = os.environ.get(
+    'SEMANTIC_SCHOLAR_API_URL', 'https://api.semanticscholar.org/graph/v1'
+).rstrip('/')
+CROSSREF_API_URL = os.environ.get('CROSSREF_API_URL', 'https://api.crossref.org').rstrip('/')
@@ -0,0 +1,174 @@
+"""
+정적 JSON 피드 내보내기 유틸리티
+
+카테고리별 아카이브를 고정 크기 페이지 청크로 나누어 내보냅니다.
+- 청크 파일명에는 내용 해시가 포함되어 변경되지 않는 한 같은 URL을 유지합니다 (불변 캐싱).
+- 청크는 가장 오래된 논문부터 나눕니다 (`page-1`이 가장 오래된 청크). 새 논문이 추가되어도
+  가장 최신 청크(page_size보다 작을 수 있음)만 바뀌고 나머지 청크의 URL은 그대로입니다.
+- 미리 압축한 사본(.gz/.br)은 만들지 않습니다. GitHub Pages는 요청에 맞춰 직접 압축해 보내고
+  미리 압축된 파일을 대신 제공하지 않으므로, 저장소만 커집니다 (이전에 만든 사본은 내보낼 때 지움).
+- 작은 `index.json`이 전체 개수와 청크 파일 목록(최신 청크부터)을 제공하므로,
+  아카이브 페이지는 인덱스와 현재 보고 있는 청크만 내려받습니다.
+- 논문은 키워드를 정수 `keyword_ids`로만 가지며, ID -> 라벨 사전은
+  모든 카테고리가 공유하는 `keywords.<hash>.json` 하나로 내보냅니다.
+- 인용 수는 매일 바뀌므로 청크에 넣지 않고, 모든 카테고리가 공유하는 고정 URL `citations.json`
+  (논문 ID -> 인용 수)으로 내보냅니다. 워커가 청크를 불러올 때 합칩니다.
+"""
+import os
+import json
+import hashlib
+import logging
+from utils.yaml_helper import load_yaml
+from utils.keyword_vocab import load_vocabulary
+
+logger = logging.getLogger(__name__)
+
+FEED_DIR = os.path.join('assets', 'feeds')
+DEFAULT_PAGE_SIZE = 10
+INDEX_FILE = 'index.json'
+CITATIONS_FEED_FILE = 'citations.json'
+# 청크에 넣지 않는 필드 (자주 바뀌어 청크 해시를 흔드는 값: 이전 버전이 아카이브에 쓰던 인용 수)
+_VOLATILE_FIELDS = ('citation_count', 'citation_updated')
+# 이전 버전이 만들던 미리 압축한 사본
+_PRECOMPRESSED_SUFFIXES = ('.gz', '.br')
+
+
+def _dumps(data):
+    """결정적(같은 입력 -> 같은 바이트) JSON 직렬화"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True, default=str).encode('utf-8')
+
+
+def _write_file(path, payload):
+    """임시 파일에 쓴 뒤 교체합니다."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _sort_key(paper):
+    """아카이브 페이지의 기본 정렬(요약 날짜 최신순)과 같은 순서"""
+    return str(paper.get('summary_date') or ''), str(paper.get('date') or '')
+
+
+def export_keyword_dictionary(feed_dir=FEED_DIR):
+    """
+    키워드 ID -> 라벨 사전을 내용 해시 파일명으로 내보냅니다.
+
+    Returns:
+        피드 루트 기준 사전 파일명, 실패 시 None
+    """
+    payload = _dumps({'labels': load_vocabulary().labels()})
+    filename = f"keywords.{hashlib.sha256(payload).hexdigest()[:12]}.json"
+    try:
+        os.makedirs(feed_dir, exist_ok=True)
+        if not os.path.exists(os.path.join(feed_dir, filename)):
+            _write_file(os.path.join(feed_dir, filename), payload)
+
+        for name in os.listdir(feed_dir):
+            if name.startswith('keywords.') and (name != filename or name.endswith(_PRECOMPRESSED_SUFFIXES)):
+                os.remove(os.path.join(feed_dir, name))
+    except Exception as e:
+        logger.error(f"Error exporting keyword dictionary to {feed_dir}: {e}")
+        return None
+
+    logger.info(f"Exported keyword dictionary {filename}")
+    return filename
+
+
+def export_citations(feed_dir=FEED_DIR, citations_path=None):
+    """
+    논문 ID -> 인용 수(1 이상만) 파일을 고정 URL로 내보냅니다.
+
+    Args:
+        citations_path: 인용 수 저장 파일 (None이면 utils.citations.CITATIONS_FILE)
+
+    Returns:
+        저장된 파일 경로, 실패 시 None
+    """
+    # utils.citations는 requests를 임포트하므로 필요할 때만 임포트
+    from utils.citations import load_citations, CITATIONS_FILE
+
+    counts = {paper_id: entry['count'] for paper_id, entry in load_citations(citations_path or CITATIONS_FILE).items()
+              if (entry or {}).get('count')}
+    path = os.path.join(feed_dir, CITATIONS_FEED_FILE)
+    try:
+        os.makedirs(feed_dir, exist_ok=True)
+        _write_file(path, _dumps(counts))
+    except Exception as e:
+        logger.error(f"Error exporting citations to {feed_dir}: {e}")
+        return None
+
+    logger.info(f"Exported citation counts for {len(counts)} papers")
+    return path
+
+
+def _chunk_paper(paper):
+    return {key: value for key, value in paper.items() if key not in _VOLATILE_FIELDS}
+
+
+def export_category_feed(category, feed_dir=FEED_DIR, page_size=DEFAULT_PAGE_SIZE, vocabulary=None):
+    """
+    카테고리 하나의 아카이브를 페이지 청크 피드로 내보냅니다.
+
+    Args:
+        category: config.yml의 카테고리 설정 딕셔너리
+        feed_dir: 피드 루트 디렉토리
+        page_size: 청크당 논문 수
+        vocabulary: export_keyword_dictionary가 반환한 키워드 사전 파일명
+
+    Returns:
+        저장된 인덱스 파일 경로, 실패 시 None
+    """
+    category_name = category.get('name', 'Unknown')
+    paths = category.get('paths', {})
+    archive_papers = load_yaml(paths.get('archive', '')) or []
+    papers = sorted(archive_papers, key=_sort_key, reverse=True)
+
+    category_dir = os.path.join(feed_dir, category_name.lower())
+    try:
+        os.makedirs(category_dir, exist_ok=True)
+
+        pages = []
+        written = 0
+        # 최신순 목록의 끝(가장 오래된 논문)부터 청크를 자름: 새 논문은 앞쪽 청크에만 영향을 줌
+        for page_number, end in enumerate(range(len(papers), 0, -page_size), start=1):
+            chunk = [_chunk_paper(paper) for paper in papers[max(0, end - page_size):end]]
+            payload = _dumps({'page': page_number, 'papers': chunk})
+            digest = hashlib.sha256(payload).hexdigest()[:12]
+            filename = f"page-{page_number}.{digest}.json"
+            path = os.path.join(category_dir, filename)
+            # 파일명이 내용 해시이므로 이미 있으면 다시 쓸 필요가 없음
+            if not os.path.exists(path):
+                _write_file(path, payload)
+                written += 1
+            pages.append(filename)
+        # 인덱스는 화면 순서(최신 청크부터)로 나열
+        pages.reverse()
+
+        index = {
+            'category': category_name,
+            'total': len(papers),
+            'page_size': page_size,
+            'pages': pages,
+            'vocabulary': f"../{vocabulary}" if vocabulary else None,
+            'citations': f"../{CITATIONS_FEED_FILE}",
+            'version': hashlib.sha256(''.join(pages + [vocabulary or '']).encode('utf-8')).hexdigest()[:12],
+        }
+        index_path = os.path.join(category_dir, INDEX_FILE)
+        _write_file(index_path, _dumps(index))
+
+        # 더 이상 참조되지 않는 이전 청크와 미리 압축한 사본 정리
+        keep = set(pages) | {INDEX_FILE}
+        removed = 0
+        for name in os.listdir(category_dir):
+            if name.endswith(_PRECOMPRESSED_SUFFIXES) or (name.startswith('page-') and name not in keep):
+                os.remove(os.path.join(category_dir, name))
+                removed += 1
+    except Exception as e:
+        logger.error(f"[{category_name}] Error exporting feed to {category_dir}: {e}")
+        return None
+
+    logger.info(f"[{category_name}] Exported {len(papers)} papers in {len(pages)} pages "
+                f"({written} new chunks, {removed} stale files removed) to {category_dir}")
+    return index_path
@@ -0,0 +1,201 @@
+"""
+논문 본문(PDF) 발췌 유틸리티 (선택 단계)
+
+선택된 논문의 PDF를 청크 단위로 디스크에 스트리밍한 뒤 페이지별로 텍스트를 추출하고,
+실험 조건/결과/결론 같은 섹션을 골라 요약 단계에 초록과 함께 넘깁니다.
+
+- PDF 전체를 메모리에 올리지 않으며, 크기 상한을 넘는 파일은 내려받는 도중 중단합니다.
+- 추출한 텍스트는 arXiv ID + 버전으로 `.cache/fulltext/`에 gzip으로 캐시하고 PDF는 지웁니다.
+  같은 버전은 다시 내려받지 않습니다.
+- 다운로드는 전역 ARXIV_PDF_LIMITER(최소 간격 + 동시 다운로드 수)를 따릅니다.
+- 텍스트 추출에는 pypdf(requirements.txt)가 필요하며, 설치되지 않은 환경에서는 이 단계를 건너뜁니다.
+"""
+import os
+import re
+import gzip
+import logging
+
+import requests
+
+from utils.cache import CACHE_DIR
+from utils.http import get_session
+from utils.rate_limit import ARXIV_PDF_LIMITER
+from utils.endpoints import ARXIV_PDF_URL
+from utils.metrics import stage_timer
+from utils.seen_index import split_arxiv_id
+
+try:
+    from pypdf import PdfReader  # 없으면 본문 발췌를 건너뜀
+except ImportError:
+    PdfReader = None
+
+logger = logging.getLogger(__name__)
+
+FULLTEXT_DIR = os.path.join(CACHE_DIR, 'fulltext')
+CHUNK_SIZE = 64 * 1024
+
+_settings = {
+    'enabled': False,
+    'max_pdf_mb': 20,         # 이보다 큰 PDF는 내려받지 않음
+    'max_pages': 30,          # 추출할 최대 페이지 수
+    'max_chars': 60000,       # 캐시할 본문 최대 길이
+    'excerpt_chars': 4000,    # 요약 프롬프트에 넣을 발췌 최대 길이
+}
+
+# 발췌할 섹션 (제목 정규식 -> 섹션 이름), 순서대로 프롬프트에 넣음
+SECTION_PATTERNS = [
+    ('experimental', r'experimental(?:\s+(?:section|details|methods|procedures?))?|materials\s+and\s+methods|methods?'),
+    ('results', r'results(?:\s+and\s+discussion)?'),
+    ('conclusions', r'conclusions?|summary\s+and\s+outlook|concluding\s+remarks'),
+]
+# "2. Experimental", "III. RESULTS AND DISCUSSION", "Conclusions" 처럼 한 줄을 차지하는 제목
+_HEADING_RE = re.compile(
+    r'^\s*(?:\d+(?:\.\d+)*\.?|[IVX]+\.)?\s*(' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SECTION_PATTERNS)
+    + r')\s*:?\s*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+_ANY_HEADING_RE = re.compile(
+    r'^\s*(?:\d+(?:\.\d+)*\.?|[IVX]+\.)\s+[A-Z][A-Za-z ,&\-]{2,60}\s*$|^\s*(?:references|acknowledg(?:e)?ments?)\s*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def configure_fulltext(settings=None):
+    """config.yml의 `fulltext` 섹션을 적용합니다."""
+    settings = settings or {}
+    for key in _settings:
+        if key in settings:
+            _settings[key] = settings[key]
+    if _settings['enabled'] and PdfReader is None:
+        logger.error("fulltext.enabled is set but pypdf is not installed (pip install -r requirements.txt); "
+                     "full-text excerpts are disabled.")
+
+
+def is_enabled():
+    return bool(_settings['enabled']) and PdfReader is not None
+
+
+def _cache_path(paper_id):
+    base_id, version = split_arxiv_id(paper_id)
+    return os.path.join(FULLTEXT_DIR, f"{base_id.replace('/', '_')}v{version}.txt.gz")
+
+
+def _download_pdf(paper_id, path):
+    """PDF를 청크 단위로 파일에 저장합니다. 크기 상한을 넘으면 중단하고 False를 반환합니다."""
+    max_bytes = int(_settings['max_pdf_mb'] * 1024 * 1024)
+    url = ARXIV_PDF_URL.format(paper_id=paper_id)
+
+    with ARXIV_PDF_LIMITER:
+        with get_session().get(url, stream=True, timeout=(10, 60)) as response:
+            if response.status_code != 200:
+                logger.warning(f"PDF download failed for {paper_id}: HTTP {response.status_code}")
+                return False
+            length = int(response.headers.get('Content-Length') or 0)
+            if length > max_bytes:
+                logger.info(f"Skipping PDF for {paper_id}: {length / 1e6:.1f} MB exceeds limit")
+                return False
+
+            written = 0
+            with open(path, 'wb') as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    written += len(chunk)
+                    if written > max_bytes:
+                        logger.info(f"Aborting PDF download for {paper_id}: exceeds {_settings['max_pdf_mb']} MB")
+                        return False
+                    f.write(chunk)
+    return written > 0
+
+
+def _extract_text(path):
+    """페이지별로 텍스트를 추출합니다 (페이지 수/글자 수 상한까지만)."""
+    reader = PdfReader(path)
+    parts, total = [], 0
+    for page in reader.pages[:_settings['max_pages']]:
+        text = page.extract_text() or ''
+        parts.append(text)
+        total += len(text)
+        if total >= _settings['max_chars']:
+            break
+    return '\n'.join(parts)[:_settings['max_chars']]
+
+
+def get_fulltext(paper_id):
+    """
+    논문 본문 텍스트를 반환합니다 (캐시에 없으면 내려받아 추출).
+
+    Args:
+        paper_id: 버전이 포함된 arXiv ID (예: '2508.00236v2')
+
+    Returns:
+        본문 텍스트, 실패하거나 비활성화된 경우 None
+    """
+    if not is_enabled():
+        return None
+
+    cache_path = _cache_path(paper_id)
+    if os.path.exists(cache_path):
+        with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+            return f.read()
+
+    os.makedirs(FULLTEXT_DIR, exist_ok=True)
+    pdf_path = cache_path[:-len('.txt.gz')] + '.pdf.part'
+    try:
+        with stage_timer('fulltext.download'):
+            if not _download_pdf(paper_id, pdf_path):
+                return None
+        with stage_timer('fulltext.extract'):
+            text = _extract_text(pdf_path)
+    except (requests.exceptions.RequestException, OSError) as e:
+        logger.warning(f"Error downloading PDF for {paper_id}: {e}")
+        return None
+    except Exception as e:
+        # pypdf는 손상된 PDF에서 다양한 예외를 던짐
+        logger.warning(f"Error extracting text from PDF for {paper_id}: {e}")
+        return None
+    finally:
+        if os.path.exists(pdf_path):
+            os.remove(pdf_path)
+
+    tmp_path = cache_path + '.tmp'
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, cache_path)
+    logger.info(f"Extracted {len(text)} characters of full text for {paper_id}")
+    return text
+
+
+def extract_sections(text):
+    """
+    본문에서 실험/결과/결론 섹션을 찾아 반환합니다.
+
+    Returns:
+        {'experimental': str, 'results': str, 'conclusions': str} 중 찾은 섹션만
+    """
+    text = text or ''
+    # 섹션은 다음 제목(번호 있는 제목, 참고문헌, 다른 발췌 대상 제목) 직전까지
+    boundaries = sorted({m.start() for m in _ANY_HEADING_RE.finditer(text)}
+                        | {m.start() for m in _HEADING_RE.finditer(text)} | {len(text)})
+
+    sections = {}
+    for match in _HEADING_RE.finditer(text):
+        name = next(key for key, _ in SECTION_PATTERNS if match.group(key))
+        if name in sections:
+            continue
+        end = next(b for b in boundaries if b >= match.end())
+        body = text[match.end():end].strip()
+        if body:
+            sections[name] = re.sub(r'\s+', ' ', body)
+    return sections
+
+
+def build_excerpt(paper_id):
+    """요약 프롬프트에 넣을 섹션 발췌문을 만듭니다. 없으면 None."""
+    sections = extract_sections(get_fulltext(paper_id))
+    if not sections:
+        return None
+    budget = _settings['excerpt_chars'] // len(sections)
+    return '\n\n'.join(
+        f"[{name.capitalize()}]\n{sections[name][:budget]}"
+        for name, _ in SECTION_PATTERNS if name in sections
+    )
+
@@ -0,0 +1,42 @@
+"""
+공유 HTTP 세션
+
+Semantic Scholar, OpenRouter 호출이 하나의 `requests.Session`을 공유하여
+호스트별 연결(TLS 핸드셰이크 포함)을 재사용합니다.
+watch 모드처럼 프로세스가 오래 떠 있을 때 요청마다 새 연결을 맺지 않도록 하기 위함입니다.
+"""
+import threading
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# 호스트당 유지할 연결 수 (OpenRouter 동시 요청 + 헤지 요청을 감당할 만큼)
+POOL_MAXSIZE = 16
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """프로세스 전체에서 공유하는 세션을 반환합니다 (처음 호출 시 생성)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
+def close_session():
+    """공유 세션의 연결을 모두 닫습니다."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,266 @@
+"""
+arXiv 검색 API 응답 디스크 캐시
+
+같은 날 워크플로를 다시 실행하거나 필터 설정을 바꿔 가며 개발할 때는 같은 `arxiv.Search` 페이지를
+다시 요청하게 되는데, 요청마다 arXiv 간격(기본 3초)만큼 기다려야 합니다.
+arXiv 클라이언트 세션에 캐시 어댑터를 붙여 같은 페이지는 디스크에서 읽습니다.
+
+- 키는 쿼리 파라미터를 정렬한 URL입니다.
+- 신선도: 저장 후 `ttl_minutes`가 지나지 않았고, 그 사이 arXiv 발표 시각(`watch` 설정)이 없었을 때만 재사용합니다.
+  발표 창 안에서 저장한 응답은 목록이 계속 바뀌는 중이므로 항상 재검증합니다.
+- 신선하지 않은 응답에 ETag/Last-Modified가 있으면 조건부 요청을 보내고, 304면 캐시 본문을 그대로 씁니다.
+- `<entry>`가 없는 피드는 저장하지 않습니다. arXiv가 가끔 돌려주는 일시적인 빈 페이지를 arxiv 클라이언트가
+  같은 세션으로 다시 요청할 때(UnexpectedEmptyPageError 재시도) 캐시된 빈 페이지가 돌아가지 않도록 합니다.
+- 응답 본문은 zlib으로 압축해 SQLite에 저장하며, 전체 크기가 `max_mb`를 넘으면 오래 쓰지 않은 항목부터 지웁니다.
+- 네트워크로 나가는 요청만 ARXIV_LIMITER 간격을 따르므로 캐시 적중은 대기 없이 반환됩니다.
+"""
+import os
+import json
+import time
+import zlib
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from utils.cache import CACHE_DIR, ensure_cache_dir
+from utils.rate_limit import ARXIV_LIMITER
+from utils.watch import AnnouncementSchedule
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_FILE = os.path.join(CACHE_DIR, 'http_cache.sqlite3')
+
+# arXiv 클라이언트는 타임아웃을 지정하지 않으므로 어댑터에서 기본값을 씀 (연결, 읽기)
+DEFAULT_TIMEOUT = (10, 60)
+
+_TRANSPORT_HEADERS = frozenset(('content-encoding', 'content-length', 'transfer-encoding', 'connection'))
+_ENTRY_TAG = b'<entry'
+
+_settings = {
+    'enabled': True,
+    'ttl_minutes': 180,     # 발표 시각을 넘지 않는 범위에서 응답을 재사용하는 시간
+    'max_mb': 50,           # 캐시 DB의 응답 본문 총량 상한
+    'path': HTTP_CACHE_FILE,
+}
+_schedule = AnnouncementSchedule()
+_adapters = []
+
+
+def configure_http_cache(settings=None, watch_settings=None):
+    """config.yml의 `http_cache` 섹션과 발표 시각(`watch`)을 적용합니다."""
+    global _schedule
+    settings = settings or {}
+    for key in _settings:
+        if key in settings:
+            _settings[key] = settings[key]
+    _schedule = AnnouncementSchedule(watch_settings)
+
+
+def is_enabled():
+    return bool(_settings['enabled'])
+
+
+def normalize_url(url):
+    """쿼리 파라미터 순서가 달라도 같은 키가 되도록 정렬한 URL"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+def has_entries(body):
+    """Atom 피드 본문에 논문(`<entry>`)이 하나라도 있는지 확인합니다."""
+    return _ENTRY_TAG in (body or b'')
+
+
+def fresh_until(stored_at, ttl_seconds, schedule=None):
+    """
+    저장 시각 기준으로 응답을 그대로 재사용할 수 있는 마지막 시각 (epoch 초)
+
+    발표 창 안에서 저장한 응답은 재사용하지 않으며 (저장 시각 반환),
+    창 밖에서 저장한 응답은 TTL과 다음 발표 시각 중 이른 쪽까지 재사용합니다.
+    """
+    schedule = schedule or _schedule
+    stored = datetime.fromtimestamp(stored_at, timezone.utc)
+    announce, start, end = schedule.next_window(stored)
+    if start <= stored < end:
+        return stored_at
+    return min(stored_at + ttl_seconds, announce.timestamp())
+
+
+class ResponseCache:
+    """SQLite 기반 응답 저장소 (스레드 안전)"""
+
+    def __init__(self, path=None, max_bytes=None):
+        self.path = path or _settings['path']
+        self.max_bytes = max_bytes if max_bytes is not None else int(_settings['max_mb'] * 1024 * 1024)
+        self._lock = threading.Lock()
+        ensure_cache_dir()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY, status INTEGER, headers TEXT, body BLOB, size INTEGER,"
+            " etag TEXT, last_modified TEXT, stored_at REAL, accessed_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+        status, headers, body, etag, last_modified, stored_at = row
+        return {
+            'status': status, 'headers': json.loads(headers), 'body': zlib.decompress(body),
+            'etag': etag, 'last_modified': last_modified, 'stored_at': stored_at,
+        }
+
+    def put(self, url, status, headers, body):
+        compressed = zlib.compress(body)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, status, json.dumps(headers), compressed, len(compressed),
+                 headers.get('ETag'), headers.get('Last-Modified'), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url):
+        """304 응답을 받은 항목의 저장 시각을 갱신합니다."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            self._conn.commit()
+
+    def _evict(self):
+        """총량이 상한을 넘으면 오래 쓰지 않은 항목부터 지웁니다 (잠금은 호출자가 보유)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for url, size in self._conn.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            evicted += 1
+        logger.debug("Evicted %s cached responses", evicted)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """네트워크 요청에 전역 리미터 간격과 기본 타임아웃을 적용하는 어댑터"""
+
+    def __init__(self, limiter=None, **kwargs):
+        super().__init__(**kwargs)
+        self.limiter = limiter
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = DEFAULT_TIMEOUT
+        if self.limiter is None:
+            return super().send(request, **kwargs)
+        with self.limiter:
+            return super().send(request, **kwargs)
+
+
+class CachingAdapter(ThrottledAdapter):
+    """GET 응답을 ResponseCache에 저장하고 재사용하는 어댑터 (네트워크로 나갈 때만 간격 제한)"""
+
+    def __init__(self, cache, limiter=None, **kwargs):
+        super().__init__(limiter=limiter, **kwargs)
+        self.cache = cache
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def _build_response(self, request, entry):
+        response = Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body']
+        response.url = request.url
+        response.request = request
+        response.reason = 'OK'
+        response.encoding = 'utf-8'
+        response.connection = self
+        return response
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        key = normalize_url(request.url)
+        entry = self.cache.get(key)
+        if entry and not has_entries(entry['body']):
+            # 이전 버전에서 저장된 빈 페이지는 없는 것으로 취급
+            entry = None
+        if entry and time.time() < fresh_until(entry['stored_at'], _settings['ttl_minutes'] * 60):
+            self.hits += 1
+            logger.debug("HTTP cache hit %s", key)
+            return self._build_response(request, entry)
+
+        if entry:
+            # 조건부 요청으로 재검증
+            if entry['etag']:
+                request.headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request.headers['If-Modified-Since'] = entry['last_modified']
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and entry:
+            self.revalidated += 1
+            self.cache.touch(key)
+            return self._build_response(request, entry)
+
+        self.misses += 1
+        if response.status_code == 200 and has_entries(response.content):
+            # 본문은 이미 압축 해제되어 있으므로 전송 관련 헤더는 저장하지 않음
+            headers = {name: value for name, value in response.headers.items()
+                       if name.lower() not in _TRANSPORT_HEADERS}
+            self.cache.put(key, response.status_code, headers, response.content)
+        return response
+
+
+def install_http_cache(session, url_prefix, limiter=ARXIV_LIMITER):
+    """
+    세션에서 `url_prefix`로 시작하는 요청에 캐시 어댑터를 붙입니다.
+
+    캐시가 비활성화되어 있거나 DB를 열 수 없으면 간격 제한만 하는 어댑터를 붙입니다.
+
+    Returns:
+        붙인 어댑터 (CachingAdapter 또는 ThrottledAdapter)
+    """
+    cache = None
+    if is_enabled():
+        try:
+            cache = ResponseCache()
+        except sqlite3.Error as e:
+            logger.warning(f"Error opening HTTP cache, requests will not be cached: {e}")
+    adapter = CachingAdapter(cache, limiter=limiter) if cache else ThrottledAdapter(limiter)
+    session.mount(url_prefix, adapter)
+    if cache:
+        _adapters.append(adapter)
+    return adapter
+
+
+def log_cache_stats():
+    """설치된 캐시 어댑터의 적중/재검증/미스 횟수를 로그로 남깁니다."""
+    for adapter in _adapters:
+        logger.info(f"  [http_cache] {adapter.hits} hits, {adapter.revalidated} revalidated (304), "
+                    f"{adapter.misses} fetched")
+
@@ -0,0 +1,428 @@
+"""
+키워드 표준 어휘 유틸리티
+
+LLM이 추출한 자유 형식 키워드를 정수 ID로 표준화합니다.
+- "Ni-rich cathodes", "Ni-rich cathode", "High-nickel cathode"처럼 표기만 다른 키워드는
+  정규화(소문자, 구분자 통일, 단수형, 동의어)와 문자 3-gram 유사도로 같은 ID에 매핑됩니다.
+- 화학식 토큰("Li6PS5Cl", "LiFePO4", "LiCoO")은 철자가 비슷해도 다른 물질이므로 정확히 일치할 때만 매핑됩니다.
+- 앞 단어들의 머리글자인 괄호 약어("Density functional theory (DFT)")는 떼고 비교합니다.
+- LaTeX 표기("LiMn$_2$O$_4$")는 일반 텍스트("LiMn2O4")로 풀어 라벨과 비교에 씁니다.
+- 정규화 규칙이 바뀌면 `rebuild_vocabulary()`로 어휘를 다시 만들어 같은 키워드가 된 ID를 하나로 합칩니다.
+- 어휘는 `_data/keyword_vocab.yml`에 저장되고 (목록 순서 = ID),
+  논문 데이터에는 `keyword_ids` 정수 목록만 저장합니다.
+"""
+import re
+import threading
+import unicodedata
+import logging
+from collections import Counter
+
+from utils.yaml_helper import load_yaml, save_yaml
+
+logger = logging.getLogger(__name__)
+
+VOCAB_FILE = '_data/keyword_vocab.yml'
+
+# 3-gram Dice 유사도가 이 값 이상이면 같은 키워드로 간주
+SIMILARITY_THRESHOLD = 0.85
+# 서로 다른 단어끼리의 3-gram 유사도 하한 (철자 변형만 허용)
+WORD_SIMILARITY_THRESHOLD = 0.6
+# 이보다 짧은 정규형은 오탐이 많으므로 정확히 일치할 때만 매핑
+MIN_FUZZY_LENGTH = 6
+
+# 단어 단위 동의어/약어 (정규화 후 적용)
+_TOKEN_SYNONYMS = {
+    'li': 'lithium',
+    'na': 'sodium',
+    'si': 'silicon',
+    'ni': 'nickel',
+    'libs': 'lithium ion battery',
+    'lib': 'lithium ion battery',
+    'dft': 'density functional theory',
+    'sei': 'solid electrolyte interphase',
+    'cei': 'cathode electrolyte interphase',
+    'ssb': 'solid state battery',
+    'ml': 'machine learning',
+    '리튬이온': 'lithium ion',
+    '리튬': 'lithium',
+    '이온': 'ion',
+    '배터리': 'battery',
+    '전지': 'battery',
+    '양극재': 'cathode material',
+    '음극재': 'anode material',
+    '덴드라이트': 'dendrite',
+}
+
+# 구문 단위 동의어 (단어 동의어 적용 후)
+_PHRASE_SYNONYMS = {
+    'nickel rich': 'high nickel',
+    'density functional theory calculation': 'density functional theory',
+}
+
+_SEPARATOR_RE = re.compile(r'[\s\-_/‐-―]+')
+# 괄호 속 약어 ("(DFT)", "(LIBs)")
+_ACRONYM_RE = re.compile(r'\s*\(([A-Za-z][A-Za-z0-9]{1,9})\)')
+# LaTeX 글꼴 명령과 아래/위 첨자
+_LATEX_COMMAND_RE = re.compile(r'\\(?:text|mathrm|mathbf|mathit|rm|bf|it)\b')
+_LATEX_SCRIPT_RE = re.compile(r'[_^]\{([^{}]*)\}|[_^](\w)')
+_STRIP_RE = re.compile(r"[^\w\s+.]")
+# 원소 기호가 둘 이상 이어진 표기 ("LiCoO", "NaCl", "LiPON")
+_ELEMENT_SEQUENCE_RE = re.compile(r'^(?:[A-Z][a-z]?){2,}$')
+
+
+def _singularize(token):
+    """영어 복수형을 단수형으로 (간단한 규칙 기반)"""
+    if not token.isascii() or not token.isalpha() or len(token) <= 3:
+        return token
+    if token.endswith('ies') and len(token) > 4:
+        return token[:-3] + 'y'
+    if token.endswith(('sses', 'xes')):
+        return token[:-2]
+    if token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+
+def clean_label(keyword):
+    """
+    LaTeX 표기를 일반 텍스트로 풉니다 (표시용 라벨과 정규화에 사용).
+
+    예: "$\\text{Li}_2\\text{MnO}_3$" -> "Li2MnO3", "DFT+$U$" -> "DFT+U"
+    """
+    text = unicodedata.normalize('NFKC', str(keyword or '')).strip()
+    if '$' not in text and '\\' not in text:
+        return text
+    text = _LATEX_COMMAND_RE.sub('', text)
+    text = _LATEX_SCRIPT_RE.sub(lambda m: m.group(1) or m.group(2), text)
+    text = re.sub(r'[${}\\]', '', text)
+    return ' '.join(text.split())
+
+
+def _drop_defined_acronyms(text):
+    """
+    앞 단어들의 머리글자인 괄호 약어를 지웁니다.
+
+    "Density functional theory (DFT)" -> "Density functional theory" (약어만 쓴 "DFT"는 동의어로 처리)
+    머리글자가 맞지 않는 괄호("Lithium sulfide (Li2S)")는 그대로 둡니다.
+    """
+    def replace(match):
+        acronym = match.group(1)
+        if acronym.endswith('s') and acronym[:-1].isupper():
+            acronym = acronym[:-1]  # 복수형 약어 ("LIBs")
+        letters = [c.lower() for c in acronym if c.isalpha()]
+        words = [w for w in _SEPARATOR_RE.split(text[:match.start()]) if w]
+        if len(words) >= len(letters) and all(
+                word[0].lower() == letter for word, letter in zip(words[-len(letters):], letters)):
+            return ''
+        return match.group(0)
+
+    return _ACRONYM_RE.sub(replace, text)
+
+
+def normalize_keyword(keyword):
+    """
+    키워드를 비교용 정규형으로 변환합니다.
+
+    Args:
+        keyword: 원본 키워드 문자열
+
+    Returns:
+        정규화된 문자열 (예: "Li-ion batteries" -> "lithium ion battery")
+    """
+    text = _drop_defined_acronyms(clean_label(keyword)).lower()
+    text = _SEPARATOR_RE.sub(' ', _STRIP_RE.sub(' ', text)).strip()
+
+    tokens = []
+    for token in text.split():
+        token = _singularize(token)
+        tokens.extend(_TOKEN_SYNONYMS.get(token, token).split())
+    half = len(tokens) // 2
+    if half and len(tokens) % 2 == 0 and tokens[:half] == tokens[half:]:
+        # 동의어 전개로 같은 구가 반복된 경우 ("DFT (density functional theory)")
+        tokens = tokens[:half]
+    text = ' '.join(tokens)
+
+    for phrase, canonical in _PHRASE_SYNONYMS.items():
+        if phrase in text:
+            text = re.sub(rf'\b{re.escape(phrase)}\b', canonical, text)
+    return text
+
+
+def _exact_tokens(keyword, form):
+    """
+    유사도로 합치면 안 되는 정규형 토큰 (화학식)을 찾습니다.
+
+    숫자를 포함한 토큰("li6ps5cl", "lifepo4")과, 원본에서 대소문자가 섞인 원소 기호 나열("LiCoO")입니다.
+    정규형은 소문자이므로 대소문자는 원본 키워드에서 확인합니다.
+    """
+    text = clean_label(keyword)
+    mixed_case = {
+        token.lower() for token in _SEPARATOR_RE.split(_STRIP_RE.sub(' ', text))
+        if _ELEMENT_SEQUENCE_RE.match(token) and not token.isupper()
+    }
+    return frozenset(
+        token for token in form.split()
+        if token in mixed_case or any(c.isdigit() for c in token)
+    )
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _dice(a, b):
+    return 2 * len(a & b) / (len(a) + len(b)) if a or b else 0.0
+
+
+def _same_words(form, other, exact=frozenset()):
+    """
+    단어 수가 같고, 서로 다른 단어끼리도 철자가 비슷한지 확인합니다.
+    ("cation disorder" ~ "cation disordered"는 허용, "SEI 형성" ~ "SEI layer"는 거부)
+    `exact`에 든 토큰(화학식)은 정확히 같아야 합니다 ("Li6PS5Cl" ~ "Li6PS5Br"는 거부).
+    """
+    words, other_words = form.split(), other.split()
+    if len(words) != len(other_words):
+        return False
+    return all(
+        a == b or (a not in exact and b not in exact
+                   and _dice(_trigrams(a), _trigrams(b)) >= WORD_SIMILARITY_THRESHOLD)
+        for a, b in zip(words, other_words)
+    )
+
+
+class KeywordVocabulary:
+    """정수 ID <-> 표준 키워드 어휘 (스레드 안전)"""
+
+    def __init__(self, entries=None, threshold=SIMILARITY_THRESHOLD):
+        """
+        Args:
+            entries: [{'id', 'label', 'aliases'}] 목록 (저장 파일 형식)
+            threshold: 3-gram 유사도 임계값
+        """
+        self.threshold = threshold
+        self._labels = []          # ID -> 표시용 라벨
+        self._aliases = []         # ID -> 지금까지 본 원본 표기 목록
+        self._by_form = {}         # 정규형 -> ID
+        self._form_grams = {}      # 정규형 -> 3-gram 집합
+        self._form_exact = {}      # 정규형 -> 정확히 일치해야 하는 토큰 (화학식)
+        self._gram_index = {}      # 3-gram -> 정규형 집합 (역색인)
+        self._lock = threading.RLock()
+        self.dirty = False
+
+        for entry in sorted(entries or [], key=lambda e: e['id']):
+            if entry['id'] != len(self._labels):
+                raise ValueError(f"Keyword vocabulary IDs must be contiguous (got {entry['id']}).")
+            self._labels.append(entry['label'])
+            self._aliases.append(list(entry.get('aliases') or [entry['label']]))
+            for alias in self._aliases[-1]:
+                form = normalize_keyword(alias)
+                self._add_form(form, entry['id'], _exact_tokens(alias, form))
+
+    def __len__(self):
+        return len(self._labels)
+
+    def _add_form(self, form, keyword_id, exact=frozenset()):
+        if not form or form in self._by_form:
+            return
+        self._by_form[form] = keyword_id
+        self._form_exact[form] = exact
+        grams = _trigrams(form)
+        self._form_grams[form] = grams
+        for gram in grams:
+            self._gram_index.setdefault(gram, set()).add(form)
+
+    def _closest_form(self, form, exact=frozenset()):
+        """역색인으로 후보를 좁힌 뒤 Dice 유사도가 가장 높은 정규형을 찾습니다."""
+        grams = _trigrams(form)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._gram_index.get(gram, ()))
+
+        best_form, best_score = None, 0.0
+        for candidate, overlap in shared.items():
+            score = 2 * overlap / (len(grams) + len(self._form_grams[candidate]))
+            # 단어가 추가/삭제된 경우("dendrite" vs "dendrite growth")는 다른 개념으로 봄
+            if score > best_score and _same_words(form, candidate, exact | self._form_exact[candidate]):
+                best_form, best_score = candidate, score
+        return (best_form, best_score) if best_score >= self.threshold else (None, best_score)
+
+    def lookup(self, keyword):
+        """키워드의 ID를 반환합니다. 어휘에 없으면 None."""
+        form = normalize_keyword(keyword)
+        if not form:
+            return None
+        with self._lock:
+            if form in self._by_form:
+                return self._by_form[form]
+            if len(form) >= MIN_FUZZY_LENGTH:
+                match, _ = self._closest_form(form, _exact_tokens(keyword, form))
+                if match is not None:
+                    return self._by_form[match]
+        return None
+
+    def get_or_add(self, keyword):
+        """키워드의 ID를 반환하고, 처음 보는 키워드는 새 ID로 등록합니다."""
+        keyword = str(keyword or '').strip()
+        form = normalize_keyword(keyword)
+        if not form:
+            return None
+
+        with self._lock:
+            keyword_id = self.lookup(keyword)
+            if keyword_id is None:
+                keyword_id = len(self._labels)
+                self._labels.append(clean_label(keyword))
+                self._aliases.append([])
+                logger.debug("New keyword #%d: %s", keyword_id, keyword)
+            elif form not in self._by_form:
+                logger.debug("Keyword '%s' merged into #%d (%s)", keyword, keyword_id, self._labels[keyword_id])
+
+            if keyword not in self._aliases[keyword_id]:
+                self._aliases[keyword_id].append(keyword)
+                self.dirty = True
+            self._add_form(form, keyword_id, _exact_tokens(keyword, form))
+            return keyword_id
+
+    def encode(self, keywords):
+        """키워드 목록을 중복 없는 ID 목록으로 변환합니다 (순서 유지)."""
+        ids = []
+        for keyword in keywords or []:
+            keyword_id = self.get_or_add(keyword)
+            if keyword_id is not None and keyword_id not in ids:
+                ids.append(keyword_id)
+        return ids
+
+    def label(self, keyword_id):
+        with self._lock:
+            return self._labels[keyword_id] if 0 <= keyword_id < len(self._labels) else None
+
+    def labels(self):
+        """ID 순서의 라벨 목록 (피드 사전 내보내기용)"""
+        with self._lock:
+            return list(self._labels)
+
+    def forms(self):
+        """(정규형, ID) 목록 (본문에서 어휘 키워드를 찾는 데 사용)"""
+        with self._lock:
+            return list(self._by_form.items())
+
+    def to_entries(self):
+        with self._lock:
+            return [
+                {'id': i, 'label': label, 'aliases': list(aliases)}
+                for i, (label, aliases) in enumerate(zip(self._labels, self._aliases))
+            ]
+
+
+_vocabulary = None
+_vocabulary_lock = threading.Lock()
+
+
+def load_vocabulary(path=VOCAB_FILE):
+    """어휘 파일을 로드합니다 (한 프로세스에서 한 번만 읽고 공유)."""
+    global _vocabulary
+    with _vocabulary_lock:
+        if _vocabulary is None:
+            _vocabulary = KeywordVocabulary(load_yaml(path) or [])
+            logger.info(f"Loaded keyword vocabulary: {len(_vocabulary)} keywords")
+        return _vocabulary
+
+
+def save_vocabulary(path=VOCAB_FILE):
+    """변경된 어휘를 저장합니다."""
+    with _vocabulary_lock:
+        vocabulary = _vocabulary
+    if vocabulary is None or not vocabulary.dirty:
+        return False
+    if save_yaml(vocabulary.to_entries(), path):
+        vocabulary.dirty = False
+        return True
+    return False
+
+
+def migrate_data_files(paths, path=VOCAB_FILE):
+    """
+    자유 형식 `keywords`를 가진 데이터 파일을 `keyword_ids`로 변환합니다.
+
+    Args:
+        paths: today/archive YAML 파일 경로 목록
+
+    Returns:
+        변환된 논문 수
+    """
+    vocabulary = load_vocabulary(path)
+    migrated = 0
+    for data_path in paths:
+        papers = load_yaml(data_path)
+        if not isinstance(papers, list):
+            continue
+        changed = False
+        for i, paper in enumerate(papers):
+            if 'keywords' in paper:
+                # 필드 순서를 유지한 채 keywords -> keyword_ids 교체
+                papers[i] = {
+                    ('keyword_ids' if key == 'keywords' else key):
+                        (vocabulary.encode(value) if key == 'keywords' else value)
+                    for key, value in paper.items()
+                }
+                migrated += 1
+                changed = True
+        if changed:
+            save_yaml(papers, data_path)
+    save_vocabulary(path)
+    logger.info(f"Migrated {migrated} papers; vocabulary has {len(vocabulary)} keywords")
+    return migrated
+
+
+def rebuild_vocabulary(paths, path=VOCAB_FILE):
+    """
+    현재 정규화 규칙으로 어휘를 다시 만들고 데이터 파일의 `keyword_ids`를 새 ID로 바꿉니다.
+
+    규칙이 바뀌어 같은 키워드가 된 ID("Density functional theory (DFT)"와 "DFT")는
+    먼저 등록된 ID 하나로 합쳐지고, 이후 ID는 빈자리 없이 당겨집니다.
+
+    Args:
+        paths: today/archive YAML 파일 경로 목록
+
+    Returns:
+        {이전 ID: 새 ID} 매핑 (로컬 모델 카운터 등 ID를 저장한 곳을 함께 갱신할 때 사용)
+    """
+    global _vocabulary
+    old_entries = load_vocabulary(path).to_entries()
+    vocabulary = KeywordVocabulary(threshold=SIMILARITY_THRESHOLD)
+    mapping = {}
+    for entry in old_entries:
+        mapping[entry['id']] = vocabulary.get_or_add(entry['label'])
+        for alias in entry['aliases']:
+            vocabulary.get_or_add(alias)
+
+    rewritten = 0
+    for data_path in paths:
+        papers = load_yaml(data_path)
+        if not isinstance(papers, list):
+            continue
+        changed = False
+        for paper in papers:
+            old_ids = paper.get('keyword_ids')
+            if not old_ids:
+                continue
+            new_ids = []
+            for old_id in old_ids:
+                new_id = mapping.get(old_id)
+                if new_id is not None and new_id not in new_ids:
+                    new_ids.append(new_id)
+            if new_ids != old_ids:
+                paper['keyword_ids'] = new_ids
+                rewritten += 1
+                changed = True
+        if changed:
+            save_yaml(papers, data_path)
+
+    with _vocabulary_lock:
+        _vocabulary = vocabulary
+    vocabulary.dirty = True
+    save_vocabulary(path)
+    logger.info(f"Rebuilt keyword vocabulary: {len(old_entries)} -> {len(vocabulary)} keywords; "
+                f"{rewritten} papers updated")
+    return mapping
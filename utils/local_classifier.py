@@ -0,0 +1,401 @@
+"""
+로컬 카테고리 분류기 / 키워드 추출기
+
+아카이브에 쌓인 LLM 라벨(`category`, `keyword_ids`)로 가벼운 모델을 학습하여,
+확신도가 높은 논문은 LLM 호출 없이 로컬에서 답하고 낮을 때만 LLM으로 넘깁니다.
+
+- 카테고리: 다항 나이브 베이즈 (영어 단어 + 한글 음절 bigram).
+  나이브 베이즈의 사후 확률은 과신하는 경향이 있으므로, 확신도는 1, 2위 클래스의 토큰당 로그 점수 차이(margin)로 보고
+  아카이브 교차 검증에서 LLM 라벨과의 일치율이 `target_agreement` 이상이 되는 margin 하한을 찾아 사용합니다.
+- 키워드: 어휘(keyword_vocab)의 정규형이 본문에 나타났을 때 LLM이 실제로 그 키워드를 고른 비율
+  P(선택 | 등장)을 학습하여, 비율이 높은 키워드를 고릅니다.
+- 학습은 점진적입니다. 처음에는 아카이브(제목 + 요약)로 초기화하고,
+  이후에는 LLM이 라벨을 붙인 새 논문(제목 + 초록)을 처리할 때마다 바로 반영합니다.
+  로컬 모델이 답한 라벨은 학습에 쓰지 않습니다 (자기 강화 방지).
+- 모델 상태는 `.cache/local_models.json`에 저장합니다.
+"""
+import os
+import re
+import json
+import math
+import random
+import logging
+import threading
+from collections import Counter
+
+from utils.cache import CACHE_DIR, ensure_cache_dir
+from utils.yaml_helper import load_yaml
+from utils.keyword_vocab import load_vocabulary, normalize_keyword
+from utils.seen_index import base_arxiv_id
+from utils.summarizer import PAPER_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE = os.path.join(CACHE_DIR, 'local_models.json')
+MODEL_VERSION = 1
+
+# 라벨 출처 (논문 데이터의 category_source / keywords_source)
+SOURCE_LOCAL = 'local'
+
+_settings = {
+    'enabled': True,
+    'target_agreement': 0.9,        # 로컬 카테고리 답이 LLM 라벨과 일치해야 하는 비율 (margin 보정 기준)
+    'keyword_min_matches': 3,       # 확신 키워드가 이 개수 이상이면 로컬 답 사용
+    'keyword_min_probability': 0.6, # P(선택 | 등장)이 이 값 이상인 키워드만 확신 키워드로 봄
+    'min_training_papers': 50,      # 학습한 논문이 이보다 적으면 항상 LLM 사용
+}
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_TOKEN_RE = re.compile(r'[a-z][a-z0-9\-]+|[가-힣]+')
+_STOPWORDS = frozenset(
+    'the and for with from this that these those are was were been has have had its their into onto '
+    'than then also such which while when where via using used use based show shows shown can may '
+    'our we here both between during under over upon across within'.split()
+)
+
+
+def configure_local_models(settings=None):
+    """config.yml의 `local_models` 섹션을 적용합니다."""
+    settings = settings or {}
+    for key in _settings:
+        if key in settings:
+            _settings[key] = settings[key]
+
+
+def is_enabled():
+    return bool(_settings['enabled'])
+
+
+def tokenize(text):
+    """영어 단어와 한글 음절 bigram 토큰 목록"""
+    tokens = []
+    for word in _TOKEN_RE.findall(_TAG_RE.sub(' ', str(text or '')).lower()):
+        if word[0] < '가':
+            if word not in _STOPWORDS:
+                tokens.append(word)
+        elif len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def paper_text(paper, abstract=None):
+    """학습/예측에 쓰는 논문 텍스트 (영어 제목 + 초록, 초록이 없으면 요약)"""
+    title = paper.get('title_en') or paper.get('title') or ''
+    return f"{title}\n{abstract if abstract is not None else _TAG_RE.sub(' ', paper.get('summary') or '')}"
+
+
+class NaiveBayesClassifier:
+    """다항 나이브 베이즈 (라플라스 평활화, 점진 학습)"""
+
+    def __init__(self, alpha=1.0, state=None):
+        self.alpha = alpha
+        state = state or {}
+        self.doc_counts = Counter(state.get('doc_counts', {}))
+        self.token_counts = {label: Counter(counts) for label, counts in state.get('token_counts', {}).items()}
+        self.token_totals = Counter({label: sum(c.values()) for label, c in self.token_counts.items()})
+        self.vocab = {token for counts in self.token_counts.values() for token in counts}
+
+    def learn(self, tokens, label):
+        self.doc_counts[label] += 1
+        counts = self.token_counts.setdefault(label, Counter())
+        counts.update(tokens)
+        self.token_totals[label] += len(tokens)
+        self.vocab.update(tokens)
+
+    def predict(self, tokens):
+        """
+        Returns:
+            (라벨, margin) - margin은 1위와 2위 클래스의 토큰당 로그 점수 차이
+            (학습 데이터가 없으면 (None, 0.0))
+        """
+        total_docs = sum(self.doc_counts.values())
+        if not total_docs:
+            return None, 0.0
+
+        features = Counter(token for token in tokens if token in self.vocab)
+        length = max(1, sum(features.values()))
+        vocab_size = len(self.vocab)
+        scores = {}
+        for label, docs in self.doc_counts.items():
+            counts = self.token_counts.get(label, {})
+            denominator = math.log(self.token_totals[label] + self.alpha * vocab_size)
+            score = math.log(docs / total_docs)
+            for token, n in features.items():
+                score += n * (math.log(counts.get(token, 0) + self.alpha) - denominator)
+            # 긴 텍스트일수록 점수 차가 커지는 것을 막기 위해 토큰 수로 나눔
+            scores[label] = score / length
+
+        ranked = sorted(scores.values(), reverse=True)
+        best = max(scores, key=scores.get)
+        return best, (ranked[0] - ranked[1]) if len(ranked) > 1 else 0.0
+
+    def to_state(self):
+        return {'doc_counts': dict(self.doc_counts),
+                'token_counts': {label: dict(counts) for label, counts in self.token_counts.items()}}
+
+
+class KeywordMatcher:
+    """어휘 키워드의 P(LLM이 선택 | 본문에 등장) 학습 및 추출"""
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.present = Counter({int(k): v for k, v in state.get('present', {}).items()})
+        self.chosen = Counter({int(k): v for k, v in state.get('chosen', {}).items()})
+
+    @staticmethod
+    def find(text):
+        """본문에 정규형이 나타나는 어휘 키워드 ID 집합"""
+        normalized = f" {normalize_keyword(text)} "
+        return {keyword_id for form, keyword_id in load_vocabulary().forms() if f" {form} " in normalized}
+
+    def learn(self, text, keyword_ids):
+        found = self.find(text)
+        self.present.update(found)
+        self.chosen.update(found & set(keyword_ids))
+
+    def probability(self, keyword_id):
+        return (self.chosen[keyword_id] + 1) / (self.present[keyword_id] + 2)
+
+    def extract(self, text, limit=5):
+        """
+        Returns:
+            확률 순으로 정렬된 [(keyword_id, P(선택 | 등장))] (최대 limit개)
+        """
+        ranked = sorted(((kid, self.probability(kid)) for kid in self.find(text)), key=lambda x: -x[1])
+        return ranked[:limit]
+
+    def remap(self, mapping):
+        """어휘 재구성 후 카운터를 새 ID로 옮깁니다 (합쳐진 ID의 횟수는 더함)."""
+        for name in ('present', 'chosen'):
+            remapped = Counter()
+            for keyword_id, count in getattr(self, name).items():
+                if keyword_id in mapping:
+                    remapped[mapping[keyword_id]] += count
+            setattr(self, name, remapped)
+
+    def to_state(self):
+        return {'present': dict(self.present), 'chosen': dict(self.chosen)}
+
+
+class LocalModels:
+    """카테고리 분류기와 키워드 추출기 묶음 (스레드 안전)"""
+
+    def __init__(self, state=None):
+        state = state if (state or {}).get('version') == MODEL_VERSION else {}
+        self.category = NaiveBayesClassifier(state=state.get('category'))
+        self.keywords = KeywordMatcher(state.get('keywords'))
+        self.trained = {task: set(ids) for task, ids in (state.get('trained') or {}).items()}
+        self.category_margin = state.get('category_margin')  # 보정된 margin 하한 (None이면 항상 LLM)
+        self._lock = threading.RLock()
+        self.dirty = False
+
+    def _trained(self, task):
+        return self.trained.setdefault(task, set())
+
+    def learn(self, paper_id, text, category=None, keyword_ids=None):
+        """LLM이 붙인 라벨을 학습합니다 (이미 학습한 논문은 무시)."""
+        base_id = base_arxiv_id(paper_id)
+        with self._lock:
+            if category in PAPER_CATEGORIES and base_id not in self._trained('category'):
+                self.category.learn(tokenize(text), category)
+                self._trained('category').add(base_id)
+                self.dirty = True
+            if keyword_ids and base_id not in self._trained('keywords'):
+                self.keywords.learn(text, keyword_ids)
+                self._trained('keywords').add(base_id)
+                self.dirty = True
+
+    def learn_papers(self, papers):
+        """데이터 파일의 논문 목록에서 LLM 라벨만 학습합니다. 학습한 논문 수를 반환합니다."""
+        before = sum(len(ids) for ids in self.trained.values())
+        for paper in papers:
+            if not paper.get('paper_id'):
+                continue
+            self.learn(
+                paper['paper_id'], paper_text(paper),
+                category=None if paper.get('category_source') == SOURCE_LOCAL else paper.get('category'),
+                keyword_ids=None if paper.get('keywords_source') == SOURCE_LOCAL else paper.get('keyword_ids'),
+            )
+        return sum(len(ids) for ids in self.trained.values()) - before
+
+    def bootstrap(self, archive_paths):
+        """아직 학습하지 않은 아카이브 논문을 학습합니다."""
+        papers = [paper for path in archive_paths for paper in (load_yaml(path) or [])]
+        with self._lock:
+            learned = self.learn_papers(papers)
+            if learned or self.category_margin is None:
+                # 라벨이 늘었으면 확신도 기준을 다시 보정
+                report = evaluate_agreement(papers)
+                self.category_margin = report['category']['margin']
+                self.dirty = True
+        if learned:
+            logger.info(f"Local models learned {learned} labels from the archive "
+                        f"({len(self._trained('category'))} category / {len(self._trained('keywords'))} keyword papers); "
+                        f"category margin {self.category_margin}")
+
+    def remap_keywords(self, mapping):
+        """`rebuild_vocabulary()`가 반환한 {이전 ID: 새 ID}로 키워드 통계를 갱신합니다."""
+        with self._lock:
+            if self.keywords.present:
+                self.keywords.remap(mapping)
+                self.dirty = True
+
+    def predict_category(self, text):
+        """확신도가 충분하면 카테고리를, 아니면 None을 반환합니다."""
+        with self._lock:
+            if len(self._trained('category')) < _settings['min_training_papers'] or self.category_margin is None:
+                return None
+            label, margin = self.category.predict(tokenize(text))
+        if label is not None and margin >= self.category_margin:
+            logger.debug("Local category %s (margin %.3f)", label, margin)
+            return label
+        return None
+
+    def extract_keywords(self, text):
+        """확신 키워드가 충분하면 키워드 ID 목록을, 아니면 None을 반환합니다."""
+        with self._lock:
+            if len(self._trained('keywords')) < _settings['min_training_papers']:
+                return None
+            ranked = self.keywords.extract(text)
+        confident = [kid for kid, p in ranked if p >= _settings['keyword_min_probability']]
+        if len(confident) >= _settings['keyword_min_matches']:
+            logger.debug("Local keywords %s", confident)
+            return confident
+        return None
+
+    def to_state(self):
+        with self._lock:
+            return {
+                'version': MODEL_VERSION,
+                'category': self.category.to_state(),
+                'keywords': self.keywords.to_state(),
+                'trained': {task: sorted(ids) for task, ids in self.trained.items()},
+                'category_margin': self.category_margin,
+            }
+
+
+_models = None
+_models_lock = threading.Lock()
+
+
+def load_local_models(path=MODEL_FILE):
+    """모델 상태를 로드합니다 (한 프로세스에서 한 번만 읽고 공유)."""
+    global _models
+    with _models_lock:
+        if _models is None:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = None
+            _models = LocalModels(state)
+        return _models
+
+
+def save_local_models(path=MODEL_FILE):
+    """학습 내용이 바뀌었으면 모델 상태를 저장합니다."""
+    with _models_lock:
+        models = _models
+    if models is None or not models.dirty:
+        return False
+    try:
+        ensure_cache_dir()
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(models.to_state(), f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        models.dirty = False
+        return True
+    except OSError as e:
+        logger.warning(f"Error saving local models: {e}")
+        return False
+
+
+def calibrate_margin(results, target, min_covered=10):
+    """
+    교차 검증 결과에서 일치율이 target 이상인 가장 낮은 margin 하한을 찾습니다.
+
+    Args:
+        results: [(margin, 일치 여부)] 목록
+        target: 목표 일치율
+        min_covered: 보정에 필요한 최소 표본 수
+
+    Returns:
+        margin 하한, 조건을 만족하는 값이 없으면 None
+    """
+    threshold, hits = None, 0
+    for count, (margin, hit) in enumerate(sorted(results, key=lambda r: -r[0]), start=1):
+        hits += hit
+        if count >= min_covered and hits / count >= target:
+            threshold = margin
+    return threshold
+
+
+def evaluate_agreement(papers, folds=5, seed=0):
+    """
+    아카이브의 LLM 라벨과 로컬 모델의 일치도를 교차 검증으로 측정합니다.
+
+    Args:
+        papers: 아카이브 논문 목록
+        folds: 교차 검증 분할 수
+
+    Returns:
+        {'category': {...}, 'keywords': {...}} 통계 딕셔너리
+        (category.margin은 target_agreement를 만족하도록 보정한 확신도 하한)
+    """
+    labeled = [p for p in papers if p.get('paper_id')]
+    random.Random(seed).shuffle(labeled)
+
+    category_results = []
+    per_class = {}
+    keyword_papers = keyword_covered = 0
+    true_positive = predicted = expected = 0
+
+    for fold in range(folds):
+        models = LocalModels()
+        models.learn_papers([p for i, p in enumerate(labeled) if i % folds != fold])
+
+        for paper in (p for i, p in enumerate(labeled) if i % folds == fold):
+            text = paper_text(paper)
+            category = paper.get('category')
+            if category in PAPER_CATEGORIES and paper.get('category_source') != SOURCE_LOCAL:
+                label, margin = models.category.predict(tokenize(text))
+                category_results.append((margin, label == category))
+                stats = per_class.setdefault(category, [0, 0])
+                stats[0] += label == category
+                stats[1] += 1
+
+            keyword_ids = set(paper.get('keyword_ids') or [])
+            if keyword_ids and paper.get('keywords_source') != SOURCE_LOCAL:
+                ranked = models.keywords.extract(text)
+                confident = {kid for kid, p in ranked if p >= _settings['keyword_min_probability']}
+                keyword_papers += 1
+                if len(confident) >= _settings['keyword_min_matches']:
+                    keyword_covered += 1
+                    true_positive += len(confident & keyword_ids)
+                    predicted += len(confident)
+                    expected += len(keyword_ids)
+
+    def ratio(a, b):
+        return round(a / b, 3) if b else None
+
+    margin = calibrate_margin(category_results, _settings['target_agreement'])
+    covered = [hit for m, hit in category_results if margin is not None and m >= margin]
+    return {
+        'category': {
+            'papers': len(category_results),
+            'accuracy': ratio(sum(hit for _, hit in category_results), len(category_results)),
+            'margin': round(margin, 4) if margin is not None else None,
+            'coverage': ratio(len(covered), len(category_results)),
+            'accuracy_when_confident': ratio(sum(covered), len(covered)),
+            'per_class': {label: ratio(hits, total) for label, (hits, total) in sorted(per_class.items())},
+        },
+        'keywords': {
+            'papers': keyword_papers,
+            'coverage': ratio(keyword_covered, keyword_papers),
+            'precision_when_confident': ratio(true_positive, predicted),
+            'recall_when_confident': ratio(true_positive, expected),
+        },
+    }
@@ -0,0 +1,211 @@
+"""
+로컬 추출 요약 유틸리티 (네트워크 불필요)
+
+TextRank 방식으로 초록의 문장 중요도를 계산하고, 위치와 단서 표현을 함께 고려하여
+[연구 배경], [연구 방법], [주요 결과] 3단 HTML 요약을 만듭니다.
+API 키가 없거나 LLM 호출을 아끼고 싶은 논문에 사용합니다.
+"""
+import re
+import math
+import html
+import logging
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+# 문장 분리 시 마침표로 끝나도 문장 끝이 아닌 약어
+_ABBREVIATIONS = ('e.g.', 'i.e.', 'et al.', 'etc.', 'vs.', 'Fig.', 'Figs.', 'Eq.', 'ca.', 'approx.', 'Ref.')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9(\[])')
+_TOKEN_RE = re.compile(r'[a-z][a-z0-9\-]*[a-z0-9]|[a-z]')
+_LATEX_RE = re.compile(r'\$([^$]*)\$')
+
+_STOPWORDS = frozenset("""
+a an the and or but if of to in on at by for with from as is are was were be been being this that these those
+it its their there here which who whom whose what when where while than then so such can could may might will would
+shall should do does did has have had not no nor also into onto over under between within without about above below
+we our us they them he she his her i you your one two both each other more most less least very much many further
+however thus therefore moreover furthermore using use used via upon due based show shows shown
+""".split())
+
+# 섹션별 단서 표현 (소문자, 부분 일치)
+_SECTION_CUES = {
+    'background': ('however', 'challenge', 'remain', 'limited', 'limit', 'promising', 'attract', 'important',
+                   'critical', 'demand', 'suffer', 'hinder', 'key', 'essential', 'unclear', 'poorly understood'),
+    'method': ('we ', 'here', 'herein', 'this work', 'this study', 'this paper', 'propose', 'develop', 'synthesi',
+               'employ', 'investigat', 'combin', 'calculation', 'first-principles', 'density functional',
+               'simulation', 'in situ', 'operando', 'characteriz', 'design', 'approach', 'method'),
+    'result': ('show', 'demonstrat', 'reveal', 'result', 'achiev', 'exhibit', 'improv', 'enhanc', 'retention',
+               'mah', 'cycles', '%', 'suggest', 'find', 'found', 'indicat', 'outperform', 'enable', 'conclud'),
+}
+
+SECTION_LABELS = (
+    ('background', '연구 배경'),
+    ('method', '연구 방법'),
+    ('result', '주요 결과'),
+)
+
+
+def split_sentences(text):
+    """초록을 문장 단위로 분리합니다."""
+    text = _LATEX_RE.sub(lambda m: m.group(1).replace('_', '').replace('^', '').replace('{', '').replace('}', ''), text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    if not text:
+        return []
+
+    # 약어의 마침표를 임시 문자로 보호
+    protected = text
+    for abbr in _ABBREVIATIONS:
+        protected = protected.replace(abbr, abbr.replace('.', '\x00'))
+
+    sentences = [s.replace('\x00', '.').strip() for s in _SENTENCE_SPLIT_RE.split(protected)]
+    return [s for s in sentences if len(s) > 1]
+
+
+def _tokenize(sentence):
+    return [tok for tok in _TOKEN_RE.findall(sentence.lower()) if tok not in _STOPWORDS]
+
+
+def _sentence_vectors(sentences):
+    """문장별 TF-IDF 희소 벡터(딕셔너리)와 노름을 계산합니다."""
+    token_lists = [_tokenize(s) for s in sentences]
+    doc_freq = Counter(tok for tokens in token_lists for tok in set(tokens))
+    n = len(sentences)
+
+    vectors = []
+    norms = []
+    for tokens in token_lists:
+        counts = Counter(tokens)
+        vec = {tok: (1 + math.log(c)) * math.log(1 + n / doc_freq[tok]) for tok, c in counts.items()}
+        vectors.append(vec)
+        norms.append(math.sqrt(sum(w * w for w in vec.values())) or 1.0)
+    return vectors, norms
+
+
+def textrank_scores(sentences, damping=0.85, max_iter=50, tol=1e-6):
+    """
+    문장 유사도 그래프에서 TextRank(PageRank) 점수를 계산합니다.
+
+    Args:
+        sentences: 문장 리스트
+
+    Returns:
+        문장별 점수 리스트 (합계 1)
+    """
+    n = len(sentences)
+    if n == 0:
+        return []
+    if n == 1:
+        return [1.0]
+
+    vectors, norms = _sentence_vectors(sentences)
+
+    # 코사인 유사도 인접 행렬 (대칭이므로 절반만 계산)
+    weights = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        vi = vectors[i]
+        for j in range(i + 1, n):
+            vj = vectors[j]
+            small, large = (vi, vj) if len(vi) <= len(vj) else (vj, vi)
+            dot = sum(w * large[tok] for tok, w in small.items() if tok in large)
+            if dot:
+                sim = dot / (norms[i] * norms[j])
+                weights[i][j] = weights[j][i] = sim
+
+    out_sums = [sum(row) for row in weights]
+    scores = [1.0 / n] * n
+    base = (1 - damping) / n
+    for _ in range(max_iter):
+        new_scores = []
+        for i in range(n):
+            rank = sum(weights[j][i] / out_sums[j] * scores[j] for j in range(n) if out_sums[j] and weights[j][i])
+            new_scores.append(base + damping * rank)
+        # 연결이 없는 문장의 점수가 빠져나가지 않도록 정규화
+        total = sum(new_scores)
+        new_scores = [s / total for s in new_scores]
+        delta = sum(abs(a - b) for a, b in zip(new_scores, scores))
+        scores = new_scores
+        if delta < tol:
+            break
+    return scores
+
+
+def _cue_score(sentence, section):
+    lowered = sentence.lower() + ' '
+    return sum(1 for cue in _SECTION_CUES[section] if cue in lowered)
+
+
+def _position_weight(index, n, section):
+    """섹션별 위치 선호도: 배경은 앞쪽, 결과는 뒤쪽, 방법은 중간."""
+    if n <= 1:
+        return 1.0
+    pos = index / (n - 1)
+    if section == 'background':
+        return 1.5 - pos
+    if section == 'result':
+        return 0.5 + pos
+    return 1.5 - abs(pos - 0.45) * 1.5
+
+
+def extract_sections(abstract, max_chars=320):
+    """
+    초록에서 섹션별 대표 문장을 선택합니다.
+
+    Args:
+        abstract: 논문 초록
+        max_chars: 섹션당 최대 문자 수 (두 번째 문장 추가 여부 판단)
+
+    Returns:
+        {'background': str, 'method': str, 'result': str}
+    """
+    sentences = split_sentences(abstract)
+    n = len(sentences)
+    if n == 0:
+        return {key: '' for key, _ in SECTION_LABELS}
+    if n < 3:
+        # 문장이 부족하면 첫 문장은 배경, 마지막 문장은 결과로 사용
+        return {'background': sentences[0], 'method': '', 'result': sentences[-1] if n > 1 else ''}
+
+    ranks = textrank_scores(sentences)
+    used = set()
+    sections = {}
+    # 단서가 가장 뚜렷한 방법/결과를 먼저 고르고 남은 문장에서 배경을 고름
+    for section in ('method', 'result', 'background'):
+        scored = []
+        for i, sentence in enumerate(sentences):
+            if i in used:
+                continue
+            score = ranks[i] * n * (1 + 0.5 * _cue_score(sentence, section)) * _position_weight(i, n, section)
+            scored.append((score, i))
+        if not scored:
+            sections[section] = ''
+            continue
+        scored.sort(reverse=True)
+        picked = [scored[0][1]]
+        if len(scored) > 1 and scored[1][0] >= 0.8 * scored[0][0] \
+                and len(sentences[picked[0]]) + len(sentences[scored[1][1]]) <= max_chars:
+            picked.append(scored[1][1])
+        used.update(picked)
+        sections[section] = ' '.join(sentences[i] for i in sorted(picked))
+    return sections
+
+
+def summarize_locally(abstract):
+    """
+    초록을 로컬에서 3단 HTML 요약으로 변환합니다 (LLM 요약과 같은 구조).
+
+    Args:
+        abstract: 논문 초록
+
+    Returns:
+        HTML 불릿 리스트 문자열
+    """
+    if not abstract:
+        return "<p>요약할 초록 내용이 없습니다.</p>"
+
+    sections = extract_sections(abstract)
+    items = [
+        f"  <li><strong>{label}:</strong> {html.escape(sections.get(key, ''), quote=False)}</li>"
+        for key, label in SECTION_LABELS
+        if sections.get(key)
+    ]
+    return "<ul>\n" + "\n".join(items) + "\n</ul>"
@@ -0,0 +1,161 @@
+"""
+로깅 설정 유틸리티
+
+모듈 임포트 시점에는 아무 핸들러도 붙이지 않고, 실행 진입점에서만
+`setup_logging()`을 호출하여 콘솔/파일 로거를 구성합니다.
+
+- 로그 레코드는 `QueueHandler`로 큐에 넣기만 하고, 포맷/파일 쓰기는 `QueueListener` 스레드가 처리합니다.
+  (파이프라인 스레드에서 디스크 I/O가 일어나지 않음)
+- 모든 레코드에 실행 ID(run_id), 카테고리, 단계(stage)가 붙습니다.
+  카테고리/단계는 `log_context()`로 설정하며 contextvars로 스레드마다 따로 유지됩니다.
+- 파일 로그는 한 줄에 JSON 하나이며, 크기 기준으로 회전합니다.
+- 같은 메시지 템플릿의 DEBUG 레코드는 샘플링하여 후보 논문마다 남는 로그가 폭증하지 않게 합니다.
+  (샘플링이 템플릿 단위로 동작하도록 `logger.debug("... %s", value)` 형식으로 로그를 남겨야 함)
+"""
+import os
+import sys
+import json
+import uuid
+import queue
+import atexit
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FORMAT = '%(asctime)s - [%(threadName)s] %(name)s - %(levelname)s - %(message)s'
+LOG_DATEFMT = '%Y-%m-%d %H:%M:%S KST'
+LOG_FILE = 'update_papers.log'
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# 같은 템플릿의 DEBUG 레코드는 처음 한 번과 이후 N개마다 한 번만 남김
+DEBUG_SAMPLE_EVERY = 20
+
+# GitHub Actions에서는 실행 번호를, 로컬에서는 임의의 ID를 사용
+RUN_ID = os.environ.get('GITHUB_RUN_ID') or uuid.uuid4().hex[:8]
+
+_category = contextvars.ContextVar('log_category', default='-')
+_stage = contextvars.ContextVar('log_stage', default='-')
+
+_configured = False
+_listener = None
+
+
+@contextmanager
+def log_context(category=None, stage=None):
+    """블록 안에서 남기는 로그에 카테고리/단계를 붙입니다 (중첩 가능)."""
+    tokens = []
+    if category is not None:
+        tokens.append((_category, _category.set(category)))
+    if stage is not None:
+        tokens.append((_stage, _stage.set(stage)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """레코드에 run_id, category, stage 속성을 추가합니다 (로그를 남긴 스레드에서 실행)."""
+
+    def filter(self, record):
+        record.run_id = RUN_ID
+        record.category = _category.get()
+        record.stage = _stage.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """메시지 템플릿별로 DEBUG 레코드를 1/N로 샘플링합니다. INFO 이상은 모두 통과합니다."""
+
+    def __init__(self, every=DEBUG_SAMPLE_EVERY):
+        super().__init__()
+        self.every = max(1, int(every))
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        key = (record.name, record.msg)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        if count % self.every:
+            return False
+        if count:
+            record.sampled = self.every
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포맷"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, LOG_DATEFMT),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'run_id': getattr(record, 'run_id', RUN_ID),
+            'category': getattr(record, 'category', '-'),
+            'stage': getattr(record, 'stage', '-'),
+            'message': record.getMessage(),
+        }
+        if getattr(record, 'sampled', None):
+            entry['sampled'] = record.sampled
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_logging(level=logging.INFO, log_file=LOG_FILE, json_console=False, debug_sample_every=DEBUG_SAMPLE_EVERY):
+    """
+    루트 로거에 큐 기반 콘솔/파일 핸들러를 설정합니다. 여러 번 호출해도 한 번만 적용됩니다.
+
+    Args:
+        level: 로그 레벨
+        log_file: 로그 파일 경로 (None이면 파일 로그를 남기지 않음, 파일은 항상 JSON)
+        json_console: True이면 콘솔에도 JSON으로 출력
+        debug_sample_every: 같은 템플릿의 DEBUG 레코드를 N개마다 하나만 남김 (1이면 전부)
+    """
+    global _configured, _listener
+    if _configured:
+        return
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(JsonFormatter() if json_console else logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+    handlers = [console]
+    if log_file:
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+        )
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+
+    # 필터는 QueueHandler에 붙여 로그를 남긴 스레드의 contextvars를 읽고, 버릴 레코드는 큐에 넣지 않음
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(SamplingFilter(debug_sample_every))
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    _configured = True
+
+
+def shutdown_logging():
+    """큐에 남은 레코드를 모두 기록하고 리스너를 멈춥니다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,113 @@
+"""
+단계별 처리 시간 측정 유틸리티
+
+파이프라인 단계(검색, h-index 조회, LLM 분석 등)마다 소요 시간과 처리 건수를 모아
+실행이 끝날 때 처리량과 지연 시간 백분위수를 보고합니다.
+
+백분위수는 단계별 최근 MAX_SAMPLES개 표본으로 계산하고, 호출 수와 합계는 전체 실행 기준입니다.
+스케줄러의 예상 소요 시간은 표본을 정렬하지 않도록 지수 이동 평균(`estimate()`)으로 따로 유지합니다.
+"""
+import time
+import threading
+import logging
+from collections import deque
+from contextlib import contextmanager
+
+from utils.logging_setup import log_context
+
+logger = logging.getLogger(__name__)
+
+MAX_SAMPLES = 1000      # 단계별로 보관할 최근 표본 수 (watch 모드에서도 메모리가 늘지 않도록)
+EWMA_ALPHA = 0.2        # 예상 소요 시간 이동 평균에서 최신 표본의 가중치
+
+
+class StageMetrics:
+    """단계 이름별 소요 시간 표본 (스레드 안전)"""
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._samples = {}      # stage -> 최근 표본 deque
+        self._counts = {}       # stage -> 전체 호출 수
+        self._totals = {}       # stage -> 전체 소요 시간 합
+        self._items = {}
+        self._ewma = {}         # stage -> 소요 시간 지수 이동 평균
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds, items=1):
+        with self._lock:
+            self._samples.setdefault(stage, deque(maxlen=self.max_samples)).append(seconds)
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+            self._totals[stage] = self._totals.get(stage, 0.0) + seconds
+            self._items[stage] = self._items.get(stage, 0) + items
+            previous = self._ewma.get(stage)
+            self._ewma[stage] = seconds if previous is None else previous + EWMA_ALPHA * (seconds - previous)
+
+    def estimate(self, stage):
+        """단계의 예상 소요 시간 (초, 지수 이동 평균). 표본이 없으면 0."""
+        with self._lock:
+            return self._ewma.get(stage, 0.0)
+
+    @contextmanager
+    def timer(self, stage, items=1):
+        """
+        `with stage_metrics.timer('fetch'):` 블록의 소요 시간을 기록합니다 (예외가 나도 기록).
+        블록 안에서 남기는 로그에는 단계 이름이 붙습니다.
+        """
+        start = time.perf_counter()
+        try:
+            with log_context(stage=stage):
+                yield
+        finally:
+            self.record(stage, time.perf_counter() - start, items)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._totals.clear()
+            self._items.clear()
+            self._ewma.clear()
+
+    def report(self):
+        """
+        단계별 통계를 반환합니다.
+
+        Returns:
+            {stage: {'count', 'items', 'total', 'p50', 'p95', 'max'}} (초 단위)
+        """
+        with self._lock:
+            snapshot = {stage: sorted(values) for stage, values in self._samples.items()}
+            counts = dict(self._counts)
+            totals = dict(self._totals)
+            items = dict(self._items)
+
+        def percentile(values, q):
+            return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+        return {
+            stage: {
+                'count': counts.get(stage, len(values)),
+                'items': items.get(stage, 0),
+                'total': round(totals.get(stage, sum(values)), 3),
+                'p50': round(percentile(values, 50), 3),
+                'p95': round(percentile(values, 95), 3),
+                'max': round(values[-1], 3),
+            }
+            for stage, values in sorted(snapshot.items())
+        }
+
+    def log_report(self):
+        """단계별 통계를 로그로 남깁니다."""
+        for stage, stats in self.report().items():
+            # 처리량은 단계가 실제로 일한 시간 기준 (스트리밍 단계는 앞 단계를 기다린 시간 제외)
+            throughput = f", {stats['items'] / stats['total']:.1f} items/s" if stats['total'] else ''
+            logger.info(f"  [{stage}] {stats['count']} calls, total {stats['total']}s, "
+                        f"p50 {stats['p50']}s, p95 {stats['p95']}s, max {stats['max']}s{throughput}")
+
+
+stage_metrics = StageMetrics()
+
+
+def stage_timer(stage, items=1):
+    """전역 `stage_metrics`에 기록하는 타이머 컨텍스트 매니저"""
+    return stage_metrics.timer(stage, items)
@@ -0,0 +1,321 @@
+"""
+OpenRouter API 클라이언트 (지연 시간 제한)
+
+- 관측된 응답 시간 백분위수로 요청별 타임아웃을 조정합니다.
+- 첫 요청이 전송 후 p95 시간 안에 끝나지 않으면 두 번째 요청(헤지)을 보내고 먼저 끝난 응답을 사용합니다.
+  속도 제한기 대기 시간은 응답 지연에 넣지 않습니다 (제한기가 붐빌 때 헤지가 부하를 늘리지 않도록).
+- 429/5xx/타임아웃 시 설정된 대체 모델 목록을 차례로 시도합니다.
+- 스트리밍(SSE) 응답을 점진적으로 파싱하며 `max_tokens`로 출력 길이를 제한합니다.
+"""
+import json
+import time
+import contextvars
+import threading
+import logging
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+
+from utils.rate_limit import OPENROUTER_LIMITER
+from utils.endpoints import OPENROUTER_API_URL
+from utils.http import get_session
+
+logger = logging.getLogger(__name__)
+
+OPENROUTER_URL = OPENROUTER_API_URL
+
+DEFAULT_SETTINGS = {
+    'fallback_models': [],    # 기본 모델이 느리거나 제한될 때 순서대로 시도할 모델
+    'hedge': True,            # p95 지연 후 헤지 요청 사용 여부
+    'stream': True,           # SSE 스트리밍 응답 사용 여부
+    'min_timeout': 10.0,      # 적응형 타임아웃 하한 (초)
+    'max_timeout': 90.0,      # 적응형 타임아웃 상한 (초)
+    'timeout_multiplier': 2.0,  # p99 대비 타임아웃 배수
+    'min_hedge_delay': 2.0,   # 헤지 지연 하한 (초)
+    'min_samples': 5,         # 백분위수를 신뢰하기 위한 최소 표본 수
+    'connect_timeout': 10.0,  # 연결 타임아웃 (초)
+}
+
+_settings = dict(DEFAULT_SETTINGS)
+
+# 헤지/대체 요청을 실행하는 공유 스레드 풀
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='openrouter')
+
+
+class RetryableError(Exception):
+    """다른 모델 또는 재시도로 회복 가능한 오류 (429, 5xx, 타임아웃 등)"""
+
+
+class RequestCancelled(Exception):
+    """헤지 경쟁에서 진 요청이 취소됨"""
+
+
+class SendSignal:
+    """요청이 속도 제한기를 통과해 실제로 전송된 시각을 알립니다."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.sent_at = None
+
+    def mark(self):
+        if not self._event.is_set():
+            self.sent_at = time.monotonic()
+            self._event.set()
+
+    def wait(self):
+        """전송될 때까지 기다린 뒤 전송 시각(time.monotonic)을 반환합니다."""
+        self._event.wait()
+        return self.sent_at
+
+
+class LatencyTracker:
+    """키(모델 등)별 최근 응답 시간을 보관하고 백분위수를 계산합니다."""
+
+    def __init__(self, window=200):
+        self._samples = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, key, seconds):
+        with self._lock:
+            self._samples[key].append(seconds)
+
+    def count(self, key):
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def percentile(self, key, q):
+        """q(0~100) 백분위수를 반환합니다. 표본이 없으면 None."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(q / 100 * (len(samples) - 1)))))
+        return samples[index]
+
+    def snapshot(self):
+        """키별 표본 복사본을 반환합니다."""
+        with self._lock:
+            return {key: list(values) for key, values in self._samples.items()}
+
+
+latency_tracker = LatencyTracker()
+
+
+def configure_openrouter(settings):
+    """
+    config.yml의 `openrouter` 설정을 적용합니다.
+
+    Args:
+        settings: openrouter 설정 딕셔너리 (없으면 기본값 유지)
+    """
+    if not settings:
+        return
+    for key, value in settings.items():
+        if key in DEFAULT_SETTINGS and value is not None:
+            _settings[key] = value
+    logger.info(f"OpenRouter settings: fallback={_settings['fallback_models']}, "
+                f"hedge={_settings['hedge']}, stream={_settings['stream']}")
+
+
+def _adaptive_timeout(key, cap):
+    """관측된 p99 기반 타임아웃 (표본이 부족하면 cap 사용)."""
+    cap = min(cap or _settings['max_timeout'], _settings['max_timeout'])
+    if latency_tracker.count(key) < _settings['min_samples']:
+        return cap
+    p99 = latency_tracker.percentile(key, 99)
+    return max(_settings['min_timeout'], min(cap, p99 * _settings['timeout_multiplier']))
+
+
+def _hedge_delay(key, timeout):
+    """헤지 요청을 보내기까지의 대기 시간 (p95, 표본이 부족하면 타임아웃의 절반)."""
+    if latency_tracker.count(key) < _settings['min_samples']:
+        return max(_settings['min_hedge_delay'], timeout / 2)
+    return max(_settings['min_hedge_delay'], latency_tracker.percentile(key, 95))
+
+
+def _read_sse_content(response, cancel_event, deadline):
+    """SSE 스트림에서 content 조각을 읽어 합칩니다."""
+    parts = []
+    for raw_line in response.iter_lines(decode_unicode=True):
+        if cancel_event.is_set():
+            raise RequestCancelled()
+        if time.monotonic() > deadline:
+            raise RetryableError("streaming deadline exceeded")
+        # 빈 줄과 ": OPENROUTER PROCESSING" 같은 주석 줄은 건너뜀
+        if not raw_line or raw_line.startswith(':') or not raw_line.startswith('data:'):
+            continue
+
+        data = raw_line[5:].strip()
+        if data == '[DONE]':
+            break
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            logger.debug("Skipping malformed SSE chunk: %.80s", data)
+            continue
+
+        if 'error' in chunk:
+            raise RetryableError(f"stream error: {chunk['error']}")
+        choices = chunk.get('choices') or []
+        if choices:
+            content = (choices[0].get('delta') or {}).get('content')
+            if content:
+                parts.append(content)
+    return ''.join(parts)
+
+
+def _request_once(prompt, model_name, api_key, timeout, max_tokens, cancel_event, sent=None):
+    """모델 하나에 대한 단일 요청. 성공 시 응답 텍스트를 반환합니다. 전송 시 `sent`(SendSignal)에 표시합니다."""
+    if cancel_event.is_set():
+        raise RequestCancelled()
+
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "https://github.com/stagnes307/stagnes307.github.io",
+        "X-Title": "Battery Paper Analyzer"
+    }
+    payload = {
+        "model": model_name,
+        "messages": [{"role": "user", "content": prompt}],
+        "stream": bool(_settings['stream'])
+    }
+    if max_tokens:
+        payload["max_tokens"] = max_tokens
+
+    with OPENROUTER_LIMITER:
+        start = time.monotonic()
+        deadline = start + timeout
+        if sent is not None:
+            sent.mark()
+        try:
+            response = get_session().post(
+                OPENROUTER_URL, headers=headers, json=payload,
+                timeout=(_settings['connect_timeout'], timeout), stream=payload["stream"]
+            )
+        except requests.exceptions.RequestException as e:
+            raise RetryableError(f"{type(e).__name__}: {e}") from e
+
+        try:
+            if response.status_code in (401, 403):
+                logger.error(f"OpenRouter API error ({response.status_code}): {response.text}")
+                response.raise_for_status()
+            if response.status_code != 200:
+                raise RetryableError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+            try:
+                if payload["stream"]:
+                    # text/event-stream에는 charset이 없어 requests가 ISO-8859-1로 디코딩하므로 명시
+                    response.encoding = 'utf-8'
+                    content = _read_sse_content(response, cancel_event, deadline)
+                else:
+                    content = response.json()['choices'][0]['message']['content']
+            except requests.exceptions.RequestException as e:
+                raise RetryableError(f"{type(e).__name__}: {e}") from e
+            except (KeyError, IndexError, ValueError) as e:
+                raise RetryableError(f"Error parsing API response: {e}") from e
+        finally:
+            response.close()
+
+    if not content or not content.strip():
+        raise RetryableError("empty response")
+
+    latency_tracker.record(model_name, time.monotonic() - start)
+    return content.strip()
+
+
+def complete(prompt, model_name, api_key, timeout=60, max_tokens=None, fallback_models=None):
+    """
+    지연 시간을 제한한 채팅 완성 요청을 보냅니다.
+
+    Args:
+        prompt: 사용자 프롬프트
+        model_name: 기본 모델 이름
+        api_key: OpenRouter API 키
+        timeout: 요청당 최대 타임아웃 (초, 적응형 타임아웃의 상한)
+        max_tokens: 출력 토큰 상한 (None이면 제한 없음)
+        fallback_models: 대체 모델 목록 (None이면 설정값 사용)
+
+    Returns:
+        응답 텍스트
+
+    Raises:
+        ValueError: API 키가 없는 경우
+        RuntimeError: 모든 모델이 실패한 경우
+    """
+    if not api_key:
+        raise ValueError("OpenRouter API key is not provided.")
+
+    if fallback_models is None:
+        fallback_models = _settings['fallback_models']
+    chain = [model_name] + [m for m in fallback_models if m != model_name]
+
+    cancel_event = threading.Event()
+    pending = {}
+    errors = []
+    hedged = not _settings['hedge']
+
+    def request(model, request_timeout, sent):
+        try:
+            return _request_once(prompt, model, api_key, request_timeout, max_tokens, cancel_event, sent)
+        finally:
+            # 전송 전에 끝난 요청(취소 등)도 기다리는 쪽이 멈추지 않도록 표시
+            sent.mark()
+
+    def launch(model):
+        request_timeout = _adaptive_timeout(model, timeout)
+        sent = SendSignal()
+        # 호출한 스레드의 로그 컨텍스트(카테고리/단계)를 요청 스레드로 전달
+        context = contextvars.copy_context()
+        future = _executor.submit(context.run, request, model, request_timeout, sent)
+        pending[future] = (model, request_timeout, sent)
+
+    launch(chain[0])
+    next_index = 1
+
+    while pending:
+        if not hedged:
+            model, request_timeout, sent = next(iter(pending.values()))
+            # 헤지 지연은 속도 제한기를 통과해 요청이 전송된 시점부터 잼
+            sent_at = sent.wait()
+            wait_time = max(0.0, sent_at + _hedge_delay(model, request_timeout) - time.monotonic())
+        else:
+            wait_time = None
+
+        done, _ = wait(list(pending), timeout=wait_time, return_when=FIRST_COMPLETED)
+
+        if not done:
+            # 첫 요청이 p95를 넘기면 다음 모델(없으면 같은 모델)로 헤지 요청
+            hedged = True
+            hedge_model = chain[next_index] if next_index < len(chain) else chain[0]
+            next_index = min(next_index + 1, len(chain))
+            logger.info(f"OpenRouter request slow after {time.monotonic() - sent_at:.1f}s; hedging with {hedge_model}")
+            launch(hedge_model)
+            continue
+
+        for future in done:
+            model, _, _ = pending.pop(future)
+            try:
+                result = future.result()
+            except RequestCancelled:
+                continue
+            except RetryableError as e:
+                logger.warning(f"OpenRouter model {model} failed: {e}")
+                errors.append(f"{model}: {e}")
+                if next_index < len(chain):
+                    launch(chain[next_index])
+                    next_index += 1
+                continue
+            except Exception:
+                # 인증 오류 등 회복 불가능한 오류는 즉시 전달
+                cancel_event.set()
+                raise
+
+            # 먼저 성공한 응답 사용, 나머지 요청은 취소
+            cancel_event.set()
+            if model != model_name:
+                logger.info(f"OpenRouter answered by fallback model {model}")
+            return result
+
+    raise RuntimeError("All OpenRouter models failed: " + "; ".join(errors))
@@ -3,6 +3,7 @@ arXiv 논문 검색 및 필터링 (계층적 검색 로직 포함)
 """
 import arxiv
 import logging
+import threading
 from utils.yaml_helper import load_yaml
 from utils.quality_filter import (
     should_exclude_paper,
@@ -10,41 +11,106 @@ from utils.quality_filter import (
     calculate_paper_quality_score
 )
 from utils.cache import load_cache, save_cache
+from utils.rate_limit import ARXIV_LIMITER
+from utils.endpoints import ARXIV_API_URL
+from utils.http_cache import install_http_cache
+from utils.pipeline import buffered, metered
+from utils.paper_record import PaperRecord
+from utils.seen_index import (
+    open_seen_index,
+    base_arxiv_id,
+    DECISION_EXCLUDED,
+    DECISION_NOT_INCLUDED,
+    DECISION_LOW_SCORE
+)
 
 logger = logging.getLogger(__name__)
 
-def _search_and_filter_papers(client, existing_ids, num_target, filter_config, settings, sort_by_date=False):
-    """Helper function to perform a single search and filtering pass."""
-    query = settings.get('query')
-    max_fetch = settings.get('max_results_to_fetch', 150)
-    
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_arxiv_client():
+    """
+    프로세스 전체에서 공유하는 arXiv 클라이언트 (HTTP 연결 재사용)
+
+    세션에 붙인 어댑터가 페이지 요청마다 ARXIV_LIMITER로 간격을 지키고 응답을 디스크에 캐시하므로
+    (utils.http_cache) 카테고리 스레드가 함께 사용해도 안전하며, 캐시에서 읽은 페이지는 기다리지 않습니다.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            # 페이지 간 대기는 클라이언트 대신 어댑터가 네트워크 요청에만 적용
+            _client = arxiv.Client(delay_seconds=0)
+            _client.query_url_format = ARXIV_API_URL + '?{}'
+            install_http_cache(_client._session, ARXIV_API_URL, limiter=ARXIV_LIMITER)
+        return _client
+
+def stream_search_results(client, query, max_results, sort_by_date=False):
+    """
+    검색 단계: arXiv 검색 결과를 받는 대로 PaperRecord로 바꿔 하나씩 내보냅니다.
+
+    다음 페이지는 소비자가 앞 페이지를 다 읽었을 때 요청하므로, 필요한 만큼만 내려받습니다.
+    """
     sort_criterion = arxiv.SortCriterion.SubmittedDate if sort_by_date else arxiv.SortCriterion.Relevance
-    
     search = arxiv.Search(
         query=query,
-        max_results=max_fetch,
+        max_results=max_results,
         sort_by=sort_criterion,
         sort_order=arxiv.SortOrder.Descending
     )
-    
-    logger.info(f"Searching arXiv with query: '{query}' (Sort: {sort_criterion.value}, Max: {max_fetch})")
-    
-    results = list(client.results(search))
-    if not results:
-        logger.warning("  -> No papers found for this query.")
-        return []
-
-    total_searched = len(results)
-    logger.info(f"  -> Found {total_searched} papers. Starting filtering...")
-
-    # 필터링 로직
-    new_papers_list = []
-    filter_enabled = filter_config and filter_config.get('enabled', False)
-    min_score = filter_config.get('min_score', 0) if filter_enabled else 0
-    
+    logger.info(f"Searching arXiv with query: '{query}' (Sort: {sort_criterion.value}, Max: {max_results})")
+    # arXiv 요청 간격은 클라이언트 세션의 어댑터가 전역 리미터로 지킴
+    return (PaperRecord.from_result(result) for result in client.results(search))
+
+
+def filter_candidates(results, existing_ids, settings, seen=None, on_reject=None):
+    """
+    필터 단계: 이미 아카이브된 논문, 이전 실행에서 탈락한 버전, 제외/포함 키워드에 걸리는 후보를 거릅니다.
+
+    Args:
+        results: PaperRecord의 이터러블
+        existing_ids: 버전 없는 arXiv ID 집합 (고른 논문이 추가될 수 있음)
+        settings: 카테고리 설정 (exclude_keywords, include_keywords_any)
+        seen: SeenIndex (선택)
+        on_reject: 탈락 시 (paper_id, 사유)로 호출 (선택)
+    """
     exclude_keywords = settings.get('exclude_keywords', [])
     include_keywords_any = settings.get('include_keywords_any', [])
-    
+
+    for paper in results:
+        paper_id = paper.paper_id
+        # 아카이브된 논문은 새 버전이 올라와도 다시 고르지 않음
+        if paper.base_id in existing_ids:
+            continue
+        # 이전 실행에서 같은 설정으로 탈락한 버전이면 다시 평가하지 않음
+        if seen is not None and seen.should_skip(paper_id):
+            continue
+
+        if exclude_keywords and should_exclude_paper(paper, exclude_keywords):
+            if on_reject:
+                on_reject(paper_id, DECISION_EXCLUDED)
+            continue
+        if include_keywords_any and not check_include_keywords(paper, include_keywords_any):
+            if on_reject:
+                on_reject(paper_id, DECISION_NOT_INCLUDED)
+            continue
+        yield paper
+
+
+def score_candidates(papers, filter_config, on_reject=None, allow_lookup=True):
+    """
+    점수 단계: 품질 점수(h-index 조회 포함)를 매겨 최소 점수 이상인 후보만 내보냅니다.
+
+    점수는 `paper.quality_score`에 남겨 이후 단계(LLM 사용 여부, 분석 우선순위)에서 재사용합니다.
+    필터가 비활성화되어 있으면 모든 후보를 그대로 내보냅니다.
+    allow_lookup이 False면 h-index는 캐시에 있는 값만 사용합니다 (백테스트).
+    """
+    if not (filter_config and filter_config.get('enabled', False)):
+        yield from papers
+        return
+
+    min_score = filter_config.get('min_score', 0)
     hindex_cache = load_cache()
     from utils.cache import get_cached_hindex, set_cached_hindex
     
@@ -54,88 +120,139 @@ def _search_and_filter_papers(client, existing_ids, num_target, filter_config, s
     
     cache_manager = CacheManager()
 
-    for paper in results:
-        if paper.get_short_id() in existing_ids:
-            continue
-        
-        if exclude_keywords and should_exclude_paper(paper, exclude_keywords):
-            continue
-        if include_keywords_any and not check_include_keywords(paper, include_keywords_any):
-            continue
-            
-        if filter_enabled:
-            score, _ = calculate_paper_quality_score(paper, filter_config, hindex_cache, cache_manager)
+    try:
+        for paper in papers:
+            paper_id = paper.paper_id
+            score, _ = calculate_paper_quality_score(paper, filter_config, hindex_cache, cache_manager, allow_lookup)
+            paper.quality_score = score
+            logger.debug("Scored %s: %s (min %s)", paper_id, score, min_score)
             if score >= min_score:
-                new_papers_list.append(paper)
-        else:
-            new_papers_list.append(paper)
-        
-        if len(new_papers_list) >= num_target:
-            break
-            
-    save_cache(hindex_cache)
-    logger.info(f"  -> Found {len(new_papers_list)} qualified papers from this tier.")
-    return new_papers_list
-
-
-def find_new_papers(archive_path, num_target, filter_config=None, settings=None):
+                yield paper
+            elif not paper.hindex_deferred:
+                # h-index 조회를 보류한 후보는 다음 실행에서 다시 평가하도록 기록하지 않음
+                if on_reject:
+                    on_reject(paper_id, DECISION_LOW_SCORE)
+    finally:
+        # 중간에 멈춰도(목표 수 도달) 그때까지 조회한 h-index는 저장
+        if allow_lookup:
+            save_cache(hindex_cache)
+
+
+def _search_and_filter_papers(client, existing_ids, num_target, filter_config, settings, sort_by_date=False, seen=None):
+    """
+    검색 한 번에 대한 검색 -> 필터 -> 점수 단계를 연결하여, 조건을 통과한 논문을 최대 num_target개 내보냅니다.
+
+    검색 결과는 백그라운드에서 한 페이지 분량까지 미리 받아 두므로
+    앞 후보의 h-index를 조회하는 동안 다음 페이지를 내려받습니다.
+    """
+    query = settings.get('query')
+    max_fetch = settings.get('max_results_to_fetch', 150)
+
+    def reject(paper_id, decision):
+        # 후보마다 남는 로그이므로 지연 포맷 사용 (DEBUG는 템플릿별로 샘플링됨)
+        logger.debug("Rejected %s (%s)", paper_id, decision)
+        if seen is not None:
+            seen.record(paper_id, decision)
+
+    results = buffered(
+        metered(stream_search_results(client, query, max_fetch, sort_by_date), 'search'),
+        maxsize=client.page_size, name='arxiv'
+    )
+    candidates = metered(filter_candidates(results, existing_ids, settings, seen, reject), 'filter')
+    qualified = metered(score_candidates(candidates, filter_config, reject), 'score')
+
+    found = 0
+    try:
+        for paper in qualified:
+            found += 1
+            yield paper
+            if found >= num_target:
+                break
+    finally:
+        # 목표 수에 도달하면 앞 단계를 모두 닫아 남은 페이지를 더 받지 않음
+        for stage in (qualified, candidates, results):
+            stage.close()
+        if seen is not None:
+            seen.commit()
+        logger.info(f"  -> Found {found} qualified papers from this tier.")
+
+
+def iter_new_papers(archive_path, num_target, filter_config=None, settings=None, exclude_ids=None):
     """
-    새로운 논문을 계층적 검색 방식으로 찾습니다.
+    새로운 논문을 계층적 검색 방식으로 찾아 찾는 대로 내보냅니다.
+
+    앞 계층에서 고른 논문은 유지하고, 부족한 수만큼 다음 계층(더 넓은 검색어)에서 채웁니다.
+    모든 계층으로도 부족하면 최신순 검색으로 채웁니다.
+    exclude_ids에는 아카이브 외에 이미 선택된 논문 ID(예: watch 모드의 today 목록)를 넘깁니다.
     """
+    filter_config = filter_config or {}
+    settings = settings or {}
     archive_papers = load_yaml(archive_path) or []
-    existing_ids = {paper.get('paper_id') for paper in archive_papers if paper.get('paper_id')}
-    
-    client = arxiv.Client()
+    existing_ids = {base_arxiv_id(paper.get('paper_id')) for paper in archive_papers if paper.get('paper_id')}
+    existing_ids.update(base_arxiv_id(paper_id) for paper_id in exclude_ids or [])
+
+    client = get_arxiv_client()
     search_queries = settings.get('search_queries', [])
-    
-    final_papers = []
+    seen = open_seen_index(settings, filter_config)
+    try:
+        yield from _search_tiers(client, existing_ids, num_target, filter_config, settings, search_queries, seen)
+    finally:
+        if seen is not None:
+            seen.close()
+
+
+def find_new_papers(archive_path, num_target, filter_config=None, settings=None, exclude_ids=None):
+    """
+    새로운 논문을 계층적 검색 방식으로 찾아 목록으로 반환합니다 (iter_new_papers 참고).
+    """
+    final_papers = list(iter_new_papers(archive_path, num_target, filter_config, settings, exclude_ids))
+    if final_papers:
+        logger.info(f"Final selection: {len(final_papers)} papers.")
+    return final_papers
+
+
+def _search_tiers(client, existing_ids, num_target, filter_config, settings, search_queries, seen):
+    """관련도순 계층 검색 후, 부족하면 최신순 검색으로 후보를 채웁니다."""
+    found = 0
+
+    def search(tier_settings, sort_by_date):
+        nonlocal found
+        for paper in _search_and_filter_papers(
+            client=client,
+            existing_ids=existing_ids,
+            num_target=num_target - found,
+            filter_config=filter_config,
+            settings=tier_settings,
+            sort_by_date=sort_by_date,
+            seen=seen
+        ):
+            # 다음 계층에서 같은 논문을 다시 고르지 않도록 기록
+            existing_ids.add(paper.base_id)
+            found += 1
+            yield paper
 
     # 1. 계층적 검색 (관련도순)
     for i, query in enumerate(search_queries):
         logger.info(f"--- Tier {i+1}/{len(search_queries)} Search ---")
         tier_settings = settings.copy()
         tier_settings['query'] = query
-        
-        found_papers = _search_and_filter_papers(
-            client=client,
-            existing_ids=existing_ids,
-            num_target=num_target,
-            filter_config=filter_config,
-            settings=tier_settings,
-            sort_by_date=False
-        )
-        
-        if len(found_papers) >= num_target:
+        yield from search(tier_settings, sort_by_date=False)
+
+        if found >= num_target:
             logger.info(f"Sufficient papers found at Tier {i+1}. Finalizing selection.")
-            final_papers = found_papers
-            break
-        else:
-            logger.warning(f"Not enough papers at Tier {i+1}. Trying next tier...")
+            return
+        logger.warning(f"Not enough papers at Tier {i+1} ({found}/{num_target}). Trying next tier...")
 
     # 2. 최종 단계: 최신순 강제 검색
-    if not final_papers:
-        logger.info("--- Final Fallback Search (Sort by Date) ---")
-        latest_sort_query_index = settings.get('latest_sort_query_index', -1)
-        
-        if 0 <= latest_sort_query_index < len(search_queries):
-            fallback_query = search_queries[latest_sort_query_index]
-            fallback_settings = settings.copy()
-            fallback_settings['query'] = fallback_query
-            
-            final_papers = _search_and_filter_papers(
-                client=client,
-                existing_ids=existing_ids,
-                num_target=num_target,
-                filter_config=filter_config,
-                settings=fallback_settings,
-                sort_by_date=True
-            )
-        else:
-            logger.error("`latest_sort_query_index` is invalid. Skipping fallback search.")
-
-    if not final_papers:
-        logger.warning("No new papers found after all search tiers and fallbacks.")
-        return []
+    logger.info("--- Final Fallback Search (Sort by Date) ---")
+    latest_sort_query_index = settings.get('latest_sort_query_index', -1)
 
-    logger.info(f"Final selection: {len(final_papers)} papers.")
-    return final_papers[:num_target]
\ No newline at end of file
+    if 0 <= latest_sort_query_index < len(search_queries):
+        fallback_settings = settings.copy()
+        fallback_settings['query'] = search_queries[latest_sort_query_index]
+        yield from search(fallback_settings, sort_by_date=True)
+    else:
+        logger.error("`latest_sort_query_index` is invalid. Skipping fallback search.")
+
+    if not found:
+        logger.warning("No new papers found after all search tiers and fallbacks.")
@@ -0,0 +1,79 @@
+"""
+후보 논문 레코드
+
+검색 결과(`arxiv.Result`)는 링크 목록, feedparser 원본 필드, 저자 객체를 함께 들고 있어
+후보가 많을수록 메모리를 많이 차지하고, 필터/점수 단계가 같은 문자열 처리를 반복합니다.
+검색 단계에서 받자마자 필요한 필드만 담은 `PaperRecord`로 바꾸고, 이후 단계는 이 레코드만 사용합니다.
+
+- 소문자 제목/본문(제목 + 초록)은 한 번만 계산합니다 (제외/포함 키워드 검사).
+- 저자 이름과 소속은 `sys.intern`으로 같은 문자열을 공유합니다 (여러 논문에 반복되는 공저자).
+- ID는 버전 포함 ID(`paper_id`)와 버전 없는 ID(`base_id`)로 미리 나눠 둡니다.
+"""
+import sys
+
+from utils.seen_index import split_arxiv_id
+
+
+class PaperRecord:
+    """필터, 점수, 분석 단계가 주고받는 후보 논문"""
+
+    __slots__ = ('paper_id', 'base_id', 'version', 'title', 'summary', 'title_lower', 'text_lower',
+                 'authors', 'affiliations', 'comment', 'journal_ref', 'categories', 'published', 'link',
+                 'quality_score', 'hindex_deferred')
+
+    def __init__(self, paper_id, title, summary, authors=(), affiliations=(), comment=None,
+                 journal_ref=None, categories=(), published=None, link=None):
+        """
+        Args:
+            paper_id: arXiv ID (버전 포함 권장, 예: '2508.00236v2') 또는 DOI 기반 ID (버전 없음)
+            authors: 저자 이름 목록 (첫 번째가 주저자)
+            affiliations: 저자 소속 문자열 목록 (알 수 있는 것만)
+            published: 제출일 (YYYY-MM-DD)
+            link: 논문 페이지 URL
+        """
+        if str(paper_id).startswith('10.'):
+            # DOI 기반 ID에는 버전이 없음 ('.../v1'로 끝나는 DOI도 있으므로 나누지 않음)
+            self.base_id, self.version = str(paper_id), 0
+        else:
+            self.base_id, self.version = split_arxiv_id(paper_id)
+        self.paper_id = f"{self.base_id}v{self.version}" if self.version else self.base_id
+        self.title = (title or '').strip()
+        self.summary = (summary or '').strip()
+        self.title_lower = self.title.lower()
+        self.text_lower = self.title_lower + ' ' + self.summary.lower()
+        self.authors = tuple(sys.intern(name) for name in authors if name)
+        self.affiliations = tuple(sys.intern(a) for a in affiliations if a)
+        self.comment = comment or None
+        self.journal_ref = journal_ref or None
+        self.categories = tuple(sys.intern(c) for c in categories)
+        self.published = published
+        self.link = link
+        self.quality_score = None
+        self.hindex_deferred = False
+
+    @classmethod
+    def from_result(cls, result):
+        """arxiv.Result를 레코드로 바꿉니다 (원본 객체는 더 참조하지 않음)."""
+        affiliations = []
+        for author in result.authors:
+            # arxiv 패키지 버전에 따라 소속은 없거나 문자열 목록
+            affiliation = getattr(author, 'affiliation', None)
+            if isinstance(affiliation, str):
+                affiliations.append(affiliation)
+            elif affiliation:
+                affiliations.extend(str(a) for a in affiliation)
+        return cls(
+            paper_id=result.get_short_id(),
+            title=result.title,
+            summary=result.summary,
+            authors=[author.name for author in result.authors],
+            affiliations=affiliations,
+            comment=result.comment,
+            journal_ref=result.journal_ref,
+            categories=result.categories,
+            published=result.published.strftime('%Y-%m-%d') if result.published else None,
+            link=result.entry_id,
+        )
+
+    def __repr__(self):
+        return f"PaperRecord({self.paper_id!r}, {self.title[:40]!r})"
@@ -0,0 +1,108 @@
+"""
+스트리밍 단계 유틸리티
+
+검색 -> 필터 -> 점수 -> 분석 -> 저장 단계를 제너레이터로 연결하여,
+필터를 통과한 후보가 다음 검색 페이지를 받는 동안 바로 점수화/분석 단계로 넘어가도록 합니다.
+
+- 각 단계는 이터러블을 받아 이터러블을 돌려주는 평범한 제너레이터 함수이므로
+  목록이나 가짜 객체를 넣어 단계 하나만 따로 실행해 볼 수 있습니다.
+- `buffered()`는 앞 단계를 백그라운드 스레드에서 미리 당겨 크기 제한 큐에 담습니다.
+  큐가 차면 앞 단계가 멈추므로(backpressure) 필요 이상으로 페이지를 내려받지 않습니다.
+- `metered()`는 단계가 항목 하나를 내보내는 데 쓴 시간(앞 단계를 기다린 시간 제외)을
+  stage_metrics에 `stream.<단계>`로 기록하여 단계별 처리량을 보고합니다.
+"""
+import time
+import queue
+import logging
+import threading
+import contextvars
+
+from utils.metrics import stage_metrics
+
+logger = logging.getLogger(__name__)
+
+# 중첩된 metered 단계에서 앞 단계가 쓴 시간을 빼기 위한 누적값
+_upstream_time = contextvars.ContextVar('pipeline_upstream_time', default=None)
+
+_DONE = object()
+
+
+def metered(iterable, stage):
+    """
+    `iterable`에서 항목을 꺼낼 때마다 이 단계 자체의 소요 시간을 기록합니다.
+
+    Args:
+        iterable: 단계 출력 (다른 metered 단계를 입력으로 쓰는 제너레이터면 그 시간은 제외됨)
+        stage: 단계 이름 (stage_metrics에는 `stream.<stage>`로 기록)
+    """
+    iterator = iter(iterable)
+    name = f'stream.{stage}'
+    try:
+        while True:
+            parent = _upstream_time.get()
+            own = [0.0]
+            token = _upstream_time.set(own)
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed = time.perf_counter() - start
+                _upstream_time.reset(token)
+                if parent is not None:
+                    parent[0] += elapsed
+            stage_metrics.record(name, max(0.0, elapsed - own[0]))
+            yield item
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close:
+            close()
+
+
+def buffered(iterable, maxsize, name='buffer'):
+    """
+    `iterable`을 백그라운드 스레드에서 미리 당겨 최대 `maxsize`개까지 쌓아 둡니다.
+
+    소비자가 중간에 멈추면(제너레이터 close) 생산 스레드도 다음 항목을 넣으려다 종료합니다.
+    생산 중 발생한 예외는 소비자 쪽에서 다시 발생합니다.
+    """
+    items = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    break
+        except Exception as e:
+            put(e)
+        finally:
+            close = getattr(iterable, 'close', None)
+            if close:
+                close()
+            put(_DONE)
+
+    # 호출한 스레드의 로그 컨텍스트(카테고리/단계)를 생산 스레드로 전달
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(produce,), name=f'{name}_producer', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
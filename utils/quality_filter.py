@@ -4,17 +4,23 @@
 import requests
 import time
 import logging
+from utils.rate_limit import SEMANTIC_SCHOLAR_LIMITER
+from utils.endpoints import SEMANTIC_SCHOLAR_API_URL
+from utils.metrics import stage_timer
+from utils.http import get_session
+from utils.scheduler import get_deadline, estimate_seconds, PRIORITY_NICE
 
 logger = logging.getLogger(__name__)
 
 
-def get_author_hindex_from_semantic_scholar(author_name, cache=None, cache_manager=None):
+def get_author_hindex_from_semantic_scholar(author_name, cache=None, cache_manager=None, allow_lookup=True):
     """
     Semantic Scholar API를 사용하여 저자의 h-index를 조회
     
     Args:
         author_name: 저자 이름
         cache: 캐시 딕셔너리 (선택사항)
+        allow_lookup: False이면 캐시만 확인하고 API는 호출하지 않음 (실행 마감이 가까울 때)
         
     Returns:
         h-index (int) 또는 None
@@ -26,21 +32,24 @@ def get_author_hindex_from_semantic_scholar(author_name, cache=None, cache_manag
             return cached_value
     elif cache and author_name in cache:
         return cache[author_name]
+
+    if not allow_lookup:
+        return None
     
     try:
         # 저자 검색
-        search_url = "https://api.semanticscholar.org/graph/v1/author/search"
+        search_url = f"{SEMANTIC_SCHOLAR_API_URL}/author/search"
         params = {"query": author_name, "limit": 1}
         
-        # 첫 번째 시도
-        time.sleep(2.0)
-        response = requests.get(search_url, params=params, timeout=10)
-        
-        # 429 에러 발생 시 재시도
-        if response.status_code == 429:
-            logger.warning(f"Rate limit exceeded for {author_name}. Retrying in 5 seconds...")
-            time.sleep(5.0)
-            response = requests.get(search_url, params=params, timeout=10)
+        # 첫 번째 시도 (전역 리미터가 카테고리 간 요청 간격을 보장)
+        with SEMANTIC_SCHOLAR_LIMITER, stage_timer('hindex_lookup'):
+            response = get_session().get(search_url, params=params, timeout=10)
+            
+            # 429 에러 발생 시 재시도
+            if response.status_code == 429:
+                logger.warning(f"Rate limit exceeded for {author_name}. Retrying in 5 seconds...")
+                time.sleep(5.0)
+                response = get_session().get(search_url, params=params, timeout=10)
             
         if response.status_code != 200:
             logger.warning(f"Semantic Scholar API error for {author_name}: {response.status_code}")
@@ -55,16 +64,16 @@ def get_author_hindex_from_semantic_scholar(author_name, cache=None, cache_manag
             return None
         
         # 저자 상세 정보 조회
-        author_url = f"https://api.semanticscholar.org/graph/v1/author/{author_id}"
+        author_url = f"{SEMANTIC_SCHOLAR_API_URL}/author/{author_id}"
         params = {"fields": "hIndex,name"}
         
-        time.sleep(2.0)
-        response = requests.get(author_url, params=params, timeout=10)
-        
-        if response.status_code == 429:
-            logger.warning(f"Rate limit exceeded for {author_name} details. Retrying in 5 seconds...")
-            time.sleep(5.0)
-            response = requests.get(author_url, params=params, timeout=10)
+        with SEMANTIC_SCHOLAR_LIMITER, stage_timer('hindex_lookup'):
+            response = get_session().get(author_url, params=params, timeout=10)
+            
+            if response.status_code == 429:
+                logger.warning(f"Rate limit exceeded for {author_name} details. Retrying in 5 seconds...")
+                time.sleep(5.0)
+                response = get_session().get(author_url, params=params, timeout=10)
         
         if response.status_code != 200:
             return None
@@ -136,7 +145,7 @@ def check_journal_published(paper, journal_list):
     논문이 저명한 저널에 출판되었는지 확인
     
     Args:
-        paper: arxiv Paper 객체
+        paper: PaperRecord
         journal_list: 저명한 저널 리스트
         
     Returns:
@@ -145,7 +154,7 @@ def check_journal_published(paper, journal_list):
     if not journal_list:
         return False
         
-    journal_ref = getattr(paper, 'journal_ref', None)
+    journal_ref = paper.journal_ref
     if not journal_ref:
         return False
     
@@ -161,7 +170,7 @@ def should_exclude_paper(paper, exclude_keywords):
     논문을 제외해야 하는지 확인
     
     Args:
-        paper: arxiv Paper 객체
+        paper: PaperRecord
         exclude_keywords: 제외 키워드 리스트
         
     Returns:
@@ -170,13 +179,11 @@ def should_exclude_paper(paper, exclude_keywords):
     if not exclude_keywords:
         return False
         
-    title = (paper.title or "").lower()
-    abstract = (paper.summary or "").lower()
-    full_text = title + " " + abstract
+    full_text = paper.text_lower
     
     for keyword in exclude_keywords:
         if keyword.lower() in full_text:
-            logger.debug(f"Excluding paper due to keyword '{keyword}': {paper.title[:50]}...")
+            logger.debug("Excluding paper due to keyword '%s': %.50s...", keyword, paper.title)
             return True
     
     return False
@@ -187,7 +194,7 @@ def check_include_keywords(paper, include_keywords_any):
     포함 키워드가 하나라도 있는지 확인
     
     Args:
-        paper: arxiv Paper 객체
+        paper: PaperRecord
         include_keywords_any: 포함되어야 하는 키워드 리스트 (하나라도 포함되면 통과)
         
     Returns:
@@ -196,9 +203,7 @@ def check_include_keywords(paper, include_keywords_any):
     if not include_keywords_any:
         return True  # 필터가 없으면 모든 논문 통과
         
-    title_lower = (paper.title or "").lower()
-    abstract_lower = (paper.summary or "").lower()
-    full_text = title_lower + " " + abstract_lower
+    full_text = paper.text_lower
     
     for kw in include_keywords_any:
         if kw.lower() in full_text:
@@ -207,14 +212,15 @@ def check_include_keywords(paper, include_keywords_any):
     return False
 
 
-def calculate_paper_quality_score(paper, filter_config, hindex_cache=None, cache_manager=None):
+def calculate_paper_quality_score(paper, filter_config, hindex_cache=None, cache_manager=None, allow_lookup=True):
     """
     논문의 품질 점수를 계산 (0-10점 척도)
     
     Args:
-        paper: arxiv Paper 객체
+        paper: PaperRecord
         filter_config: 필터 설정 딕셔너리
         hindex_cache: h-index 캐시 딕셔너리 (선택사항)
+        allow_lookup: False면 h-index는 캐시에 있는 값만 사용 (백테스트 등 오프라인 평가)
         
     Returns:
         (score, details) 튜플
@@ -227,7 +233,7 @@ def calculate_paper_quality_score(paper, filter_config, hindex_cache=None, cache
         journal_score = filter_config.get('journal_published_score', 3)
         score += journal_score
         details.append(f"저널 출판 (+{journal_score}점)")
-        logger.debug(f"Journal published: {paper.journal_ref}")
+        logger.debug("Journal published: %s", paper.journal_ref)
     
     prestigious_institutions = filter_config.get('prestigious_institutions', [])
     renowned_authors = filter_config.get('renowned_authors', [])
@@ -236,27 +242,27 @@ def calculate_paper_quality_score(paper, filter_config, hindex_cache=None, cache
     prestigious_institution_found = False
     
     # 저자 관련 점수 계산 (주저자 중심)
-    for author in paper.authors:
-        author_name = author.name
-        
-        # 1. 저명한 연구자 체크
-        if not renowned_author_found and check_author_in_list(author_name, renowned_authors):
+    # 1. 저명한 연구자 체크
+    for author_name in paper.authors:
+        if check_author_in_list(author_name, renowned_authors):
             score += 3
             details.append(f"저명한 연구자: {author_name} (+3점)")
-            logger.debug(f"Renowned author found: {author_name}")
+            logger.debug("Renowned author found: %s", author_name)
             renowned_author_found = True
+            break
 
-        # 2. 저명한 기관 체크 (affiliation 속성 확인)
-        if not prestigious_institution_found and hasattr(author, 'affiliation') and author.affiliation:
-            if check_institution_in_list(str(author.affiliation), prestigious_institutions):
-                score += 2
-                details.append(f"저명한 기관: {author.affiliation} (+2점)")
-                logger.debug(f"Prestigious institution found in affiliation: {author.affiliation}")
-                prestigious_institution_found = True
+    # 2. 저명한 기관 체크 (저자 소속)
+    for affiliation in paper.affiliations:
+        if check_institution_in_list(affiliation, prestigious_institutions):
+            score += 2
+            details.append(f"저명한 기관: {affiliation} (+2점)")
+            logger.debug("Prestigious institution found in affiliation: %s", affiliation)
+            prestigious_institution_found = True
+            break
     
     # 3. 저명한 기관 체크 (comment 필드 확인 - fallback)
     if not prestigious_institution_found:
-        comment = getattr(paper, 'comment', '')
+        comment = paper.comment
         if comment and check_institution_in_list(comment, prestigious_institutions):
             score += 2
             details.append("저명한 기관 (comment 필드에서 발견) (+2점)")
@@ -266,14 +272,23 @@ def calculate_paper_quality_score(paper, filter_config, hindex_cache=None, cache
     # h-index 체크 (API 호출이 필요하므로 마지막에)
     min_hindex = filter_config.get('min_author_hindex', 0)
     if min_hindex > 0 and not renowned_author_found and len(paper.authors) > 0:
-        first_author = paper.authors[0].name
-        hindex = get_author_hindex_from_semantic_scholar(first_author, cache=hindex_cache, cache_manager=cache_manager)
+        first_author = paper.authors[0]
+        # h-index 조회는 부가 작업: 마감이 가까우면 캐시에 있는 값만 사용 (조회 2회 분량을 예상 시간으로 봄)
+        before_deadline = get_deadline().allows(PRIORITY_NICE, 2 * estimate_seconds('hindex_lookup'))
+        lookup = allow_lookup and before_deadline
+        hindex = get_author_hindex_from_semantic_scholar(
+            first_author, cache=hindex_cache, cache_manager=cache_manager, allow_lookup=lookup
+        )
+        if hindex is None and not lookup:
+            # 점수가 낮게 나와도 다음 실행에서 다시 평가하도록 표시
+            paper.hindex_deferred = True
+            details.append(f"저자 h-index 조회 보류 ({'오프라인' if before_deadline else '실행 마감'})")
         
         if hindex and hindex >= min_hindex:
             hindex_score = filter_config.get('hindex_score', 3)
             score += hindex_score
             details.append(f"저자 h-index: {hindex} (+{hindex_score}점)")
-            logger.debug(f"Author h-index: {hindex} (min: {min_hindex})")
+            logger.debug("Author h-index: %s (min: %s)", hindex, min_hindex)
     
     return score, details
 
@@ -0,0 +1,89 @@
+"""
+외부 API 호출 속도 제한 유틸리티
+
+여러 카테고리가 동시에 처리되더라도 arXiv, Semantic Scholar, OpenRouter, Crossref에 대한
+요청 간격과 동시 요청 수가 전역적으로 지켜지도록 공유 리미터를 제공합니다.
+"""
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    최소 요청 간격과 최대 동시 요청 수를 함께 제한하는 스레드 안전 리미터
+
+    `with limiter:` 블록으로 사용하면 동시 실행 슬롯을 확보한 뒤
+    직전 요청으로부터 `min_interval`초가 지날 때까지 대기합니다.
+    """
+
+    def __init__(self, name, min_interval=0.0, max_concurrent=1):
+        self.name = name
+        self.min_interval = min_interval
+        self.max_concurrent = max_concurrent
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def configure(self, min_interval=None, max_concurrent=None):
+        """리미터 설정을 변경합니다. 실행 전(요청이 없는 상태)에만 호출해야 합니다."""
+        if min_interval is not None:
+            self.min_interval = float(min_interval)
+        if max_concurrent is not None and max_concurrent != self.max_concurrent:
+            self.max_concurrent = int(max_concurrent)
+            self._semaphore = threading.BoundedSemaphore(self.max_concurrent)
+
+    def wait(self):
+        """다음 요청이 허용될 때까지 대기합니다 (동시 실행 슬롯은 확보하지 않음)."""
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_allowed)
+            self._next_allowed = scheduled + self.min_interval
+        delay = scheduled - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        self.wait()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        return False
+
+
+# 전역 공유 리미터 (모든 카테고리 스레드가 함께 사용)
+ARXIV_LIMITER = RateLimiter('arxiv', min_interval=3.0, max_concurrent=1)
+SEMANTIC_SCHOLAR_LIMITER = RateLimiter('semantic_scholar', min_interval=2.0, max_concurrent=1)
+OPENROUTER_LIMITER = RateLimiter('openrouter', min_interval=0.0, max_concurrent=4)
+ARXIV_PDF_LIMITER = RateLimiter('arxiv_pdf', min_interval=1.0, max_concurrent=2)
+CROSSREF_LIMITER = RateLimiter('crossref', min_interval=0.05, max_concurrent=4)
+
+
+def configure_rate_limits(settings):
+    """
+    config.yml의 `concurrency` 설정으로 전역 리미터를 구성합니다.
+
+    Args:
+        settings: concurrency 설정 딕셔너리 (없으면 기본값 유지)
+    """
+    if not settings:
+        return
+
+    ARXIV_LIMITER.configure(min_interval=settings.get('arxiv_min_interval'))
+    SEMANTIC_SCHOLAR_LIMITER.configure(min_interval=settings.get('semantic_scholar_min_interval'))
+    OPENROUTER_LIMITER.configure(max_concurrent=settings.get('openrouter_max_concurrent'))
+    ARXIV_PDF_LIMITER.configure(min_interval=settings.get('arxiv_pdf_min_interval'),
+                                max_concurrent=settings.get('arxiv_pdf_max_concurrent'))
+    CROSSREF_LIMITER.configure(min_interval=settings.get('crossref_min_interval'),
+                               max_concurrent=settings.get('crossref_max_concurrent'))
+
+    logger.info(
+        f"Rate limits: arXiv {ARXIV_LIMITER.min_interval}s, "
+        f"Semantic Scholar {SEMANTIC_SCHOLAR_LIMITER.min_interval}s, "
+        f"OpenRouter x{OPENROUTER_LIMITER.max_concurrent}, "
+        f"arXiv PDF {ARXIV_PDF_LIMITER.min_interval}s x{ARXIV_PDF_LIMITER.max_concurrent}"
+    )
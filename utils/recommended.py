@@ -0,0 +1,60 @@
+"""
+추천 논문 목록 분석
+
+편집자가 고른 논문 목록(`paths.recommended`, 항목마다 title/doi/link/desc)을 arXiv 논문과 같은 분석
+(요약, 키워드, 분류, 제목 번역)을 거쳐 `paths.recommended_papers`에 저장하기 위한 도우미입니다.
+
+- DOI 메타데이터(저자, 학술지, 발행일, 초록)는 utils.doi_resolver로 조회합니다.
+- 분석한 항목에는 원본 항목과 메타데이터의 지문(`source_hash`)을 남깁니다.
+  지문이 같은 항목은 다시 분석하지 않으므로, 목록에서 바뀐 항목만 LLM을 호출합니다.
+- 초록을 찾지 못한 논문은 편집자 설명(`desc`)을 분석 본문으로 사용합니다.
+"""
+import json
+import hashlib
+
+from utils.doi_resolver import clean_doi
+from utils.paper_record import PaperRecord
+
+DOI_LINK_PREFIX = 'https://doi.org/'
+
+
+def doi_paper_id(doi):
+    """DOI 기반 논문 ID (예: '10.1038/nmat3427' -> '10.1038_nmat3427', 기존 데이터와 같은 형식)"""
+    return doi.replace('/', '_')
+
+
+def entry_doi(entry):
+    """추천 항목의 DOI (doi 필드가 없으면 doi.org 링크에서, 원래 대소문자 유지)"""
+    return clean_doi(entry.get('doi')) or clean_doi(entry.get('link'))
+
+
+def source_hash(entry, metadata):
+    """분석 결과에 영향을 주는 입력(편집자 항목 + 조회한 메타데이터)의 지문"""
+    payload = json.dumps([entry, metadata], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def build_record(entry, metadata):
+    """추천 항목과 DOI 메타데이터로 분석 대상 PaperRecord를 만듭니다."""
+    doi = entry_doi(entry)
+    metadata = metadata or {}
+    return PaperRecord(
+        paper_id=doi_paper_id(doi),
+        title=entry.get('title') or metadata.get('title'),
+        summary=metadata.get('abstract') or entry.get('desc'),
+        authors=metadata.get('authors') or [],
+        journal_ref=metadata.get('venue'),
+        published=metadata.get('date') or None,
+        link=entry.get('link') or DOI_LINK_PREFIX + doi,
+    )
+
+
+def recommended_fields(entry, metadata, fingerprint):
+    """분석 결과에 덧붙일 추천 논문 전용 필드"""
+    metadata = metadata or {}
+    return {
+        'doi': entry_doi(entry),
+        'venue': metadata.get('venue') or None,
+        'desc': entry.get('desc'),
+        'source_hash': fingerprint,
+    }
@@ -0,0 +1,229 @@
+"""
+마감 시각을 고려한 우선순위 작업 스케줄러
+
+일일 실행에 시간 예산(`schedule.deadline_minutes`)을 두고, 남은 시간에 맞춰 가치가 높은 작업부터 실행합니다.
+
+- 우선순위 등급: 필수(선택 논문의 요약/키워드/분류) -> 선택(제목 번역) -> 부가(h-index 조회, 인용 수 갱신)
+- 같은 등급 안에서는 가치(품질 점수)가 높은 작업부터 실행합니다.
+- 작업마다 이번 실행에서 측정한 같은 단계 소요 시간의 이동 평균을 예상 시간으로 보고,
+  마감까지 끝낼 수 없는 작업은 시작하지 않고 보류합니다.
+  부가 작업은 뒤에 올 필수 작업 몫으로 `reserve_minutes`를 남겨 둘 수 있을 때만 실행합니다.
+- 보류된 작업은 다음 실행으로 넘어갑니다 (끝난 작업은 호출자가 바로 저장).
+- 작업 스레드는 검색이 끝나기 전부터 작업을 꺼냅니다. 우선순위는 그 시점에 대기 중인 작업 사이에서만
+  적용되므로, 처음 몇 개 작업은 검색이 찾은 순서(계층 검색의 앞 계층)대로 실행될 수 있습니다.
+  검색 지연을 분석 시간에 겹치기 위한 의도된 동작이며, 마감 판단에는 영향을 주지 않습니다.
+
+마감이 설정되지 않으면 (`deadline_minutes` 없음) 모든 작업을 우선순위 순서대로 실행합니다.
+"""
+import math
+import time
+import heapq
+import logging
+import itertools
+import threading
+import contextvars
+
+from utils.metrics import stage_metrics
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_ESSENTIAL = 0   # 선택된 논문의 요약, 키워드, 분류
+PRIORITY_OPTIONAL = 1    # 제목 번역
+PRIORITY_NICE = 2        # h-index 조회, 인용 수 갱신
+
+_PRIORITY_NAMES = {PRIORITY_ESSENTIAL: 'essential', PRIORITY_OPTIONAL: 'optional', PRIORITY_NICE: 'nice-to-have'}
+
+_settings = {
+    'deadline_minutes': None,   # 실행 시간 예산 (None이면 마감 없음)
+    'reserve_minutes': 10,      # 부가 작업을 시작하려면 남아 있어야 하는 시간
+}
+
+
+def configure_scheduler(settings=None):
+    """config.yml의 `schedule` 섹션을 적용합니다."""
+    settings = settings or {}
+    for key in _settings:
+        if key in settings:
+            _settings[key] = settings[key]
+
+
+class Deadline:
+    """실행 마감 시각 (monotonic 기준)"""
+
+    def __init__(self, budget_seconds=None, reserve_seconds=0.0):
+        self.budget = budget_seconds
+        self.reserve = reserve_seconds
+        self._end = time.monotonic() + budget_seconds if budget_seconds is not None else None
+
+    def remaining(self):
+        """남은 시간 (초), 마감이 없으면 inf"""
+        if self._end is None:
+            return math.inf
+        return max(0.0, self._end - time.monotonic())
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def allows(self, priority, estimate=0.0):
+        """
+        해당 등급의 작업을 지금 시작해도 되는지 판단합니다.
+
+        Args:
+            priority: PRIORITY_* 등급
+            estimate: 작업 예상 소요 시간 (초)
+        """
+        needed = estimate + (self.reserve if priority >= PRIORITY_NICE else 0.0)
+        return self.remaining() > 0 and self.remaining() >= needed
+
+
+_deadline = Deadline()
+
+
+def start_run_deadline(minutes=None):
+    """
+    지금부터 실행 마감을 시작합니다.
+
+    Args:
+        minutes: 시간 예산 (분). None이면 `schedule.deadline_minutes` 설정을 사용
+    """
+    global _deadline
+    minutes = minutes if minutes is not None else _settings['deadline_minutes']
+    reserve = float(_settings['reserve_minutes'] or 0) * 60
+    _deadline = Deadline(minutes * 60 if minutes is not None else None, reserve)
+    if minutes is not None:
+        logger.info(f"Run deadline: {minutes} minutes ({_settings['reserve_minutes']} min reserved ahead of nice-to-have tasks)")
+    return _deadline
+
+
+def get_deadline():
+    """현재 실행 마감 (시작하지 않았으면 마감 없음)"""
+    return _deadline
+
+
+def estimate_seconds(stage):
+    """이번 실행에서 측정한 단계별 소요 시간 이동 평균 (표본이 없으면 0, 스케줄러 잠금 안에서 호출되므로 O(1))"""
+    return stage_metrics.estimate(stage) if stage else 0.0
+
+
+class Task:
+    """스케줄러 작업 하나"""
+
+    __slots__ = ('priority', 'value', 'name', 'fn', 'stage', 'context')
+
+    def __init__(self, priority, value, name, fn, stage=None):
+        self.priority = priority
+        self.value = value
+        self.name = name
+        self.fn = fn
+        self.stage = stage
+        # 제출한 스레드의 로그 컨텍스트(카테고리)를 작업 스레드로 전달
+        self.context = contextvars.copy_context()
+
+
+class DeadlineScheduler:
+    """
+    (등급, 가치) 순서로 작업을 실행하고 마감까지 끝낼 수 없는 작업은 보류하는 스케줄러
+
+    작업 안에서 `submit()`으로 후속 작업(예: 분석이 끝난 논문의 제목 번역)을 추가할 수 있습니다.
+    `start()`로 작업 스레드를 먼저 띄우면 검색 단계가 후보를 찾는 대로 등록한 작업이 바로 실행되며,
+    `join()`은 더 이상 외부에서 등록할 작업이 없음을 알리고 남은 작업이 끝날 때까지 기다립니다.
+    이 경우 힙이 채워지기 전에 꺼낸 작업은 등록 순서대로 실행됩니다 (모듈 설명 참고).
+    """
+
+    def __init__(self, deadline=None):
+        self.deadline = deadline or get_deadline()
+        self.completed = []
+        self.deferred = []
+        self.failed = []
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._running = 0
+        self._closed = False
+        self._workers = []
+
+    def submit(self, priority, value, name, fn, stage=None):
+        """
+        작업을 추가합니다.
+
+        Args:
+            priority: PRIORITY_* 등급 (작을수록 먼저)
+            value: 같은 등급 안에서의 가치 (클수록 먼저, 예: 품질 점수)
+            name: 로그용 이름
+            fn: 인자 없는 호출 가능 객체
+            stage: 소요 시간 추정에 쓸 stage_metrics 단계 이름
+        """
+        task = Task(priority, value or 0, name, fn, stage)
+        with self._cond:
+            heapq.heappush(self._heap, (priority, -task.value, next(self._seq), task))
+            self._cond.notify()
+        return task
+
+    def _next_task(self):
+        """실행할 작업을 꺼냅니다. 시작할 수 없는 작업은 보류 목록으로 옮깁니다. 끝났으면 None."""
+        with self._cond:
+            while True:
+                while self._heap:
+                    task = heapq.heappop(self._heap)[-1]
+                    if self.deadline.allows(task.priority, estimate_seconds(task.stage)):
+                        self._running += 1
+                        return task
+                    self.deferred.append(task)
+                if self._closed and not self._running:
+                    return None
+                # 실행 중인 작업이나 아직 검색 중인 단계가 작업을 추가할 수 있으므로 대기
+                self._cond.wait()
+
+    def _worker(self):
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            try:
+                task.context.run(task.fn)
+                self.completed.append(task)
+            except Exception as e:
+                logger.error(f"Task '{task.name}' failed: {e}", exc_info=True)
+                self.failed.append(task)
+            finally:
+                with self._cond:
+                    self._running -= 1
+                    self._cond.notify_all()
+
+    def start(self, max_workers=1):
+        """작업 스레드를 띄웁니다. 이후 등록되는 작업은 바로 실행됩니다."""
+        self._workers = [
+            threading.Thread(target=self._worker, name=f'scheduler_{i}', daemon=True)
+            for i in range(max(1, max_workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def join(self):
+        """
+        외부 작업 등록을 마치고, 남은 작업을 모두 실행(또는 보류)할 때까지 블록합니다.
+
+        Returns:
+            보류된 작업 목록
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join()
+
+        if self.deferred:
+            counts = {}
+            for task in self.deferred:
+                label = _PRIORITY_NAMES.get(task.priority, task.priority)
+                counts[label] = counts.get(label, 0) + 1
+            logger.warning(
+                f"Deadline reached: deferred {len(self.deferred)} tasks to the next run ("
+                + ", ".join(f"{label} {n}" for label, n in counts.items()) + ")"
+            )
+        return self.deferred
+
+    def run(self, max_workers=1):
+        """등록된 작업을 모두 실행(또는 보류)할 때까지 블록합니다 (`start()` + `join()`)."""
+        self.start(max_workers)
+        return self.join()
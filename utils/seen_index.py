@@ -0,0 +1,213 @@
+"""
+검색 후보 판정 기록 (seen index)
+
+키워드 제외, 포함 키워드 불일치, 최소 점수 미달로 탈락한 후보를 기록하여
+다음 실행에서 같은 논문을 다시 점수화(h-index 조회 포함)하지 않도록 합니다.
+
+- 키는 버전을 뗀 arXiv ID이며, 기록된 버전보다 새 버전이 올라오면 다시 평가합니다.
+- 필터 설정(제외/포함 키워드, filter_config)의 지문이 바뀌면 해당 카테고리의 기록은 폐기됩니다.
+- 정확한 기록은 SQLite 파일에 두고, 메모리에는 Bloom 필터만 유지합니다.
+  대부분의 후보는 처음 보는 논문이므로 Bloom 필터에서 바로 걸러지고,
+  양성일 때만 디스크의 기록을 확인합니다.
+"""
+import os
+import re
+import json
+import math
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+from utils.cache import CACHE_DIR, ensure_cache_dir
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = os.path.join(CACHE_DIR, 'seen_index.sqlite3')
+DEFAULT_TTL_DAYS = 30           # 이보다 오래된 판정은 다시 평가 (h-index 변동 등)
+BLOOM_ERROR_RATE = 0.01
+
+# 탈락 사유
+DECISION_EXCLUDED = 'excluded'          # exclude_keywords에 걸림
+DECISION_NOT_INCLUDED = 'not_included'  # include_keywords_any에 해당 없음
+DECISION_LOW_SCORE = 'low_score'        # 품질 점수가 min_score 미만
+
+_settings = {'enabled': True, 'ttl_days': DEFAULT_TTL_DAYS, 'path': INDEX_FILE}
+
+_VERSION_RE = re.compile(r'^(.+?)(?:v(\d+))?$')
+
+# 여러 카테고리 스레드가 같은 DB 파일에 쓰므로 쓰기를 직렬화
+_write_lock = threading.Lock()
+
+
+def configure_seen_index(settings=None):
+    """config.yml의 `seen_index` 섹션을 적용합니다."""
+    settings = settings or {}
+    for key in ('enabled', 'ttl_days', 'path'):
+        if key in settings:
+            _settings[key] = settings[key]
+
+
+def split_arxiv_id(paper_id):
+    """
+    arXiv ID를 (버전 없는 ID, 버전)으로 나눕니다.
+
+    Examples:
+        '2508.00236v2' -> ('2508.00236', 2)
+        'cond-mat/0102536' -> ('cond-mat/0102536', 0)
+    """
+    match = _VERSION_RE.match(str(paper_id or '').strip())
+    if not match:
+        return '', 0
+    return match.group(1), int(match.group(2) or 0)
+
+
+def base_arxiv_id(paper_id):
+    """버전 접미사를 뗀 arXiv ID"""
+    return split_arxiv_id(paper_id)[0]
+
+
+def filter_fingerprint(settings, filter_config=None):
+    """판정에 영향을 주는 카테고리 설정의 지문"""
+    relevant = {
+        'exclude_keywords': settings.get('exclude_keywords') or [],
+        'include_keywords_any': settings.get('include_keywords_any') or [],
+        'filter_config': filter_config or {},
+    }
+    payload = json.dumps(relevant, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 Bloom 필터 (이중 해싱)"""
+
+    def __init__(self, capacity, error_rate=BLOOM_ERROR_RATE):
+        capacity = max(int(capacity), 1)
+        self.size = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SeenIndex:
+    """
+    카테고리 하나의 후보 판정 기록
+
+    `with SeenIndex(...) as seen:` 블록에서 사용하면 종료 시 기록이 커밋됩니다.
+    """
+
+    def __init__(self, category, fingerprint, path=None, ttl_days=None):
+        self.category = category
+        self.fingerprint = fingerprint
+        self.path = path or _settings['path']
+        self.ttl_days = _settings['ttl_days'] if ttl_days is None else ttl_days
+        self.skipped = 0
+        self.recorded = 0
+        self._pending = []
+
+        if os.path.dirname(self.path) == CACHE_DIR:
+            ensure_cache_dir()
+        else:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with _write_lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen ("
+                " category TEXT NOT NULL, base_id TEXT NOT NULL, version INTEGER NOT NULL,"
+                " decision TEXT NOT NULL, fingerprint TEXT NOT NULL, decided TEXT NOT NULL,"
+                " PRIMARY KEY (category, base_id)) WITHOUT ROWID"
+            )
+            # 설정이 바뀌었거나 오래된 판정은 폐기
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=self.ttl_days)).strftime('%Y-%m-%d')
+            purged = self._conn.execute(
+                "DELETE FROM seen WHERE category = ? AND (fingerprint != ? OR decided < ?)",
+                (category, fingerprint, cutoff),
+            ).rowcount
+
+        count = self._conn.execute("SELECT COUNT(*) FROM seen WHERE category = ?", (category,)).fetchone()[0]
+        # 이번 실행에서 추가될 기록까지 감안해 여유 있게 잡음
+        self._bloom = BloomFilter(count * 2 + 1000)
+        for (base_id,) in self._conn.execute("SELECT base_id FROM seen WHERE category = ?", (category,)):
+            self._bloom.add(base_id)
+
+        logger.info(f"[{category}] Seen index: {count} rejected candidates remembered"
+                    + (f" ({purged} stale entries dropped)" if purged else ""))
+
+    def should_skip(self, paper_id):
+        """이미 같은 설정으로 탈락시킨 버전 이하이면 True"""
+        base_id, version = split_arxiv_id(paper_id)
+        if not base_id or base_id not in self._bloom:
+            return False
+        row = self._conn.execute(
+            "SELECT version FROM seen WHERE category = ? AND base_id = ?", (self.category, base_id)
+        ).fetchone()
+        if row is None or version > row[0]:
+            return False
+        self.skipped += 1
+        return True
+
+    def record(self, paper_id, decision):
+        """탈락 판정을 기록합니다 (close/commit 시 저장)."""
+        base_id, version = split_arxiv_id(paper_id)
+        if not base_id:
+            return
+        self._bloom.add(base_id)
+        self._pending.append((self.category, base_id, version, decision, self.fingerprint,
+                              datetime.now(timezone.utc).strftime('%Y-%m-%d')))
+        self.recorded += 1
+
+    def commit(self):
+        if not self._pending:
+            return
+        with _write_lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen (category, base_id, version, decision, fingerprint, decided)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending = []
+
+    def close(self):
+        try:
+            self.commit()
+        finally:
+            self._conn.close()
+        logger.info(f"[{self.category}] Seen index: skipped {self.skipped} known rejects, "
+                    f"recorded {self.recorded} new rejects")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def open_seen_index(settings, filter_config=None):
+    """
+    카테고리 설정으로 판정 기록을 엽니다.
+
+    Returns:
+        SeenIndex, 비활성화되었거나 열 수 없으면 None
+    """
+    if not _settings.get('enabled', True):
+        return None
+    category = settings.get('name', 'Unknown')
+    try:
+        return SeenIndex(category, filter_fingerprint(settings, filter_config))
+    except sqlite3.Error as e:
+        logger.warning(f"[{category}] Could not open seen index: {e}")
+        return None
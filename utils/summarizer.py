@@ -1,69 +1,157 @@
 """
 논문 요약, 번역, 분석 유틸리티
+
+작업(요약/번역/키워드/분류)마다 다른 모델을 쓸 수 있습니다.
+출력이 짧은 작업은 config.yml의 `models` 설정으로 더 가볍고 빠른 모델에 보냅니다.
 """
 import os
+import json
 import logging
-import requests
 import re
+import threading
+import time
+from utils import openrouter_client
+from utils.local_summarizer import summarize_locally
+from utils.metrics import stage_timer
 
 logger = logging.getLogger(__name__)
 
+# 작업 이름 (config.yml `models`의 키)
+TASK_SUMMARY = 'summary'
+TASK_TRANSLATION = 'translation'
+TASK_KEYWORDS = 'keywords'
+TASK_CLASSIFICATION = 'classification'
+TASKS = (TASK_SUMMARY, TASK_TRANSLATION, TASK_KEYWORDS, TASK_CLASSIFICATION)
 
-def _call_openrouter_api(prompt, model_name, api_key, timeout=60):
-    """OpenRouter API 호출을 위한 내부 헬퍼 함수"""
-    if not api_key:
-        raise ValueError("OpenRouter API key is not provided.")
+LATENCY_REPORT_FILE = os.path.join('.cache', 'task_latency.json')
 
-    try:
-        url = "https://openrouter.ai/api/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/stagnes307/stagnes307.github.io",
-            "X-Title": "Battery Paper Analyzer"
-        }
-        payload = {
-            "model": model_name,
-            "messages": [{"role": "user", "content": prompt}]
+# 요약을 실제로 만든 경로 (논문 데이터의 `summary_source`)
+SUMMARY_SOURCE_LLM = 'llm'
+SUMMARY_SOURCE_FULLTEXT = 'llm+fulltext'
+SUMMARY_SOURCE_LOCAL = 'local'
+
+# 분류 작업이 고를 수 있는 논문 카테고리
+PAPER_CATEGORIES = ("소재 기술", "공정 기술", "성능 평가", "이론/모델링")
+
+# 전역 작업별 모델 (configure_models로 설정)
+_task_models = {}
+_models_lock = threading.Lock()
+
+# (작업, 모델)별 응답 시간 - 라우팅 조정용
+task_latency = openrouter_client.LatencyTracker()
+
+# 작업별 출력 토큰 상한 (응답 꼬리 지연을 줄이기 위함)
+SUMMARY_MAX_TOKENS = 1024
+TITLE_MAX_TOKENS = 200
+KEYWORDS_MAX_TOKENS = 120
+CATEGORY_MAX_TOKENS = 20
+
+
+def configure_models(models):
+    """
+    config.yml의 `models` 설정(작업별 모델)을 적용합니다.
+
+    Args:
+        models: {작업 이름: 모델 이름} 딕셔너리 (없으면 모든 작업이 기본 모델 사용)
+    """
+    with _models_lock:
+        _task_models.clear()
+        _task_models.update({task: model for task, model in (models or {}).items() if model})
+    if _task_models:
+        logger.info(f"Task model routing: {_task_models}")
+
+
+def resolve_model(task, default_model, category_models=None):
+    """
+    작업에 사용할 모델을 결정합니다.
+
+    우선순위: 카테고리별 `models` > 전역 `models` > 기본 모델(`gemini_model`)
+
+    Args:
+        task: 작업 이름 (TASKS 중 하나)
+        default_model: 작업별 설정이 없을 때 사용할 모델
+        category_models: 카테고리 설정의 `models` 딕셔너리
+
+    Returns:
+        모델 이름
+    """
+    if category_models and category_models.get(task):
+        return category_models[task]
+    with _models_lock:
+        return _task_models.get(task) or default_model
+
+
+def latency_report():
+    """(작업, 모델)별 호출 수와 응답 시간 백분위수를 반환합니다."""
+    report = {}
+    for key in sorted(task_latency.snapshot()):
+        report[key] = {
+            'count': task_latency.count(key),
+            'p50': round(task_latency.percentile(key, 50), 2),
+            'p95': round(task_latency.percentile(key, 95), 2),
         }
-        
-        response = requests.post(url, headers=headers, json=payload, timeout=timeout)
-        
-        if response.status_code != 200:
-            error_detail = response.text
-            logger.error(f"OpenRouter API error ({response.status_code}): {error_detail}")
-            response.raise_for_status()
-        
-        result = response.json()
-        return result['choices'][0]['message']['content'].strip()
-
-    except requests.exceptions.RequestException as e:
-        if hasattr(e, 'response') and e.response is not None:
-            try:
-                error_detail = e.response.text
-                logger.error(f"API Request Error: {e}\nResponse: {error_detail}")
-            except:
-                logger.error(f"API Request Error: {e}", exc_info=True)
-        else:
-            logger.error(f"API Request Error: {e}", exc_info=True)
-        raise  # Re-raise the exception to be handled by the caller
-    except (KeyError, IndexError) as e:
-        logger.error(f"Error parsing API response: {e}", exc_info=True)
-        raise
-
-
-def summarize_with_gemini(abstract, model_name, api_key=None):
-    """Gemini를 사용하여 논문 초록을 HTML 형식으로 요약합니다."""
+    return report
+
+
+def save_latency_report(path=LATENCY_REPORT_FILE):
+    """응답 시간 보고서를 로그에 남기고 JSON 파일로 저장합니다."""
+    report = latency_report()
+    if not report:
+        return None
+    for key, stats in report.items():
+        logger.info(f"  {key}: {stats['count']} calls, p50 {stats['p50']}s, p95 {stats['p95']}s")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        logger.warning(f"Error saving latency report: {e}")
+        return None
+    return path
+
+
+def _call_openrouter_api(prompt, model_name, api_key, timeout=60, max_tokens=None, task=None):
+    """OpenRouter API 호출을 위한 내부 헬퍼 함수 (적응형 타임아웃, 헤지, 대체 모델 포함)"""
+    start = time.monotonic()
+    with stage_timer(f"llm.{task or 'other'}"):
+        result = openrouter_client.complete(prompt, model_name, api_key, timeout=timeout, max_tokens=max_tokens)
+    if task:
+        task_latency.record(f"{task}:{model_name}", time.monotonic() - start)
+    return result
+
+
+def summarize_with_gemini(abstract, model_name, api_key=None, excerpt=None):
+    """
+    Gemini를 사용하여 논문 초록을 HTML 형식으로 요약합니다.
+
+    excerpt가 주어지면 본문 발췌(실험 조건, 결과, 결론)를 함께 넘겨 요약에 반영합니다.
+    """
+    return summarize_with_source(abstract, model_name, api_key, excerpt=excerpt)[0]
+
+
+def summarize_with_source(abstract, model_name, api_key=None, excerpt=None):
+    """
+    summarize_with_gemini와 같지만, 요약을 실제로 만든 경로를 함께 반환합니다.
+
+    Returns:
+        (HTML 요약, SUMMARY_SOURCE_*) - LLM 호출이 실패해 로컬 요약으로 대체되면 SUMMARY_SOURCE_LOCAL
+    """
     if not abstract:
-        return "<p>요약할 초록 내용이 없습니다.</p>"
+        return "<p>요약할 초록 내용이 없습니다.</p>", SUMMARY_SOURCE_LOCAL
     
     api_key = api_key or os.environ.get('OPENROUTER_API_KEY')
     if not api_key:
-        logger.warning("API key not available, using fallback summarization")
-        snippet = (abstract or "").strip().replace("\n", " ")[:400]
-        return f"<ul>\n  <li><strong>요약(로컬):</strong> {snippet}...</li>\n</ul>"
+        logger.warning("API key not available, using local extractive summarization")
+        return summarize_locally(abstract), SUMMARY_SOURCE_LOCAL
 
-    logger.info(f"Summarizing with OpenRouter (Model: {model_name})...")
+    logger.info("Summarizing with OpenRouter (Model: %s)...", model_name)
+    excerpt_block = ""
+    if excerpt:
+        excerpt_block = f"""
+[본문 발췌]
+연구 방법에는 실험 조건(조성, 합성/측정 조건)을, 주요 결과에는 정량적 수치를 반영해 주세요.
+{excerpt}
+"""
     prompt = f"""당신은 2차전지 및 재료공학 분야의 전문가입니다.
 다음 논문의 초록(abstract)을 받아서,
 핵심 내용을 [연구 배경], [연구 방법], [주요 결과]로 구분하여
@@ -78,7 +166,7 @@ def summarize_with_gemini(abstract, model_name, api_key=None):
 
 [초록 내용]
 {abstract}
-
+{excerpt_block}
 [HTML 요약]
 <ul>
   <li><strong>연구 배경:</strong> ...</li>
@@ -87,9 +175,13 @@ def summarize_with_gemini(abstract, model_name, api_key=None):
 </ul>"""
     
     try:
-        return _call_openrouter_api(prompt, model_name, api_key)
+        summary = _call_openrouter_api(prompt, model_name, api_key, max_tokens=SUMMARY_MAX_TOKENS,
+                                       task=TASK_SUMMARY)
+        return summary, SUMMARY_SOURCE_FULLTEXT if excerpt else SUMMARY_SOURCE_LLM
     except Exception as e:
-        return f"<p>Gemini 요약에 실패했습니다: {e}</p>"
+        # 모든 모델이 실패하면 오류 문자열 대신 로컬 추출 요약을 사용
+        logger.warning(f"LLM summarization failed ({e}); using local extractive summarization")
+        return summarize_locally(abstract), SUMMARY_SOURCE_LOCAL
 
 
 def translate_title(title, model_name, api_key=None):
@@ -102,7 +194,7 @@ def translate_title(title, model_name, api_key=None):
         logger.warning("API key not available, skipping title translation")
         return title
     
-    logger.info(f"Translating title with OpenRouter (Model: {model_name})...")
+    logger.info("Translating title with OpenRouter (Model: %s)...", model_name)
     prompt = f"""다음 논문 제목을 자연스러운 한국어로 번역해주세요. 
 학술 용어는 정확하게 번역하고, 전문 용어는 그대로 유지하세요.
 번역된 제목만 출력하고 다른 설명은 절대 하지 마세요.
@@ -110,7 +202,8 @@ def translate_title(title, model_name, api_key=None):
 제목: {title}"""
     
     try:
-        translated_title = _call_openrouter_api(prompt, model_name, api_key, timeout=30)
+        translated_title = _call_openrouter_api(prompt, model_name, api_key, timeout=30,
+                                                max_tokens=TITLE_MAX_TOKENS, task=TASK_TRANSLATION)
         return translated_title.strip('"\'')
     except Exception as e:
         logger.warning(f"Error translating title: {e}, using original title")
@@ -127,7 +220,7 @@ def extract_keywords_with_gemini(abstract, model_name, api_key=None):
         logger.warning("API key not available, skipping keyword extraction")
         return []
 
-    logger.info(f"Extracting keywords with OpenRouter (Model: {model_name})...")
+    logger.info("Extracting keywords with OpenRouter (Model: %s)...", model_name)
     prompt = f"""다음 논문 초록을 읽고, 가장 중요한 핵심 키워드 5개를 쉼표(,)로 구분하여 나열해주세요.
 다른 설명 없이 키워드만 나열해야 합니다.
 
@@ -138,7 +231,8 @@ def extract_keywords_with_gemini(abstract, model_name, api_key=None):
 예시: High-nickel cathode, Solid electrolyte, Interfacial stability, Dendrite suppression, All-solid-state batteries"""
 
     try:
-        keywords_str = _call_openrouter_api(prompt, model_name, api_key, timeout=30)
+        keywords_str = _call_openrouter_api(prompt, model_name, api_key, timeout=30,
+                                            max_tokens=KEYWORDS_MAX_TOKENS, task=TASK_KEYWORDS)
         # AI가 반환할 수 있는 다양한 형식(예: "키워드: a, b, c")에 대응하기 위해 정규식 사용
         keywords_str = re.sub(r".*:\s*", "", keywords_str) # "키워드: " 같은 접두어 제거
         keywords = [kw.strip() for kw in keywords_str.split(',') if kw.strip()]
@@ -158,8 +252,8 @@ def classify_category_with_gemini(abstract, model_name, api_key=None):
         logger.warning("API key not available, skipping category classification")
         return "분류 안됨"
 
-    logger.info(f"Classifying category with OpenRouter (Model: {model_name})...")
-    categories = ["소재 기술", "공정 기술", "성능 평가", "이론/모델링"]
+    logger.info("Classifying category with OpenRouter (Model: %s)...", model_name)
+    categories = PAPER_CATEGORIES
     
     prompt = f"""다음 논문 초록은 2차전지 기술에 관한 것입니다.
 아래 네 가지 카테고리 중 이 논문이 **가장** 핵심적으로 다루는 주제 하나를 선택해주세요.
@@ -177,7 +271,8 @@ def classify_category_with_gemini(abstract, model_name, api_key=None):
 [카테고리]"""
 
     try:
-        category = _call_openrouter_api(prompt, model_name, api_key, timeout=30)
+        category = _call_openrouter_api(prompt, model_name, api_key, timeout=30,
+                                        max_tokens=CATEGORY_MAX_TOKENS, task=TASK_CLASSIFICATION)
         # AI가 "카테고리: 소재 기술" 처럼 응답할 경우를 대비
         for cat in categories:
             if cat in category:
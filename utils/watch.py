@@ -0,0 +1,155 @@
+"""
+arXiv 발표 시각에 맞춘 상주(watch) 모드 스케줄러
+
+arXiv는 일~목요일 20:00 (미국 동부 시간)에 새 제출 논문을 발표합니다.
+watch 모드는 프로세스를 계속 띄워 둔 채 발표 시각 전후의 폴링 창에서만
+짧은 간격으로 검색하고, 창 밖에서는 다음 발표 시각까지 대기합니다.
+
+실제 수집/분석 작업은 호출자가 콜백으로 넘기며, 이 모듈은 시각 계산과 반복만 담당합니다.
+"""
+import os
+import json
+import signal
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from utils.cache import CACHE_DIR, ensure_cache_dir
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = os.path.join(CACHE_DIR, 'watch_state.json')
+
+_WEEKDAYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+DEFAULT_WATCH_SETTINGS = {
+    'timezone': 'America/New_York',
+    'announce_time': '20:00',
+    'announce_days': ['sun', 'mon', 'tue', 'wed', 'thu'],
+    'lead_minutes': 5,        # 발표 전 폴링 시작
+    'window_minutes': 90,     # 발표 후 폴링 지속 시간 (API 반영 지연 감안)
+    'poll_minutes': 10,       # 폴링 창 안에서의 검색 간격
+}
+
+
+class AnnouncementSchedule:
+    """발표 시각과 폴링 창 계산"""
+
+    def __init__(self, settings=None):
+        settings = dict(DEFAULT_WATCH_SETTINGS, **(settings or {}))
+        self.tz = ZoneInfo(settings['timezone'])
+        hour, minute = (int(part) for part in str(settings['announce_time']).split(':'))
+        self.announce_hour, self.announce_minute = hour, minute
+        self.announce_days = {_WEEKDAYS.index(day.lower()[:3]) for day in settings['announce_days']}
+        self.lead = timedelta(minutes=settings['lead_minutes'])
+        self.window = timedelta(minutes=settings['window_minutes'])
+        self.poll_interval = timedelta(minutes=settings['poll_minutes'])
+
+    def next_window(self, now=None):
+        """
+        현재 진행 중이거나 다음에 올 폴링 창을 반환합니다.
+
+        Returns:
+            (발표 시각, 창 시작, 창 끝) - 모두 timezone-aware datetime
+        """
+        now = (now or datetime.now(timezone.utc)).astimezone(self.tz)
+        for offset in range(8):
+            day = now.date() + timedelta(days=offset)
+            if day.weekday() not in self.announce_days:
+                continue
+            announce = datetime(day.year, day.month, day.day, self.announce_hour, self.announce_minute, tzinfo=self.tz)
+            if now < announce + self.window:
+                return announce, announce - self.lead, announce + self.window
+        raise ValueError("watch.announce_days must contain at least one weekday.")
+
+
+def load_state():
+    try:
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state):
+    ensure_cache_dir()
+    tmp_file = STATE_FILE + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, STATE_FILE)
+
+
+def install_stop_handlers(stop_event):
+    """SIGINT/SIGTERM을 받으면 현재 작업을 마친 뒤 종료하도록 이벤트를 설정합니다."""
+    def handler(signum, frame):
+        logger.info(f"Received signal {signum}. Stopping after the current poll...")
+        stop_event.set()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, handler)
+
+
+def run_watch(schedule, start_cycle, poll, end_cycle=None, stop_event=None, immediate=False):
+    """
+    발표 창마다 `start_cycle` -> `poll` 반복 -> `end_cycle`을 실행합니다.
+
+    Args:
+        schedule: AnnouncementSchedule
+        start_cycle: 창이 열릴 때 발표 시각(str, 'YYYY-MM-DD HH:MM')을 받아 호출 (아카이브 이동 등)
+        poll: 창 안에서 반복 호출. 이번 발표분을 모두 채웠으면 True를 반환
+        end_cycle: 창이 끝날 때 호출 (선택)
+        stop_event: 설정되면 루프 종료
+        immediate: True이면 창 밖에서도 바로 한 번 폴링한 뒤 다음 창을 기다림.
+            창 밖의 폴링은 발표 주기가 아니므로 `start_cycle`/`end_cycle`(아카이브 이동 등)을 호출하지 않음
+    """
+    stop_event = stop_event or threading.Event()
+
+    while not stop_event.is_set():
+        announce, start, end = schedule.next_window()
+        now = datetime.now(schedule.tz)
+        if now < start and immediate:
+            # 창 밖에서 즉시 시작: 현재 today 목록의 부족분만 채우고 실제 발표 창은 그대로 기다림
+            logger.info("Polling once before the next announcement window (today's papers are kept).")
+            try:
+                poll()
+            except Exception as e:
+                logger.error(f"Poll failed: {e}", exc_info=True)
+            immediate = False
+            continue
+        if now < start:
+            logger.info(f"Next arXiv announcement at {announce:%Y-%m-%d %H:%M %Z}; "
+                        f"sleeping until {start:%H:%M %Z} ({(start - now).total_seconds() / 3600:.1f}h).")
+            if stop_event.wait((start - now).total_seconds()):
+                break
+        immediate = False
+
+        cycle = f"{announce:%Y-%m-%d %H:%M}"
+        logger.info(f"=== Watch cycle for announcement {cycle} (until {end:%H:%M %Z}) ===")
+        start_cycle(cycle)
+
+        while not stop_event.is_set():
+            try:
+                done = poll()
+            except Exception as e:
+                # 일시적인 오류로 상주 프로세스가 죽지 않도록 다음 폴링에서 재시도
+                logger.error(f"Poll failed: {e}", exc_info=True)
+                done = False
+            if done:
+                logger.info("All categories filled for this announcement.")
+                break
+            remaining = (end - datetime.now(schedule.tz)).total_seconds()
+            if remaining <= 0:
+                logger.info("Polling window closed.")
+                break
+            stop_event.wait(min(schedule.poll_interval.total_seconds(), remaining))
+
+        if end_cycle:
+            end_cycle(cycle)
+
+        # 이번 창이 끝날 때까지 기다려 같은 창을 다시 시작하지 않도록 함
+        remaining = (end - datetime.now(schedule.tz)).total_seconds()
+        if remaining > 0 and stop_event.wait(remaining):
+            break
+
+    logger.info("Watch mode stopped.")
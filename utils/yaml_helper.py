@@ -37,6 +37,9 @@ def load_yaml(filename):
 def save_yaml(data, filename):
     """
     데이터를 YAML 파일로 저장합니다.
+
+    임시 파일에 쓴 뒤 교체하므로, 저장 중에 중단되어도 기존 파일(예: 아카이브 이동 없이 다시 쓰는 today 파일)이
+    잘린 채로 남지 않습니다.
     
     Args:
         data: 저장할 데이터
@@ -49,8 +52,10 @@ def save_yaml(data, filename):
         # 디렉토리가 없으면 생성
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        with open(filename, 'w', encoding='utf-8') as f:
+        tmp_file = filename + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
             yaml.dump(data, f, allow_unicode=True, sort_keys=False, default_flow_style=False)
+        os.replace(tmp_file, filename)
         logger.info(f"Successfully saved YAML file: {filename}")
         return True
     except Exception as e: